@@ -0,0 +1,162 @@
+"""
+공용 브라우저 풀 - Playwright 기반
+
+프로세스 전체에서 Playwright와 Chromium을 한 번만 띄우고,
+각 크롤러에는 컨텍스트/페이지만 빌려준다.
+"""
+import asyncio
+import logging
+from typing import Dict, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+from config import BROWSER_POOL_CONFIG, BROWSER_PROFILES
+
+
+class BrowserPool:
+    """프로필별 Chromium 브라우저를 재사용하는 공용 풀"""
+
+    def __init__(self, max_pages_per_browser: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_pages_per_browser = max_pages_per_browser or BROWSER_POOL_CONFIG['max_pages_per_browser']
+        self.playwright = None
+        self._browsers: Dict[str, Browser] = {}
+        self._page_counts: Dict[Browser, int] = {}
+        self._context_owners: Dict[BrowserContext, Browser] = {}
+        self._retiring = set()
+        self._lock = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """현재 이벤트 루프에서 사용할 잠금 반환"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def start(self) -> bool:
+        """Playwright 시작"""
+        try:
+            if not self.playwright:
+                self.playwright = await async_playwright().start()
+                self.logger.info("공용 브라우저 풀 시작")
+            return True
+        except Exception as e:
+            self.logger.error(f"공용 브라우저 풀 시작 실패: {e}")
+            return False
+
+    def _is_healthy(self, browser: Browser) -> bool:
+        """브라우저 상태 확인"""
+        try:
+            return browser.is_connected()
+        except Exception:
+            return False
+
+    async def _launch(self, profile: str) -> Browser:
+        """프로필 설정으로 브라우저 실행"""
+        options = BROWSER_PROFILES[profile]
+        browser = await self.playwright.chromium.launch(
+            headless=options.get('headless', True),
+            args=options.get('args', [])
+        )
+        browser.on('disconnected', lambda _: self.logger.warning(f"브라우저 연결 끊김 ({profile})"))
+        self._page_counts[browser] = 0
+        self.logger.info(f"브라우저 실행 완료 ({profile})")
+        return browser
+
+    async def _get_browser(self, profile: str) -> Browser:
+        """프로필 브라우저 반환 (비정상이거나 재활용 한도를 넘으면 새로 실행)"""
+        if not self.playwright and not await self.start():
+            raise RuntimeError("Playwright 시작 실패")
+
+        browser = self._browsers.get(profile)
+
+        if browser is not None and not self._is_healthy(browser):
+            self.logger.warning(f"비정상 브라우저 감지, 재실행 ({profile})")
+            await self._discard(browser)
+            browser = None
+
+        if browser is not None and self._page_counts.get(browser, 0) >= self.max_pages_per_browser:
+            self.logger.info(f"브라우저 재활용 한도 도달, 교체 ({profile}, {self._page_counts[browser]}페이지)")
+            del self._browsers[profile]
+            self._retiring.add(browser)
+            await self._close_if_idle(browser)
+            browser = None
+
+        if browser is None:
+            browser = await self._launch(profile)
+            self._browsers[profile] = browser
+
+        return browser
+
+    async def new_context(self, profile: str = 'default') -> BrowserContext:
+        """프로필 설정이 적용된 새 컨텍스트 생성"""
+        options = BROWSER_PROFILES[profile]
+
+        async with self._get_lock():
+            browser = await self._get_browser(profile)
+            context = await browser.new_context(**options.get('context', {}))
+            self._context_owners[context] = browser
+
+        if options.get('init_script'):
+            await context.add_init_script(options['init_script'])
+        context.on('page', lambda _: self._count_page(browser))
+        return context
+
+    async def warm_up(self, profile: str = 'default') -> bool:
+        """프로필 브라우저를 미리 실행 (다른 단계와 겹쳐서 기동 시간을 숨김)"""
+        try:
+            async with self._get_lock():
+                await self._get_browser(profile)
+            return True
+        except Exception as e:
+            self.logger.warning(f"브라우저 사전 실행 실패 ({profile}): {e}")
+            return False
+
+    def _count_page(self, browser: Browser) -> None:
+        """브라우저별 생성 페이지 수 집계"""
+        self._page_counts[browser] = self._page_counts.get(browser, 0) + 1
+
+    async def release_context(self, context: Optional[BrowserContext]) -> None:
+        """컨텍스트 반납 (브라우저는 유지)"""
+        if context is None:
+            return
+
+        browser = self._context_owners.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.debug(f"컨텍스트 종료 실패: {e}")
+
+        if browser is not None and browser in self._retiring:
+            await self._close_if_idle(browser)
+
+    async def _close_if_idle(self, browser: Browser) -> None:
+        """교체 대상 브라우저에 남은 컨텍스트가 없으면 종료"""
+        if any(owner is browser for owner in self._context_owners.values()):
+            return
+        await self._discard(browser)
+
+    async def _discard(self, browser: Browser) -> None:
+        """브라우저를 풀에서 제거하고 종료"""
+        self._retiring.discard(browser)
+        self._page_counts.pop(browser, None)
+        for profile, current in list(self._browsers.items()):
+            if current is browser:
+                del self._browsers[profile]
+        for context, owner in list(self._context_owners.items()):
+            if owner is browser:
+                del self._context_owners[context]
+        try:
+            await browser.close()
+        except Exception as e:
+            self.logger.debug(f"브라우저 종료 실패: {e}")
+
+    async def close(self) -> None:
+        """풀 전체 종료"""
+        try:
+            for browser in list(self._page_counts):
+                await self._discard(browser)
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+            self.logger.info("공용 브라우저 풀 종료 완료")
+        except Exception as e:
+            self.logger.error(f"공용 브라우저 풀 종료 실패: {e}")
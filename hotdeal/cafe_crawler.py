@@ -4,117 +4,148 @@
 import logging
 import time
 import asyncio
-from typing import List, Dict, Optional, Tuple
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from bs4 import BeautifulSoup
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Callable, Awaitable, Union, Iterable
+from playwright.async_api import Browser, BrowserContext, Page, Frame
 import pandas as pd
 
-from config import CAFE_CONFIG, CRAWLING_CONFIG, REGEX_PATTERNS
+from config import CAFE_CONFIG, PAGE_WAIT_CONFIG
 from utils import (
     extract_price_from_title, clean_product_title, get_current_timestamp,
-    create_dataframe_row, safe_sleep, retry_on_failure, extract_urls_from_text
+    create_dataframe_row, safe_sleep, retry_on_failure, extract_urls_from_text,
+    run_async
 )
+from browser_pool import BrowserPool
+from resource_blocker import ResourceBlocker
+from page_waits import wait_for_frame_content
+from http_client import HttpClient
+from cafe_listing import BoardListingBackend, HttpBoardListing, PlaywrightBoardListing, parse_board_articles
+from rate_limiter import HostRateLimiter
+from page_pool import PagePool
+
+
+# 작성자 댓글마다 첫 링크(href)와 본문 텍스트를 댓글 순서대로 반환
+_WRITER_COMMENTS_SCRIPT = """
+() => Array.from(document.querySelectorAll('.comment_box'))
+    .filter(box => box.querySelector('.comment_badge_writer'))
+    .map(box => box.querySelector('.text_comment'))
+    .filter(Boolean)
+    .map(text => {
+        const anchor = text.querySelector('a');
+        return {href: anchor ? anchor.getAttribute('href') : null, text: text.innerText || ''};
+    })
+"""
 
 
 class CafeCrawler:
     """네이버 카페 크롤러 - Playwright 기반"""
     
-    def __init__(self, driver=None):
+    def __init__(self, driver=None, browser_pool: Optional[BrowserPool] = None,
+                 http_client: Optional[HttpClient] = None):
         # 기존 Selenium driver는 무시하고 Playwright 사용
         self.logger = logging.getLogger(__name__)
-        self.browser = None
+        # 공용 풀을 받지 못하면 자체 풀을 만들고 종료 시 함께 닫는다
+        self.browser_pool = browser_pool or BrowserPool()
+        self._owns_pool = browser_pool is None
+        self.http_client = http_client or HttpClient()
+        self._owns_http_client = http_client is None
         self.context = None
         self.page = None
-        self.playwright = None
-        
-    async def setup_browser(self, headless=True):
-        """Playwright 브라우저 설정"""
+        self.resource_blocker = None
+        # 게시판 목록 조회 방식 (앞에서부터 시도, 실패하면 사이클이 끝날 때까지 다음 방식 사용)
+        self.listing_backends = self._build_listing_backends()
+        self._listing_index = 0
+        # 게시글 상세 조회용 탭 (같은 컨텍스트에 article_tabs개)과 카페 요청 간격 제한
+        self.article_tabs = CAFE_CONFIG['article_tabs']
+        self._tab_pool: Optional[PagePool] = None
+        self._tabs_lock: Optional[asyncio.Lock] = None
+        self.rate_limiter = HostRateLimiter()
+    
+    def _build_listing_backends(self) -> List[BoardListingBackend]:
+        """설정 순서대로 게시판 목록 조회 백엔드 생성"""
+        backends = {
+            'http': lambda: HttpBoardListing(self.http_client),
+            'playwright': lambda: PlaywrightBoardListing(self)
+        }
+        return [backends[name]() for name in CAFE_CONFIG['listing_backends']]
+    
+    async def ensure_browser(self) -> bool:
+        """브라우저가 필요할 때만 컨텍스트 대여 (게시판을 HTTP로 읽으면 새 글이 없는 사이클은 브라우저 없이 끝남)"""
+        if self.page:
+            return True
+        return await self.setup_browser()
+    
+    async def setup_browser(self) -> bool:
+        """공용 풀에서 브라우저 컨텍스트 대여"""
         try:
-            self.playwright = await async_playwright().start()
-            
-            self.browser = await self.playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security'
-                ]
-            )
+            self.context = await self.browser_pool.new_context('default')
             
-            self.context = await self.browser.new_context(
-                viewport={'width': 1366, 'height': 768},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            # 게시판/게시글은 텍스트만 읽으므로 불필요한 리소스 차단
+            self.resource_blocker = ResourceBlocker(CAFE_CONFIG['block_profile'])
+            await self.resource_blocker.install(self.context)
             
             self.page = await self.context.new_page()
             
-            # webdriver 탐지 방지
-            await self.page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
             self.logger.info("카페 크롤러 Playwright 브라우저 설정 완료")
             return True
             
         except Exception as e:
-            self.logger.error(f"카페 크롤러 브라우저 설정 실패: {e}")
+            self.logger.error(f"카페 크롤러 Playwright 브라우저 설정 실패: {e}")
             return False
     
     async def close_browser(self):
-        """브라우저 종료"""
+        """브라우저 컨텍스트 반납 (자체 풀인 경우 브라우저까지 종료)"""
         try:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self.resource_blocker:
+                self.resource_blocker.log_totals("카페")
+                self.resource_blocker = None
+            await self.browser_pool.release_context(self.context)
+            self.context = None
+            self.page = None
+            self._tab_pool = None
+            if self._owns_pool:
+                await self.browser_pool.close()
+            if self._owns_http_client:
+                self.http_client.close()
             self.logger.info("카페 크롤러 브라우저 종료 완료")
         except Exception as e:
             self.logger.error(f"카페 크롤러 브라우저 종료 실패: {e}")
     
-    async def get_link_from_comments_async(self) -> str:
-        """댓글에서 링크 추출 - 비동기"""
+    async def _resolve_cafe_frame(self, page: Page) -> Union[Page, Frame]:
+        """cafe_main 프레임 반환 (없으면 페이지 그대로, self.page는 바꾸지 않음)"""
+        try:
+            iframe = await page.query_selector(PAGE_WAIT_CONFIG['cafe_frame'])
+            frame = await iframe.content_frame() if iframe else None
+            if frame:
+                return frame
+        except Exception as e:
+            self.logger.warning(f"iframe 전환 실패: {e}")
+        return page
+    
+    async def get_link_from_comments_async(self, target: Optional[Union[Page, Frame]] = None) -> str:
+        """댓글에서 링크 추출 - 비동기 (프레임을 주면 그 안에서 찾음)"""
         try:
             self.logger.debug("댓글에서 링크 추출 시작")
             
             # iframe 전환
-            try:
-                iframe = await self.page.query_selector('iframe[name="cafe_main"]')
-                if iframe:
-                    frame = await iframe.content_frame()
-                    if frame:
-                        self.page = frame
-            except Exception as e:
-                self.logger.warning(f"iframe 전환 실패: {e}")
+            target = target or self.page
+            if isinstance(target, Page):
+                target = await self._resolve_cafe_frame(target)
             
-            # 댓글 박스 찾기
-            comment_boxes = await self.page.query_selector_all('.comment_box')
+            # 작성자 댓글의 링크/본문을 한 번의 evaluate로 수집
+            comments = await target.evaluate(_WRITER_COMMENTS_SCRIPT)
             
-            for comment in comment_boxes:
-                try:
-                    # 작성자 여부 확인
-                    writer_badge = await comment.query_selector('.comment_badge_writer')
-                    is_writer = writer_badge is not None
-                    
-                    if is_writer:
-                        comment_text_element = await comment.query_selector('.text_comment')
-                        if comment_text_element:
-                            
-                            # a 태그에서 링크 추출 시도
-                            link_element = await comment_text_element.query_selector('a')
-                            if link_element:
-                                link = await link_element.get_attribute('href')
-                                if link:
-                                    self.logger.debug(f"댓글에서 링크 발견: {link}")
-                                    return link
-                            
-                            # 텍스트에서 정규식으로 링크 추출
-                            text = await comment_text_element.inner_text()
-                            urls = extract_urls_from_text(text)
-                            if urls:
-                                self.logger.debug(f"정규식으로 링크 발견: {urls[0]}")
-                                return urls[0]
+            for comment in comments:
+                # a 태그에서 링크 추출 시도
+                if comment['href']:
+                    self.logger.debug(f"댓글에서 링크 발견: {comment['href']}")
+                    return comment['href']
                 
-                except Exception as e:
-                    self.logger.warning(f"댓글 처리 중 오류: {e}")
-                    continue
+                # 텍스트에서 정규식으로 링크 추출
+                urls = extract_urls_from_text(comment['text'])
+                if urls:
+                    self.logger.debug(f"정규식으로 링크 발견: {urls[0]}")
+                    return urls[0]
             
             return "NO_LINK"
             
@@ -124,24 +155,22 @@ class CafeCrawler:
     
     def get_link_from_comments(self) -> str:
         """댓글에서 링크 추출 - 동기 인터페이스"""
-        return asyncio.run(self.get_link_from_comments_async())
+        return run_async(self.get_link_from_comments_async())
     
-    def extract_article_info(self, article_element) -> Optional[Dict]:
-        """게시글 정보 추출 (BeautifulSoup 사용)"""
+    def extract_article_info(self, article_row: Dict) -> Optional[Dict]:
+        """게시글 정보 추출 (parse_board_articles의 행 사용)"""
         try:
             # 게시글 번호
-            matching_number_element = article_element.find(class_='inner_number')
-            if not matching_number_element:
+            if not article_row.get('number'):
                 return None
             
-            matching_number = int(matching_number_element.get_text().strip())
+            matching_number = int(article_row['number'])
             
             # 게시글 제목
-            article_element_title = article_element.find(class_='article')
-            if not article_element_title:
+            article_title = article_row.get('title')
+            if not article_title:
                 return None
             
-            article_title = article_element_title.get_text().strip()
             product_title = clean_product_title(article_title)
             
             # 가격 추출
@@ -164,25 +193,33 @@ class CafeCrawler:
             self.logger.error(f"게시글 정보 추출 실패: {e}")
             return None
     
-    async def get_shopping_link_async(self, article_url: str) -> str:
-        """게시글에서 쇼핑몰 링크 추출 - 비동기"""
+    async def _wait_for_cafe_content(self, page_type: str, page: Optional[Page] = None) -> None:
+        """cafe_main 프레임 안의 게시판/게시글 요소가 나타날 때까지 대기"""
+        wait = PAGE_WAIT_CONFIG[page_type]
+        found = await wait_for_frame_content(
+            page or self.page, PAGE_WAIT_CONFIG['cafe_frame'], wait['selectors'], wait['timeout'])
+        if found is None:
+            self.logger.debug(f"대기 셀렉터 미발견, 기한 초과 후 진행 ({page_type})")
+
+    async def get_shopping_link_async(self, article_url: str, page: Optional[Page] = None) -> str:
+        """게시글에서 쇼핑몰 링크 추출 - 비동기 (page를 주지 않으면 기본 페이지 사용)"""
         try:
-            await self.page.goto(article_url)
-            await asyncio.sleep(CRAWLING_CONFIG.get('sleep_between_requests', 3))
+            if page is None:
+                if not await self.ensure_browser():
+                    return "링크 없음"
+                page = self.page
+            
+            await self.rate_limiter.wait(article_url)
+            await page.goto(article_url, wait_until='domcontentloaded')
+            await self._wait_for_cafe_content('cafe_article', page)
+            self.resource_blocker.log_page_stats(page, "게시글")
             
             # iframe 전환
-            try:
-                iframe = await self.page.query_selector('iframe[name="cafe_main"]')
-                if iframe:
-                    frame = await iframe.content_frame()
-                    if frame:
-                        self.page = frame
-            except Exception as e:
-                self.logger.warning(f"iframe 전환 실패: {e}")
+            frame = await self._resolve_cafe_frame(page)
             
             # 본문에서 링크 찾기
             try:
-                link_element = await self.page.query_selector('.se-link')
+                link_element = await frame.query_selector('.se-link')
                 if link_element:
                     link = await link_element.inner_text()
                     if link and link.startswith(('http://', 'https://')):
@@ -191,7 +228,7 @@ class CafeCrawler:
                 pass
             
             # 댓글에서 링크 찾기
-            link = await self.get_link_from_comments_async()
+            link = await self.get_link_from_comments_async(frame)
             return link if link != "NO_LINK" else "링크 없음"
             
         except Exception as e:
@@ -200,7 +237,7 @@ class CafeCrawler:
     
     def get_shopping_link(self, article_url: str) -> str:
         """게시글에서 쇼핑몰 링크 추출 - 동기 인터페이스"""
-        return asyncio.run(self._get_shopping_link_with_browser(article_url))
+        return run_async(self._get_shopping_link_with_browser(article_url))
     
     async def _get_shopping_link_with_browser(self, article_url: str) -> str:
         """브라우저 설정과 함께 쇼핑몰 링크 추출"""
@@ -216,87 +253,143 @@ class CafeCrawler:
     
     def crawl_new_articles(self, last_search_num: int) -> Tuple[List[Dict], int]:
         """새로운 게시글 크롤링 - 동기 인터페이스"""
-        return asyncio.run(self._crawl_new_articles_async(last_search_num))
+        return run_async(self._crawl_new_articles_async(last_search_num))
     
-    async def _crawl_new_articles_async(self, last_search_num: int) -> Tuple[List[Dict], int]:
-        """새로운 게시글 크롤링 - 비동기 구현"""
+    async def _fetch_board_articles(self, page_number: int) -> Optional[List]:
+        """게시판 페이지의 게시글 셀 목록 조회 (현재 방식이 실패하면 다음 방식으로 전환)"""
+        while self._listing_index < len(self.listing_backends):
+            backend = self.listing_backends[self._listing_index]
+            try:
+                html = await backend.fetch_board_html(page_number)
+                articles = parse_board_articles(html) if html else None
+            except Exception as e:
+                self.logger.debug(f"게시판 목록 조회 오류 ({backend.name}): {e}")
+                articles = None
+            
+            if articles is not None:
+                return articles
+            
+            if self._listing_index == len(self.listing_backends) - 1:
+                return None
+            self._listing_index += 1
+            self.logger.warning(
+                f"게시판 목록 조회 실패 ({backend.name}), "
+                f"{self.listing_backends[self._listing_index].name} 방식으로 전환")
+        return None
+    
+    async def _get_tab_pool(self) -> PagePool:
+        """게시글 상세 조회용 탭 풀 준비 (같은 컨텍스트에 최대 article_tabs개)"""
+        if self._tabs_lock is None:
+            self._tabs_lock = asyncio.Lock()
+        
+        async with self._tabs_lock:
+            if self._tab_pool is None:
+                if not await self.ensure_browser():
+                    raise RuntimeError("브라우저 설정 실패")
+                # 기본 페이지는 게시판(Playwright 조회)용으로 두고 탭은 따로 연다
+                self._tab_pool = PagePool(self.context, self.article_tabs)
+        
+        return self._tab_pool
+    
+    async def _fetch_article_link(self, article_url: str) -> str:
+        """탭을 빌려 게시글의 쇼핑몰 링크 추출 - 여러 건을 동시에 호출해도 안전"""
+        try:
+            pool = await self._get_tab_pool()
+        except Exception as e:
+            self.logger.error(f"게시글 탭 준비 실패: {e}")
+            return "링크 없음"
+        
+        async with pool.borrow() as page:
+            return await self.get_shopping_link_async(article_url, page)
+    
+    def build_article_row(self, article_info: Dict, shopping_link: str) -> Dict:
+        """게시글 정보와 쇼핑몰 링크로 결과 행 생성"""
+        return create_dataframe_row(
+            get_current_timestamp(),
+            '맘이베베',
+            article_info['matching_number'],
+            article_info['article_url'],
+            article_info['article_title'],
+            article_info['product_title'],
+            shopping_link,
+            article_info['price']
+        )
+    
+    async def _crawl_new_articles_async(self, last_search_num: int,
+                                        on_article: Optional[Callable[[Dict], Awaitable[None]]] = None,
+                                        on_listed: Optional[Callable[[Dict], Awaitable[None]]] = None,
+                                        skip_numbers: Optional[Iterable[int]] = None
+                                        ) -> Tuple[List[Dict], int]:
+        """새로운 게시글 크롤링 - 비동기 구현
+
+        게시판은 순서대로 훑고 게시글 상세는 탭 여러 개에서 동시에 조회하되,
+        행은 게시판 순서대로 만든다. on_article이 주어지면 행이 만들어지는 즉시 전달한다
+        (파이프라인 큐의 put을 넘기면 다음 단계가 가득 찼을 때 대기).
+        on_listed는 게시판에서 새 글을 찾아 상세 조회를 시작할 때 게시글 정보로 호출하고,
+        skip_numbers의 게시글(이전 실행에서 이미 기록한 글)은 건너뛴다.
+        최신 번호는 실제로 행을 만든 게시글 기준으로 올린다.
+        """
         self.logger.info("맘이베베 크롤링 시작")
         
         new_articles = []
         current_max_num = last_search_num
+        in_flight = deque()
+        seen_numbers = set(skip_numbers or ())
+        
+        async def emit(article_info: Dict, link_task: asyncio.Task) -> None:
+            """상세 조회가 끝난 게시글을 게시판 순서대로 행으로 만들어 전달"""
+            nonlocal current_max_num
+            row_data = self.build_article_row(article_info, await link_task)
+            
+            new_articles.append(row_data)
+            current_max_num = max(current_max_num, article_info['matching_number'])
+            self.logger.info(f"새 게시글 추가: {article_info['matching_number']} - {article_info['product_title']}")
+            
+            if on_article:
+                await on_article(row_data)
         
         try:
-            # 브라우저 설정
-            if not await self.setup_browser():
-                self.logger.error("브라우저 설정 실패")
-                return [], last_search_num
+            # 매 사이클 첫 번째 조회 방식(HTTP)부터 다시 시도
+            self._listing_index = 0
         
             for page in range(CAFE_CONFIG['max_pages']):
                 try:
-                    # 페이지 로드
-                    page_url = f"{CAFE_CONFIG['base_url']}&search.menuid={CAFE_CONFIG['menu_id']}&search.page={page + 1}"
-                    await self.page.goto(page_url)
-                    await asyncio.sleep(CRAWLING_CONFIG.get('sleep_between_requests', 3))
+                    # 게시판 목록 조회
+                    await self.rate_limiter.wait(CAFE_CONFIG['list_url'])
+                    articles = await self._fetch_board_articles(page + 1)
                     
-                    # iframe 전환
-                    try:
-                        iframe = await self.page.query_selector('iframe[name="cafe_main"]')
-                        if iframe:
-                            frame = await iframe.content_frame()
-                            if frame:
-                                current_page = frame
-                            else:
-                                current_page = self.page
-                        else:
-                            current_page = self.page
-                    except Exception as e:
-                        self.logger.warning(f"페이지 {page + 1} iframe 로드 실패: {e}")
-                        current_page = self.page
-                    
-                    # HTML 파싱
-                    page_content = await current_page.content()
-                    soup = BeautifulSoup(page_content, 'html.parser')
-                    article_board = soup.find_all(class_='article-board m-tcol-c')
-                    
-                    if len(article_board) < 2:
+                    if articles is None:
                         self.logger.warning(f"페이지 {page + 1} 게시글 보드 찾기 실패")
                         continue
                     
-                    articles = article_board[1].find_all(class_='td_article')
-                    
                     stop_crawling = False
                     
-                    for index, article in enumerate(articles):
+                    for article in articles:
                         article_info = self.extract_article_info(article)
                         if not article_info:
                             continue
                         
                         matching_number = article_info['matching_number']
                         
-                        # 최대 번호 업데이트
-                        if matching_number > current_max_num:
-                            current_max_num = matching_number
-                        
                         # 이미 처리한 게시글인지 확인
                         if matching_number <= last_search_num:
                             self.logger.info(f"이미 처리된 게시글 도달: {matching_number}")
                             stop_crawling = True
                             break
                         
-                        # 쇼핑몰 링크 추출
-                        shopping_link = await self.get_shopping_link_async(article_info['article_url'])
+                        # 조회 중 새 글이 올라와 이전 페이지 글이 다시 나온 경우
+                        if matching_number in seen_numbers:
+                            continue
+                        seen_numbers.add(matching_number)
                         
-                        # 데이터 행 생성
-                        row_data = create_dataframe_row(
-                            article_info['matching_number'],
-                            article_info['article_title'],
-                            article_info['product_title'],
-                            article_info['price'],
-                            shopping_link
-                        )
+                        if on_listed:
+                            await on_listed(article_info)
                         
-                        new_articles.append(row_data)
-                        self.logger.info(f"새 게시글 추가: {matching_number} - {article_info['product_title']}")
+                        # 쇼핑몰 링크 추출은 탭에서 동시에 진행 (탭 수의 두 배까지 미리 시작해 탭이 놀지 않게 함)
+                        in_flight.append((article_info, asyncio.create_task(
+                            self._fetch_article_link(article_info['article_url']))))
+                        if len(in_flight) >= self.article_tabs * 2:
+                            await emit(*in_flight.popleft())
                     
                     if stop_crawling:
                         break
@@ -304,12 +397,18 @@ class CafeCrawler:
                 except Exception as e:
                     self.logger.error(f"페이지 {page + 1} 처리 실패: {e}")
                     continue
+            
+            while in_flight:
+                await emit(*in_flight.popleft())
         
         except Exception as e:
             self.logger.error(f"크롤링 실패: {e}")
         
         finally:
+            for _, link_task in in_flight:
+                link_task.cancel()
+            await asyncio.gather(*(link_task for _, link_task in in_flight), return_exceptions=True)
             await self.close_browser()
         
         self.logger.info(f"크롤링 완료: {len(new_articles)}개 새 게시글")
-        return new_articles, current_max_num 
\ No newline at end of file
+        return new_articles, current_max_num
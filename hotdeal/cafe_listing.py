@@ -0,0 +1,79 @@
+"""
+카페 게시판 목록 조회 백엔드
+
+게시판 목록은 브라우저 없이 카페 내부 ArticleList 페이지를 HTTP로 받아 읽고,
+실패하면 Playwright로 카페 페이지를 열어 cafe_main 프레임에서 읽는다.
+"""
+import logging
+from typing import List, Optional
+
+from config import CAFE_CONFIG, PAGE_WAIT_CONFIG
+from html_parser import BoardRow, parse_board_rows
+from http_client import HttpClient, decode_html
+
+
+def parse_board_articles(html: str) -> Optional[List[BoardRow]]:
+    """게시판 HTML에서 게시글 행(번호, 제목) 목록 추출 (게시판 표가 없으면 None)"""
+    return parse_board_rows(html, 'cafe')
+
+
+class BoardListingBackend:
+    """게시판 목록 조회 백엔드 인터페이스"""
+
+    name = 'base'
+
+    async def fetch_board_html(self, page_number: int) -> Optional[str]:
+        """게시판 페이지 HTML 반환 (실패시 None)"""
+        raise NotImplementedError
+
+
+class HttpBoardListing(BoardListingBackend):
+    """카페 내부 ArticleList 페이지를 HTTP로 직접 조회"""
+
+    name = 'http'
+
+    def __init__(self, http_client: HttpClient):
+        self.logger = logging.getLogger(__name__)
+        self.http_client = http_client
+
+    async def fetch_board_html(self, page_number: int) -> Optional[str]:
+        """게시판 페이지 HTML 반환 (실패시 None)"""
+        url = f"{CAFE_CONFIG['list_url']}&search.menuid={CAFE_CONFIG['menu_id']}&search.page={page_number}"
+        response = await self.http_client.fetch(url, headers={'Referer': 'https://cafe.naver.com/'})
+        if response.status_code != 200:
+            self.logger.debug(f"게시판 HTTP 조회 실패: 상태 코드 {response.status_code}")
+            return None
+        return decode_html(response.content, response.encoding)
+
+
+class PlaywrightBoardListing(BoardListingBackend):
+    """카페 페이지를 브라우저로 열어 cafe_main 프레임에서 조회 (대체 경로)"""
+
+    name = 'playwright'
+
+    def __init__(self, crawler):
+        self.logger = logging.getLogger(__name__)
+        self.crawler = crawler
+
+    async def fetch_board_html(self, page_number: int) -> Optional[str]:
+        """게시판 페이지 HTML 반환 (실패시 None)"""
+        crawler = self.crawler
+        if not await crawler.ensure_browser():
+            return None
+
+        page_url = f"{CAFE_CONFIG['base_url']}&search.menuid={CAFE_CONFIG['menu_id']}&search.page={page_number}"
+        await crawler.page.goto(page_url, wait_until='domcontentloaded')
+        await crawler._wait_for_cafe_content('cafe_board')
+        crawler.resource_blocker.log_page_stats(crawler.page, f"게시판 {page_number}페이지")
+
+        # iframe 전환
+        current_page = crawler.page
+        try:
+            iframe = await crawler.page.query_selector(PAGE_WAIT_CONFIG['cafe_frame'])
+            frame = await iframe.content_frame() if iframe else None
+            if frame:
+                current_page = frame
+        except Exception as e:
+            self.logger.warning(f"페이지 {page_number} iframe 로드 실패: {e}")
+
+        return await current_page.content()
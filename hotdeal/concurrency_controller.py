@@ -0,0 +1,108 @@
+"""
+AIMD 동시 실행 제어
+
+성공하면 동시 실행 한도를 조금씩(한도만큼 연속 성공하면 increase만큼) 늘리고,
+차단이 감지되면 한도를 decrease_factor배로 줄인 뒤 pause초 동안 새 작업을 시작하지 않는다.
+한 번의 중지 구간 안에서 들어온 차단은 같은 사건으로 보고 한 번만 줄인다.
+"""
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+
+class AimdController:
+    """가산 증가·승산 감소(AIMD) 동시 실행 한도"""
+
+    def __init__(self, max_limit: int, min_limit: int = 1, initial: Optional[int] = None,
+                 increase: float = 1.0, decrease_factor: float = 0.5, pause: float = 0.0,
+                 window: int = 20):
+        self.logger = logging.getLogger(__name__)
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.pause = pause
+        self._limit = float(min(max(initial or min_limit, min_limit), self.max_limit))
+
+        self.active = 0
+        self.attempts = 0
+        self.blocks = 0
+        self._recent = deque(maxlen=window)  # 최근 결과 (True = 차단)
+        self._paused_until = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 실행 한도"""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def block_rate(self) -> float:
+        """최근 결과 중 차단 비율"""
+        return sum(self._recent) / len(self._recent) if self._recent else 0.0
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    @asynccontextmanager
+    async def slot(self):
+        """실행 자리 대여 (한도가 차 있거나 중지 중이면 대기)
+
+        record_success/record_block은 자리를 빌린 상태에서 호출한다 (반납시 대기 작업을 깨움).
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        while True:
+            delay = self._paused_until - self._now()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            async with self._condition:
+                if self.active < self.limit and self._paused_until <= self._now():
+                    self.active += 1
+                    break
+                await self._condition.wait()
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.active -= 1
+                self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """성공 기록 - 한도를 increase / 현재 한도만큼 늘림"""
+        self.attempts += 1
+        self._recent.append(False)
+        if self._limit < self.max_limit:
+            before = self.limit
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self.limit)
+            if self.limit != before:
+                self.logger.info(f"동시 실행 한도 증가: {before} → {self.limit}")
+
+    def record_block(self) -> None:
+        """차단 기록 - 중지 구간 밖이면 한도를 줄이고 pause초 동안 새 작업 중지"""
+        self.attempts += 1
+        self.blocks += 1
+        self._recent.append(True)
+
+        now = self._now()
+        if now < self._paused_until:
+            return
+        before = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._paused_until = now + self.pause
+        self.logger.warning(f"차단 감지 - 동시 실행 한도 {before} → {self.limit}, {self.pause:.0f}초 중지")
+
+    def metrics(self) -> Dict:
+        """현재 한도, 실행 중 작업 수, 시도/차단 횟수, 최근 차단율"""
+        return {
+            'limit': self.limit,
+            'active': self.active,
+            'attempts': self.attempts,
+            'blocks': self.blocks,
+            'block_rate': self.block_rate
+        }
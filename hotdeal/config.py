@@ -18,13 +18,21 @@ CAFE_CONFIG = {
     'base_url': 'https://cafe.naver.com/맘이베베/ArticleList.nhn?search.clubid=29434212',
     'club_id': '29434212',
     'menu_id': '2',
-    'max_pages': 100
+    'max_pages': 100,
+    'block_profile': 'strict',  # 게시판/게시글은 텍스트만 읽으므로 스타일시트까지 차단
+    # 카페 내부 게시판 목록 페이지 (cafe_main 프레임에 뜨는 페이지, 브라우저 없이 조회)
+    'list_url': 'https://cafe.naver.com/ArticleList.nhn?search.clubid=29434212&search.boardtype=L',
+    'listing_backends': ['http', 'playwright'],  # 게시판 목록 조회 방식 (앞에서부터 시도)
+    'article_tabs': 4  # 게시글 상세를 동시에 여는 탭 수 (1이면 순차 처리)
 }
 
 # 파일 경로 설정
 FILES = {
     'search_info': DATA_DIR / "search_info.xlsx",
     'results': DATA_DIR / "results.xlsx",
+    'results_pending': DATA_DIR / "results_pending.jsonl",  # 저장 대기 행 (실행이 끝나면 results.xlsx로 내보냄)
+    'progress_log': DATA_DIR / "progress.jsonl",  # 게시글 단계별 진행 기록 (재시작시 이어서 처리)
+    'result_cache': DATA_DIR / "result_cache.sqlite3",  # 상품명·네이버쇼핑 결과 캐시
     'chromedriver': "/opt/homebrew/bin/chromedriver"  # macOS 기본 경로
 }
 
@@ -32,13 +40,194 @@ FILES = {
 CRAWLING_CONFIG = {
     'implicit_wait': 15,
     'page_load_timeout': 45,
-    'sleep_between_requests': 3,
     'sleep_after_cycle': 600,
     'max_retries': 2,
     'random_delay_min': 5,
     'random_delay_max': 10
 }
 
+# 페이지 로드 대기 설정 (셀렉터 중 하나가 나타나면 바로 진행, timeout은 최대 대기 초)
+PAGE_WAIT_CONFIG = {
+    'cafe_frame': 'iframe[name="cafe_main"]',
+    'cafe_board': {
+        'selectors': ['.article-board', '.td_article'],
+        'timeout': 10
+    },
+    'cafe_article': {
+        'selectors': ['.se-link', '.comment_box', '.comment_list'],
+        'timeout': 5  # 링크도 댓글도 없는 게시글은 기한까지 대기 후 진행
+    },
+    'mall_title': {
+        'timeout': 8  # 셀렉터는 SHOPPING_MALL_SELECTORS 사용
+    },
+    'naver_main': {
+        'selectors': ['input[name="query"]', 'input[placeholder*="검색"]', 'input[type="search"]'],
+        'timeout': 15
+    },
+    'naver_results': {
+        'selectors': ['a[href*="shopping"]', 'a:has-text("쇼핑")', '[class*="product_item"]', '[class*="basicList"]'],
+        'timeout': 15
+    },
+    'naver_products': {
+        'selectors': ['[class*="product_item"]', '[class*="basicList_item"]', '[class*="adProduct_item"]'],
+        'timeout': 15
+    },
+    'naver_catalog': {
+        'selectors': ['[class*="productByMall"]', '[class*="lowestPrice"]', '[class*="price_num"]'],
+        'timeout': 15
+    }
+}
+
+# 요청 간 지연 설정 (로드 대기와 별개인 예의상/사람처럼 보이기 위한 지연, 초)
+PACING_CONFIG = {
+    'hosts': {                  # 호스트별 요청 시작 최소 간격 (하위 도메인 포함, 동시 요청에도 적용)
+        'cafe.naver.com': 0.5,
+        'search.shopping.naver.com': 2.0  # 가격 조회 http 엔진 (브라우저 검색은 'naver' 간격 사용)
+    },
+    'naver': 3.0,               # 네이버쇼핑 검색 간
+    'naver_human_delay': (1.5, 3.0)  # 네이버쇼핑 화면 조작 사이 임의 지연 범위
+}
+
+# 스트리밍 파이프라인 설정
+PIPELINE_CONFIG = {
+    'queue_size': 5  # 단계 간 큐 크기 (가득 차면 앞 단계가 대기)
+}
+
+# 결과 캐시 설정 (ttl은 초, max_entries를 넘으면 오래 쓰이지 않은 항목부터 삭제)
+RESULT_CACHE_CONFIG = {
+    'enabled': True,
+    'layers': {
+        'mall_title': {'ttl': 7 * 24 * 3600, 'max_entries': 20000},    # 쇼핑몰 상품 키 → 상품명
+        'naver_result': {'ttl': 3 * 24 * 3600, 'max_entries': 20000},  # 검색어 → 네이버쇼핑 결과 (가격이 바뀌므로 짧게)
+        'short_link': {'ttl': 30 * 24 * 3600, 'max_entries': 20000}    # 단축 링크 → 최종 쇼핑몰 주소
+    }
+}
+
+# 쇼핑몰 주소 정규화 설정 (같은 상품의 제휴·추적·모바일 주소를 하나의 주소와 상품 키로 모음)
+URL_CANONICAL_CONFIG = {
+    # 리다이렉트를 따라가야 실제 상품 주소를 알 수 있는 호스트 (하위 도메인 포함)
+    'short_link_hosts': [
+        'link.coupang.com', 'coupa.ng', 'naver.me', 'han.gl', 'me2.do', 'bit.ly', 'url.kr',
+        'vo.la', 'buly.kr', 'tinyurl.com', 'kko.to', 'gmkt.kr', 'a.aliexpress.com', 's.click.aliexpress.com'
+    ],
+    # 모바일·대체 호스트 → 대표 호스트
+    'host_aliases': {
+        'coupang.com': 'www.coupang.com',
+        'm.coupang.com': 'www.coupang.com',
+        'm.11st.co.kr': 'www.11st.co.kr',
+        '11st.co.kr': 'www.11st.co.kr',
+        'm.smartstore.naver.com': 'smartstore.naver.com',
+        'm.brand.naver.com': 'brand.naver.com',
+        'm.shopping.naver.com': 'shopping.naver.com',
+        'mitem.gmarket.co.kr': 'item.gmarket.co.kr',
+        'm.lotteon.com': 'www.lotteon.com',
+        'lotteon.com': 'www.lotteon.com',
+        'm.ssg.com': 'www.ssg.com',
+        'ssg.com': 'www.ssg.com',
+        'm.yes24.com': 'www.yes24.com',
+        'm.gsshop.com': 'www.gsshop.com'
+    },
+    # 모든 호스트에서 지울 쿼리 파라미터 (대소문자 무시) - 광고·유입 추적용으로만 쓰이는 이름 일치 또는 접두사 일치
+    'tracking_params': ['fbclid', 'gclid', 'napm'],
+    'tracking_prefixes': ['utm_', 'n_'],
+    # 쇼핑몰별로 지울 쿼리 파라미터 (SHOPPING_MALLS 종류 기준) - 다른 사이트에서는 상품을 가리키는 값일 수 있음
+    'mall_tracking_params': {
+        'coupang': {
+            'params': ['src', 'spm', 'lptag', 'subid', 'addtag', 'ctag', 'traceid', 'requestid', 'clickeventid',
+                       'sourcetype', 'searchid', 'rank', 'q', 'itemscount', 'isaddedcart', 'wpcid', 'wref',
+                       'wtime', 'redirect']
+        },
+        'naver': {'params': ['nacn', 'site_preference'], 'prefixes': ['nl-', 'nt_']},
+        'brand.naver': {'params': ['nacn', 'site_preference'], 'prefixes': ['nl-', 'nt_']},
+        'gmarket': {'params': ['jaehuid'], 'prefixes': ['pos_']},
+        'auction': {'params': ['jaehuid'], 'prefixes': ['pos_']},
+        '11st': {'params': ['trtypecd', 'trctgrno', 'tid']}
+    },
+    'resolve_timeout': 5   # 단축 링크 요청 제한 시간 (초)
+}
+
+# 공용 브라우저 풀 설정
+BROWSER_POOL_CONFIG = {
+    'max_pages_per_browser': 200  # 브라우저당 생성 페이지 수가 넘으면 재시작
+}
+
+# 브라우저 프로필별 실행/컨텍스트 옵션
+BROWSER_PROFILES = {
+    'default': {
+        'headless': True,
+        'args': [
+            '--no-sandbox',
+            '--disable-blink-features=AutomationControlled',
+            '--disable-web-security'
+        ],
+        'context': {
+            'viewport': {'width': 1366, 'height': 768},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        },
+        'init_script': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    },
+    'naver': {
+        'headless': False,  # 검증 페이지 확인을 위해 헤드리스 비활성화
+        'args': [
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-extensions',
+            '--disable-default-apps',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-renderer-backgrounding',
+            '--disable-web-security',
+            '--disable-features=VizDisplayCompositor',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+            '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        ],
+        'context': {
+            'viewport': {'width': 1366, 'height': 768},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'locale': 'ko-KR',
+            'extra_http_headers': {
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            }
+        },
+        'init_script': """
+            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+            Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+            Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
+            window.chrome = {runtime: {}};
+            Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})});
+        """
+    }
+}
+
+# 지원 쇼핑몰 목록
+# hosts: 호스트 접미사 (하위 도메인 포함, 가장 긴 접미사 우선 - brand.naver.com은 naver.com보다 우선)
+# block_profile: 요청 차단 프로필 (기본 default)
+# max_pages: 쇼핑몰별 동시 페이지 수 (기본 MALL_CONCURRENCY_CONFIG['per_mall_default'], 봇 차단이 민감한 곳은 낮게)
+# js_only: HTTP 우선 추출을 건너뛰고 항상 브라우저 사용
+SHOPPING_MALLS = {
+    'auction': {'name': '옥션', 'hosts': ['auction.co.kr']},
+    'lotteon': {'name': '롯데온', 'hosts': ['lotteon.com']},
+    'wemakeprice': {'name': '위메프', 'hosts': ['wemakeprice.com', 'wemakeprice.co.kr'], 'js_only': True},
+    'gmarket': {'name': 'G마켓', 'hosts': ['gmarket.co.kr']},
+    'gs': {'name': 'GS샵', 'hosts': ['gsshop.com']},
+    'tmon': {'name': '티몬', 'hosts': ['tmon.co.kr'], 'js_only': True},
+    '11st': {'name': '11번가', 'hosts': ['11st.co.kr']},
+    'interpark': {'name': '인터파크', 'hosts': ['interpark.com'], 'block_profile': 'strict'},
+    'coupang': {'name': '쿠팡', 'hosts': ['coupang.com', 'coupa.ng'], 'max_pages': 2, 'js_only': True},
+    'naver': {'name': '네이버쇼핑', 'hosts': ['smartstore.naver.com', 'shopping.naver.com', 'naver.me'], 'max_pages': 2, 'js_only': True},
+    'brand.naver': {'name': '네이버브랜드스토어', 'hosts': ['brand.naver.com'], 'max_pages': 2, 'js_only': True},
+    'kakao': {'name': '카카오톡스토어', 'hosts': ['store.kakao.com', 'gift.kakao.com'], 'js_only': True},
+    'yes24': {'name': 'YES24', 'hosts': ['yes24.com'], 'block_profile': 'strict'},
+    'nsmall': {'name': 'NS홈쇼핑', 'hosts': ['nsmall.com'], 'block_profile': 'strict'},
+    'ssg': {'name': 'SSG', 'hosts': ['ssg.com']}
+}
+
 # 지원 쇼핑몰 XPath 설정
 SHOPPING_MALL_SELECTORS = {
     'auction': [
@@ -105,12 +294,180 @@ SHOPPING_MALL_SELECTORS = {
     ]
 }
 
+# 요청 차단 프로필 (제목/링크만 읽으므로 불필요한 리소스는 받지 않음)
+RESOURCE_BLOCK_PROFILES = {
+    'none': {
+        'resource_types': [],
+        'block_trackers': False
+    },
+    'default': {
+        'resource_types': ['image', 'media', 'font'],
+        'block_trackers': True
+    },
+    'strict': {
+        'resource_types': ['image', 'media', 'font', 'stylesheet', 'texttrack', 'eventsource', 'manifest'],
+        'block_trackers': True
+    }
+}
+
+# 광고/분석 스크립트 호스트 (하위 도메인 포함 차단)
+TRACKER_HOSTS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'facebook.net',
+    'criteo.com',
+    'criteo.net',
+    'mixpanel.com',
+    'hotjar.com',
+    'clarity.ms',
+    'wcs.naver.net',
+    'siape.veta.naver.com',
+    'tivan.naver.com',
+    'ad.about.co.kr',
+    'mobon.net',
+    'acecounter.com',
+    'datarize.ai',
+    'braze.com',
+    'appsflyer.com'
+]
+
+# 차단 리소스 유형별 평균 크기 추정치 (절감량 보고용, 바이트)
+BLOCKED_RESOURCE_SIZE_ESTIMATES = {
+    'image': 45000,
+    'media': 500000,
+    'font': 60000,
+    'stylesheet': 30000,
+    'script': 40000,
+    'other': 5000
+}
+
+# 공용 HTTP 클라이언트 설정
+HTTP_CONFIG = {
+    'pool_size': 16,  # 호스트별 유지 연결 수
+    'timeout': 10,
+    'headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.5,en;q=0.3'
+    }
+}
+
+# HTML 파서 설정 ('auto'면 selectolax → lxml → BeautifulSoup 중 설치된 것 사용)
+HTML_PARSER_CONFIG = {
+    'backend': 'auto'  # 'auto', 'selectolax', 'lxml', 'bs4'
+}
+
+# 게시판 목록 구조 (CSS는 selectolax/BeautifulSoup, XPath는 lxml용)
+# board: 게시판 컨테이너 (None이면 문서 전체), board_index: 같은 컨테이너 중 몇 번째인지
+# fields: 행 안에서 (CSS, XPath, 'text' 또는 속성 이름)
+BOARD_LAYOUTS = {
+    'cafe': {
+        'board': ('div.article-board.m-tcol-c', "//div[@class='article-board m-tcol-c']"),
+        'board_index': 1,  # 공지 목록 다음이 일반 글 목록
+        'row': ('td.td_article', ".//td[contains(concat(' ', normalize-space(@class), ' '), ' td_article ')]"),
+        'fields': {
+            'number': ('.inner_number', ".//*[contains(concat(' ', normalize-space(@class), ' '), ' inner_number ')]", 'text'),
+            'title': ('.article', ".//*[contains(concat(' ', normalize-space(@class), ' '), ' article ')]", 'text')
+        }
+    }
+}
+
+# 쇼핑몰 상품명 HTTP 우선 추출 설정 (og:title, JSON-LD, <title>에서 추출, 실패시 브라우저 사용)
+MALL_FAST_PATH_CONFIG = {
+    'enabled': True,
+    'site_names': [  # 제목 앞뒤에 붙는 쇼핑몰 이름 (대소문자 무시)
+        '11번가', '11st', 'g마켓', 'gmarket', '옥션', 'auction', 'yes24', '예스24',
+        'ssg.com', 'ssg', '신세계몰', '이마트몰', '롯데on', '롯데온', 'lotteon',
+        'gs shop', 'gs샵', 'gsshop', '인터파크', 'interpark', 'ns몰', 'nsmall', 'ns홈쇼핑'
+    ],
+    'invalid_titles': ['access denied', '로그인', '보안 확인', '잘못된 접근', '페이지를 찾을 수 없습니다', '404 not found']
+}
+
+# 쇼핑몰 동시 접속 설정 (하나의 컨텍스트에서 여는 페이지 수)
+MALL_CONCURRENCY_CONFIG = {
+    'max_pages': 8,          # 전체 동시 페이지 수 (1이면 순차 처리)
+    'per_mall_default': 4    # 쇼핑몰별 기본 동시 페이지 수 (SHOPPING_MALLS의 max_pages로 개별 지정)
+}
+
 # 네이버 쇼핑 설정
 NAVER_SHOPPING_CONFIG = {
     'base_url': 'https://shopping.naver.com/',
     'search_input_xpath': '//*[@id="_verticalGnbModule"]/div/div[2]/div/div[2]/div/div[2]/form/fieldset/div/input',
     'search_button_xpath': '//*[@id="_verticalGnbModule"]/div/div[2]/div/div[2]/div/div[2]/form/fieldset/div/button[2]',
-    'price_compare_xpath': '//*[@id="__next"]/div/div[2]/div/div[3]/div[1]/div[1]/ul/li[2]/a'
+    'price_compare_xpath': '//*[@id="__next"]/div/div[2]/div/div[3]/div[1]/div[1]/ul/li[2]/a',
+    'search_mode': 'direct',  # 'direct': 검색 결과 주소로 바로 이동, 'humanized': 메인에서 입력 후 탭 이동
+    # direct 검색 주소 (앞에서부터 열어 상품 목록이 나오는 첫 주소 사용 - 가격비교 → 전체)
+    'direct_search_urls': [
+        'https://search.shopping.naver.com/search/all?query={query}&productSet=model',
+        'https://search.shopping.naver.com/search/all?query={query}'
+    ],
+    'fallback_searches': 20  # direct에서 접속 제한 감지 후 humanized로 검색할 횟수
+}
+
+# 네이버쇼핑 동시 검색 설정 (작업자마다 별도 브라우저 컨텍스트, AIMD로 동시 검색 수 조절)
+NAVER_WORKER_CONFIG = {
+    'max_workers': 3,         # 최대 동시 검색 수 (1이면 순차 검색)
+    'initial': 1,             # 시작 동시 검색 수
+    'increase': 1,            # 현재 한도만큼 연속 성공하면 늘리는 수
+    'decrease_factor': 0.5,   # 차단 감지시 한도에 곱하는 값
+    'block_pause': 120        # 차단 감지 후 새 검색을 시작하지 않는 시간 (초)
+}
+
+# 네이버쇼핑 검색 격리 설정 (차단된 상품은 다른 검색을 막지 않고 대기 후 새 컨텍스트로 재검색)
+NAVER_QUARANTINE_CONFIG = {
+    'cooldown': 180,   # 첫 재검색까지 대기 (초, 재검색마다 두 배)
+    'max_retries': 2   # 재검색 횟수 (넘으면 검색 실패로 처리)
+}
+
+# 네이버쇼핑 검색어 정규화 설정 (비슷한 검색어는 앞선 검색 결과 재사용)
+QUERY_NORMALIZER_CONFIG = {
+    'max_entries': 2000,           # 색인에 남길 최근 검색어 수
+    'ttl': 3 * 24 * 3600,          # 결과 재사용 기간 (초, 결과 캐시 naver_result와 같게)
+    'quantity_units': ['개', '팩', '박스', '세트', '봉', '병', '캔', '묶음', 'box', 'ea', 'set', 'pack'],
+    'promo_words': [
+        '무료배송', '무배', '특가', '핫딜', '할인', '쿠폰', '최저가', '역대가', '역대급', '카드', '적립',
+        '타임딜', '한정', '한정수량', '로켓배송', '오늘출발', '당일발송', '공식', '정품', '단독', '증정',
+        '사은품', '행사', '세일', '이벤트', '초특가', '품절임박', '재입고', '추가할인', '중복할인'
+    ],
+    'option_markers': ['택1', '택2', '옵션', '골라담기', '선택']  # 이 말로 시작하는 토큰은 옵션 표기로 보고 제거
+}
+
+# 네이버쇼핑 내장 상태(__NEXT_DATA__, Apollo) JSON에서 값을 찾을 키 (앞의 키 우선)
+NAVER_STATE_KEYS = {
+    'name': ['productName', 'productTitle', 'catalogName', 'title', 'name'],
+    'price': ['lowestPrice', 'lowPrice', 'mobileLowPrice', 'pcPrice', 'price', 'salePrice'],
+    'review_count': ['reviewCount', 'totalReviewCount', 'reviewCountSum'],
+    'mall_count': ['mallCount', 'productCount', 'shopCount'],
+    'mall_name': ['mallName', 'shopName', 'mallNm'],
+    'catalog_id': ['catalogId', 'productModelId'],  # 가격비교 카탈로그 노드에만 있는 키
+    'product_id': ['nvMid'],  # 검색 결과 상품 번호 (판매처가 둘 이상인 가격비교 묶음일 때만 카탈로그 번호로 봄)
+    'delivery': ['deliveryFeeContent', 'deliveryInfo', 'deliveryFee', 'dlvryCont']
+}
+
+# 가격 조회 엔진 설정 (backends 순서대로 시도하고 찾지 못하면 다음 엔진 사용)
+# api: 네이버 커머스 API (수십 ms, 인증 정보와 bcrypt 필요 - 없으면 건너뜀)
+# http: 검색 결과 페이지를 브라우저 없이 받아 내장 상태 JSON 읽기 (1초 안팎)
+# browser: Playwright 검색 (NaverSearchWorkers, 건당 수십 초)
+PRICE_LOOKUP_CONFIG = {
+    'backends': ['api', 'http', 'browser'],
+    'catalog_url': 'https://search.shopping.naver.com/catalog/{catalog_id}',
+    'api': {
+        'base_url': 'https://api.commerce.naver.com',
+        'client_id': os.environ.get('NAVER_COMMERCE_CLIENT_ID', ''),
+        'client_secret': os.environ.get('NAVER_COMMERCE_CLIENT_SECRET', ''),
+        'timeout': 5,
+        'concurrency': 8
+    },
+    'http': {
+        'search_url': 'https://search.shopping.naver.com/search/all?query={query}&productSet=model',
+        'timeout': 10,
+        'concurrency': 2,
+        'block_pause': 300  # 접속 제한 페이지가 나오면 이 시간(초) 동안 http 엔진 건너뜀
+    }
 }
 
 # 로깅 설정
@@ -139,14 +496,3 @@ CHROME_OPTIONS = [
     '--disable-features=VizDisplayCompositor',
     '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 ]
-
-# 정규식 패턴
-REGEX_PATTERNS = {
-    'url': r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»""'']))",
-    'price_6': r'[\S\s]*([0-9]{6}원)[\S\s]*',
-    'price_5': r'[\S\s]*([0-9]{5}원)[\S\s]*',
-    'price_4': r'[\S\s]*([0-9]{4}원)[\S\s]*',
-    'price_6_no_won': r'[\S\s]*([0-9]{6})[\S\s]*',
-    'price_5_no_won': r'[\S\s]*([0-9]{5})[\S\s]*',
-    'price_4_no_won': r'[\S\s]*([0-9]{4})[\S\s]*'
-} 
\ No newline at end of file
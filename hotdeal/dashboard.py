@@ -12,6 +12,9 @@ import re
 import numpy as np
 import hashlib
 
+from mall_registry import classify_urls, mall_display_name
+from price_parser import PRICE_NOT_FOUND, parse_prices
+
 # 페이지 설정
 st.set_page_config(
     page_title="맘이베베 핫딜 대시보드",
@@ -266,11 +269,20 @@ def load_data():
         df['핫딜몰 가격'] = pd.to_numeric(df['핫딜몰 가격'].astype(str).str.replace(',', ''), errors='coerce')
         df['네이버 가격'] = pd.to_numeric(df['네이버 가격'].astype(str).str.replace(',', ''), errors='coerce')
         
+        # 가격을 찾지 못했던 행은 제목에서 다시 추출 (예전 파서가 놓친 12,900원, 1.2만원 등)
+        missing_price = df['핫딜몰 가격'].isna() | (df['핫딜몰 가격'] == PRICE_NOT_FOUND)
+        if missing_price.any():
+            reparsed = parse_prices(df.loc[missing_price, '핫딜몰 제품명'])['price'].astype('float')
+            df.loc[missing_price, '핫딜몰 가격'] = reparsed.fillna(df.loc[missing_price, '핫딜몰 가격'])
+        
         # 유효하지 않은 가격 데이터가 있는 행 제거
         df = df.dropna(subset=['핫딜몰 가격'])
         
         # NaN 값 처리
         df['쇼핑몰 제목'] = df['쇼핑몰 제목'].fillna('알 수 없음')
+        
+        # 쇼핑몰 주소로 쇼핑몰 판별 (고유 호스트 단위로 한 번에 처리)
+        df['쇼핑몰'] = classify_urls(df['쇼핑몰 주소']).map(mall_display_name)
         df['네이버 배송료'] = df['네이버 배송료'].fillna('검색 실패')
         # 네이버 가격은 NaN으로 유지 (검색 실패한 경우)
         
@@ -365,7 +377,7 @@ def main():
         
         # 쇼핑몰 필터
         st.markdown("#### 🏪 쇼핑몰 선택")
-        mall_list = ["전체"] + sorted(df['쇼핑몰 제목'].unique().tolist())
+        mall_list = ["전체"] + sorted(df['쇼핑몰'].unique().tolist())
         mall_filter = st.selectbox("쇼핑몰 선택", mall_list, key="mall_filter", label_visibility="collapsed")
         
         # 검색어 필터
@@ -401,7 +413,7 @@ def main():
         mask &= ~df['무료배송']
     
     if mall_filter != "전체":
-        mask &= df['쇼핑몰 제목'] == mall_filter
+        mask &= df['쇼핑몰'] == mall_filter
     
     if search_query:
         mask &= df['핫딜몰 제품명'].str.contains(search_query, case=False, na=False)
@@ -576,7 +588,7 @@ def main():
                     
                     with col_btn3:
                         # 상품 정보
-                        st.caption(f"📅 {row['시간'].strftime('%Y-%m-%d %H:%M') if pd.notna(row['시간']) else '날짜 정보 없음'} | 🏪 {row['쇼핑몰 제목']}")
+                        st.caption(f"📅 {row['시간'].strftime('%Y-%m-%d %H:%M') if pd.notna(row['시간']) else '날짜 정보 없음'} | 🏪 {row['쇼핑몰']}")
                     
                     st.divider()  # 구분선
     
@@ -653,7 +665,7 @@ def main():
     with col_info2:
         st.markdown("### 🏪 쇼핑몰별 현황")
         if not filtered_df.empty:
-            mall_stats = filtered_df['쇼핑몰 제목'].value_counts().head(5)
+            mall_stats = filtered_df['쇼핑몰'].value_counts().head(5)
             for mall, count in mall_stats.items():
                 percentage = (count / len(filtered_df) * 100)
                 st.markdown(f"• **{mall}** - {count}개 ({percentage:.1f}%)")
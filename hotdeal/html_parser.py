@@ -0,0 +1,181 @@
+"""
+HTML 파싱 공통 모듈
+
+게시판 행과 링크 추출을 C 기반 파서(selectolax, lxml)로 처리하고,
+빠른 파서가 실패하면 BeautifulSoup(html.parser)로 다시 읽는다.
+구조는 config.py의 BOARD_LAYOUTS에 CSS와 XPath로 함께 적는다.
+"""
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import lxml.html
+from lxml import etree
+from bs4 import BeautifulSoup
+
+from config import BOARD_LAYOUTS, HTML_PARSER_CONFIG
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:  # 선택 의존성
+    SelectolaxParser = None
+
+logger = logging.getLogger(__name__)
+
+# 게시판 행 하나 (필드 이름 → 문자열, 찾지 못한 필드는 None)
+BoardRow = Dict[str, Optional[str]]
+
+
+class ParserBackend:
+    """파서 백엔드 인터페이스"""
+
+    name = 'base'
+
+    def parse(self, html: str) -> Any:
+        """문서 파싱 후 루트 노드 반환"""
+        raise NotImplementedError
+
+    def select(self, node: Any, css: str, xpath: str) -> List[Any]:
+        """노드 아래에서 셀렉터와 일치하는 노드 목록 (문서 순서)"""
+        raise NotImplementedError
+
+    def value(self, node: Any, attr: str) -> Optional[str]:
+        """노드의 텍스트(attr == 'text') 또는 속성 값"""
+        raise NotImplementedError
+
+    def board_rows(self, html: str, layout: Dict) -> Optional[List[BoardRow]]:
+        """게시판 행 추출 (게시판 컨테이너가 없으면 None)"""
+        root = self.parse(html)
+        if layout['board']:
+            boards = self.select(root, *layout['board'])
+            if len(boards) <= layout['board_index']:
+                return None
+            root = boards[layout['board_index']]
+
+        rows = []
+        for row in self.select(root, *layout['row']):
+            item = {}
+            for name, (css, xpath, attr) in layout['fields'].items():
+                found = self.select(row, css, xpath)
+                item[name] = self.value(found[0], attr) if found else None
+            rows.append(item)
+        return rows
+
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax (Modest 엔진) 백엔드"""
+
+    name = 'selectolax'
+
+    def parse(self, html: str) -> Any:
+        return SelectolaxParser(html)
+
+    def select(self, node: Any, css: str, xpath: str) -> List[Any]:
+        return node.css(css)
+
+    def value(self, node: Any, attr: str) -> Optional[str]:
+        if attr == 'text':
+            return node.text().strip()
+        return node.attributes.get(attr)
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """XPath 컴파일 결과 재사용"""
+    return etree.XPath(xpath)
+
+
+class LxmlBackend(ParserBackend):
+    """lxml (libxml2) 백엔드"""
+
+    name = 'lxml'
+
+    def parse(self, html: str) -> Any:
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # 인코딩 선언이 있는 문자열은 lxml이 거부하므로 바이트로 넘긴다
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+            return lxml.html.document_fromstring(html.encode('utf-8'), parser=parser)
+
+    def select(self, node: Any, css: str, xpath: str) -> List[Any]:
+        return _compile_xpath(xpath)(node)
+
+    def value(self, node: Any, attr: str) -> Optional[str]:
+        if attr == 'text':
+            return node.text_content().strip()
+        return node.get(attr)
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup (html.parser) 백엔드 - 호환용"""
+
+    name = 'bs4'
+
+    def parse(self, html: str) -> Any:
+        return BeautifulSoup(html, 'html.parser')
+
+    def select(self, node: Any, css: str, xpath: str) -> List[Any]:
+        return node.select(css)
+
+    def value(self, node: Any, attr: str) -> Optional[str]:
+        if attr == 'text':
+            return node.get_text().strip()
+        value = node.get(attr)
+        # class처럼 여러 값을 갖는 속성은 목록으로 돌아온다
+        return ' '.join(value) if isinstance(value, list) else value
+
+
+_BACKENDS = {
+    'selectolax': SelectolaxBackend,
+    'lxml': LxmlBackend,
+    'bs4': SoupBackend
+}
+
+_FALLBACK = SoupBackend()
+
+
+def available_backends() -> List[str]:
+    """사용 가능한 백엔드 이름 (빠른 순)"""
+    return [name for name in _BACKENDS if name != 'selectolax' or SelectolaxParser is not None]
+
+
+def get_backend(name: Optional[str] = None) -> ParserBackend:
+    """백엔드 반환 ('auto'면 설치된 것 중 가장 빠른 것, 없는 이름이면 BeautifulSoup)"""
+    name = name or HTML_PARSER_CONFIG['backend']
+    if name == 'auto':
+        name = available_backends()[0]
+    if name not in available_backends():
+        logger.warning(f"HTML 파서 백엔드 사용 불가: {name}, bs4로 대체")
+        return _FALLBACK
+    return _BACKENDS[name]()
+
+
+_default_backend: Optional[ParserBackend] = None
+
+
+def _get_default_backend() -> ParserBackend:
+    """설정에 따른 기본 백엔드 (처음 호출시 생성)"""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = get_backend()
+        logger.debug(f"HTML 파서 백엔드: {_default_backend.name}")
+    return _default_backend
+
+
+def parse_board_rows(html: str, source: str,
+                     backend: Optional[ParserBackend] = None) -> Optional[List[BoardRow]]:
+    """게시판 HTML에서 행 목록 추출 (게시판이 없으면 None, 빠른 파서가 실패하면 BeautifulSoup으로 재시도)"""
+    layout = BOARD_LAYOUTS[source]
+    backend = backend or _get_default_backend()
+    try:
+        rows = backend.board_rows(html, layout)
+    except Exception as e:
+        logger.debug(f"게시판 파싱 실패 ({backend.name}): {e}")
+        rows = None
+
+    # 깨진 HTML은 파서마다 트리가 달라질 수 있으므로 게시판을 못 찾으면 html.parser로 한 번 더 확인
+    if rows is None and backend.name != _FALLBACK.name:
+        rows = _FALLBACK.board_rows(html, layout)
+    return rows
+
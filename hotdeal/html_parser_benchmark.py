@@ -0,0 +1,83 @@
+"""
+HTML 파서 백엔드 벤치마크 - 저장해 둔 게시판 HTML로 측정
+
+benchmark_html/ 아래 <출처>_board*.html (BOARD_LAYOUTS의 출처, 현재 cafe)을
+백엔드별로 반복 파싱해 페이지당 시간과 추출 결과 일치 여부를 출력한다.
+함께 넣어 둔 페이지는 BOARD_LAYOUTS 구조로 만든 합성 HTML이라 실제 페이지와 크기·구조가 다를 수 있어,
+결과는 백엔드 간 상대 비교로만 본다. 실제 페이지를 같은 이름 규칙으로 저장해 두면 함께 측정된다.
+
+    python html_parser_benchmark.py --repeat 100
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from config import BOARD_LAYOUTS
+from html_parser import available_backends, get_backend
+
+DEFAULT_HTML_DIR = Path(__file__).parent / 'benchmark_html'
+
+
+def load_pages(html_dir: Path) -> Dict[str, List[str]]:
+    """출처별 저장된 게시판 HTML 목록"""
+    pages = {}
+    for source in BOARD_LAYOUTS:
+        files = sorted(html_dir.glob(f'{source}_board*.html'))
+        if files:
+            pages[source] = [file.read_text(encoding='utf-8') for file in files]
+    return pages
+
+
+def measure(backend_name: str, source: str, pages: List[str], repeat: int) -> Dict:
+    """한 백엔드로 저장된 페이지들을 repeat번 파싱한 시간 측정"""
+    backend = get_backend(backend_name)
+    layout = BOARD_LAYOUTS[source]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            rows = backend.board_rows(html, layout)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'ms_per_page': elapsed * 1000 / (repeat * len(pages)),
+        'total': elapsed,
+        'rows': [backend.board_rows(html, layout) for html in pages],
+        'row_count': len(rows or [])
+    }
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--repeat', type=int, default=100, help='페이지별 반복 파싱 횟수')
+    parser.add_argument('--dir', type=Path, default=DEFAULT_HTML_DIR, help='저장된 게시판 HTML 폴더')
+    args = parser.parse_args()
+
+    pages = load_pages(args.dir)
+    if not pages:
+        print(f"❌ 저장된 게시판 HTML이 없습니다: {args.dir}")
+        return
+
+    backends = available_backends()
+    print(f"🚀 HTML 파서 벤치마크 (백엔드: {', '.join(backends)}, 반복: {args.repeat}회)")
+    print("=" * 60)
+
+    for source, source_pages in pages.items():
+        size_kb = sum(len(html.encode('utf-8')) for html in source_pages) / 1024 / len(source_pages)
+        print(f"\n📄 {source}: {len(source_pages)}페이지 (평균 {size_kb:.0f}KB)")
+
+        results = {name: measure(name, source, source_pages, args.repeat) for name in backends}
+        baseline = results['bs4']
+        for name, result in results.items():
+            speedup = baseline['ms_per_page'] / result['ms_per_page']
+            same = '✅' if result['rows'] == baseline['rows'] else '❌ bs4와 결과 다름'
+            print(f"  {name:<11} {result['ms_per_page']:7.2f}ms/페이지  "
+                  f"x{speedup:4.1f}  행 {result['row_count']}개  {same}")
+
+    print("\n✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+공용 HTTP 클라이언트 - requests 기반
+
+브라우저 없이 받을 수 있는 페이지는 연결을 재사용하는 세션 하나로 받고,
+비동기 코드에서는 스레드로 넘겨 이벤트 루프를 막지 않는다.
+"""
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import HTTP_CONFIG
+
+
+def decode_html(content: bytes, encoding: Optional[str] = None) -> str:
+    """응답 본문 디코딩 (헤더 인코딩 → UTF-8 → CP949 순, 국내 사이트는 EUC-KR 페이지가 남아 있음)"""
+    # requests는 charset이 없는 text/html을 ISO-8859-1로 간주하므로 무시
+    for candidate in (encoding, 'utf-8', 'cp949'):
+        if not candidate or candidate.lower() == 'iso-8859-1':
+            continue
+        try:
+            return content.decode(candidate)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return content.decode('utf-8', errors='replace')
+
+
+class HttpClient:
+    """연결 풀을 공유하는 HTTP 클라이언트"""
+
+    def __init__(self, pool_size: Optional[int] = None, timeout: Optional[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.pool_size = pool_size or HTTP_CONFIG['pool_size']
+        self.timeout = timeout or HTTP_CONFIG['timeout']
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """세션 반환 (처음 호출시 생성)"""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(HTTP_CONFIG['headers'])
+                self._session = session
+            return self._session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청 - 동기"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self._get_session().get(url, **kwargs)
+
+    async def fetch(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청 - 비동기 (작업 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get, url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """HEAD 요청 - 동기"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self._get_session().head(url, **kwargs)
+
+    async def fetch_head(self, url: str, **kwargs) -> requests.Response:
+        """HEAD 요청 - 비동기 (작업 스레드에서 실행)"""
+        return await asyncio.to_thread(self.head, url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST 요청 - 동기"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self._get_session().post(url, **kwargs)
+
+    async def fetch_post(self, url: str, **kwargs) -> requests.Response:
+        """POST 요청 - 비동기 (작업 스레드에서 실행)"""
+        return await asyncio.to_thread(self.post, url, **kwargs)
+
+    def close(self) -> None:
+        """세션 종료"""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
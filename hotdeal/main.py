@@ -1,22 +1,18 @@
 """
 맘이베베 크롤러 메인 실행 파일 - Playwright 기반
 """
-import logging
 import sys
-import time
-import asyncio
-from pathlib import Path
-import pandas as pd
 
 # 로컬 모듈 import
 from config import FILES, CRAWLING_CONFIG
-from utils import (
-    setup_logging, load_search_info, save_search_info, save_results,
-    safe_sleep, get_current_timestamp
-)
+from utils import setup_logging, load_search_info, safe_sleep, run_async
+from browser_pool import BrowserPool
+from http_client import HttpClient
 from cafe_crawler import CafeCrawler
 from shopping_mall_crawler import ShoppingMallCrawler
 from naver_shopping_crawler import NaverShoppingCrawler
+from pipeline import DealPipeline
+from price_lookup import build_price_lookup
 
 
 class MomiBebeCrawler:
@@ -24,17 +20,25 @@ class MomiBebeCrawler:
     
     def __init__(self):
         self.logger = setup_logging()
+        # 프로세스 전체에서 공유하는 브라우저 풀 (사이클마다 Chromium을 새로 띄우지 않음)
+        self.browser_pool = BrowserPool()
+        self.http_client = HttpClient()
         self.cafe_crawler = None
         self.mall_crawler = None
         self.naver_crawler = None
     
     def setup_crawlers(self) -> bool:
-        """크롤러 인스턴스 설정"""
+        """크롤러 인스턴스 설정 (이미 설정된 경우 재사용)"""
+        if self.cafe_crawler and self.mall_crawler and self.naver_crawler:
+            return True
+        
         try:
-            # Playwright 기반 크롤러들 생성 (driver 파라미터는 None)
-            self.cafe_crawler = CafeCrawler(driver=None)
-            self.mall_crawler = ShoppingMallCrawler(driver=None)
-            self.naver_crawler = NaverShoppingCrawler(driver=None)
+            # Playwright 기반 크롤러들 생성 (driver 파라미터는 None, 브라우저는 공용 풀 사용)
+            self.cafe_crawler = CafeCrawler(driver=None, browser_pool=self.browser_pool,
+                                            http_client=self.http_client)
+            self.mall_crawler = ShoppingMallCrawler(driver=None, browser_pool=self.browser_pool,
+                                                    http_client=self.http_client)
+            self.naver_crawler = NaverShoppingCrawler(driver=None, browser_pool=self.browser_pool)
             
             self.logger.info("Playwright 기반 크롤러 설정 완료")
             return True
@@ -44,7 +48,11 @@ class MomiBebeCrawler:
             return False
     
     def run_single_cycle(self) -> bool:
-        """단일 크롤링 사이클 실행"""
+        """단일 크롤링 사이클 실행 - 동기 인터페이스"""
+        return run_async(self.run_single_cycle_async())
+    
+    async def run_single_cycle_async(self) -> bool:
+        """단일 크롤링 사이클 실행 - 모든 단계를 하나의 이벤트 루프에서 스트리밍 처리"""
         try:
             # 1. 검색 정보 로드
             last_search_num = load_search_info(FILES['search_info'])
@@ -54,44 +62,19 @@ class MomiBebeCrawler:
             
             self.logger.info(f"이전 검색 번호: {last_search_num}")
             
-            # 2. 카페 크롤링
-            self.logger.info("=== 네이버 카페 크롤링 시작 ===")
-            new_articles, current_max_num = self.cafe_crawler.crawl_new_articles(last_search_num)
+            # 2. 카페 → 쇼핑몰 상품명 → 네이버쇼핑 최저가 → 저장 (게시글 단위로 흘려보냄)
+            self.logger.info("=== 핫딜 파이프라인 시작 ===")
+            # 가격 조회 엔진: 커머스 API → 검색 페이지 HTTP → 브라우저 순 (PRICE_LOOKUP_CONFIG)
+            price_lookup = build_price_lookup(self.naver_crawler, self.http_client)
+            pipeline = DealPipeline(self.cafe_crawler, self.mall_crawler, self.naver_crawler,
+                                    price_lookup=price_lookup)
+            saved_count, current_max_num = await pipeline.run(last_search_num)
             
-            if not new_articles:
+            if not saved_count:
                 self.logger.info("새로운 게시글이 없습니다.")
                 return True
             
-            # 3. 검색 번호 업데이트
-            save_search_info(FILES['search_info'], current_max_num)
-            
-            # 4. DataFrame 생성
-            df = pd.DataFrame(new_articles)
-            
-            # 5. 쇼핑몰 상품명 추출
-            self.logger.info("=== 쇼핑몰 상품명 추출 시작 ===")
-            shopping_urls = df['쇼핑몰 주소'].tolist()
-            fallback_titles = df['보정 제품명'].tolist()
-            
-            mall_titles = self.mall_crawler.extract_titles_from_urls(shopping_urls, fallback_titles)
-            df['쇼핑몰 제목'] = mall_titles
-            
-            # 6. 네이버쇼핑 최저가 검색
-            self.logger.info("=== 네이버쇼핑 최저가 검색 시작 ===")
-            naver_results = self.naver_crawler.search_products_batch(mall_titles)
-            
-            # 네이버쇼핑 결과를 DataFrame에 추가
-            df['네이버 주소'] = [result['naver_link'] for result in naver_results]
-            df['네이버 번호'] = [result['catalog_id'] for result in naver_results]
-            df['네이버 제목'] = [result['product_name'] for result in naver_results]
-            df['네이버 가격'] = [result['price'] for result in naver_results]
-            df['네이버 배송료'] = [result['delivery_info'] for result in naver_results]
-            df['네이버 리뷰 개수'] = [result['review_count'] for result in naver_results]
-            
-            # 7. 결과 저장
-            save_results(FILES['results'], df)
-            
-            self.logger.info(f"크롤링 사이클 완료: {len(new_articles)}개 새 상품 처리")
+            self.logger.info(f"크롤링 사이클 완료: {saved_count}개 새 상품 처리 (최신 번호: {current_max_num})")
             return True
             
         except Exception as e:
@@ -133,6 +116,8 @@ class MomiBebeCrawler:
             except Exception as e:
                 self.logger.error(f"예상치 못한 오류: {e}")
                 safe_sleep(60)  # 1분 대기 후 재시도
+        
+        self.shutdown()
     
     def run_once(self):
         """단일 실행"""
@@ -157,6 +142,17 @@ class MomiBebeCrawler:
         except Exception as e:
             self.logger.error(f"단일 크롤링 중 오류: {e}")
             return False
+        
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """공용 브라우저 풀과 HTTP 클라이언트 종료"""
+        try:
+            run_async(self.browser_pool.close())
+        except Exception as e:
+            self.logger.error(f"브라우저 풀 종료 실패: {e}")
+        self.http_client.close()
 
 
 def main():
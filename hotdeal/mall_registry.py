@@ -0,0 +1,66 @@
+"""
+쇼핑몰 레지스트리
+
+URL의 호스트 접미사로 쇼핑몰을 판별하고(가장 긴 접미사 우선),
+표시명과 쇼핑몰별 설정을 SHOPPING_MALLS 한 곳에서 조회한다.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from config import SHOPPING_MALLS
+
+# 호스트 접미사 → 쇼핑몰 종류
+_HOST_SUFFIXES: Dict[str, str] = {
+    host: mall_type
+    for mall_type, mall in SHOPPING_MALLS.items()
+    for host in mall['hosts']
+}
+
+# URL 열에서 호스트만 뽑는 패턴 (스킴·사용자 정보 생략 가능)
+_HOST_PATTERN = r'^\s*(?:[A-Za-z][A-Za-z0-9+.\-]*://)?(?:[^/?#@\s]*@)?([^/?#:\s]+)'
+
+
+@lru_cache(maxsize=4096)
+def resolve_host(hostname: Optional[str]) -> Optional[str]:
+    """호스트명으로 쇼핑몰 종류 판별 (하위 도메인 포함, 가장 긴 접미사 우선)"""
+    if not hostname:
+        return None
+    labels = hostname.lower().rstrip('.').split('.')
+    for i in range(len(labels) - 1):
+        mall_type = _HOST_SUFFIXES.get('.'.join(labels[i:]))
+        if mall_type:
+            return mall_type
+    return None
+
+
+def detect_mall(url: str) -> Optional[str]:
+    """URL에서 쇼핑몰 종류 판별 (스킴이 없는 www.… 형태도 허용)"""
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url.strip() if '://' in url else f'//{url.strip()}')
+        return resolve_host(parts.hostname)
+    except ValueError:
+        return None
+
+
+def get_mall_setting(mall_type: Optional[str], key: str, default: Any = None) -> Any:
+    """쇼핑몰별 설정 조회 (모르는 쇼핑몰이거나 설정이 없으면 default)"""
+    return SHOPPING_MALLS.get(mall_type, {}).get(key, default)
+
+
+def mall_display_name(mall_type: Optional[str]) -> str:
+    """쇼핑몰 표시명 반환"""
+    return get_mall_setting(mall_type, 'name', '알 수 없음')
+
+
+def classify_urls(urls: pd.Series) -> pd.Series:
+    """URL 열 전체의 쇼핑몰 종류 판별 (고유 호스트만 판별 후 매핑, 모르면 None)"""
+    hosts = urls.astype('string').str.extract(_HOST_PATTERN, expand=False).str.lower()
+    unique_hosts = hosts.dropna().unique()
+    mall_types = {host: resolve_host(host) for host in unique_hosts}
+    result = hosts.map(mall_types).astype(object)
+    return result.where(result.notna(), None)
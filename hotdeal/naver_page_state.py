@@ -0,0 +1,161 @@
+"""
+네이버쇼핑 페이지 내장 상태(JSON) 추출
+
+검색 결과·가격비교 페이지는 화면을 그리는 데이터를 __NEXT_DATA__ 스크립트와
+Apollo 상태(window.__APOLLO_STATE__)에 담아 둔다. 한 번의 evaluate로 두 JSON을 받아
+상품명, 최저가, 리뷰 수, 판매처 수, 쇼핑몰별 가격 목록으로 바꾼다.
+구조가 페이지마다 달라 경로 대신 키 이름(NAVER_STATE_KEYS)으로 찾으며,
+클래스 이름이 바뀌어도 영향을 받지 않는다.
+브라우저 없이 받은 HTML은 read_page_state_html로 같은 형태의 원본을 만든다.
+"""
+import json
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from config import NAVER_STATE_KEYS
+
+# 페이지에서 내장 상태 JSON 문자열을 한 번에 읽는 스크립트
+PAGE_STATE_SCRIPT = """
+() => {
+    const next = document.getElementById('__NEXT_DATA__');
+    let apollo = null;
+    try {
+        apollo = window.__APOLLO_STATE__ ? JSON.stringify(window.__APOLLO_STATE__) : null;
+    } catch (e) {}
+    return {next: next ? next.textContent : null, apollo: apollo};
+}
+"""
+
+# HTML 안의 __NEXT_DATA__ 스크립트 (브라우저 없이 받은 페이지용)
+_NEXT_DATA_PATTERN = re.compile(r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S)
+
+# 상품명에 섞여 오는 강조 태그
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# 쇼핑몰별 가격 목록 최대 개수
+MAX_MALL_PRICES = 20
+
+
+def _first_value(node: Dict, keys: List[str]) -> Any:
+    """키 목록 중 값이 있는 첫 키의 값"""
+    for key in keys:
+        value = node.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """숫자 또는 '12,900원' 형태 문자열을 정수로 (숫자가 없으면 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        digits = re.sub(r'[^\d]', '', value)
+        return int(digits) if digits else None
+    return None
+
+
+def _format_delivery(value: Any) -> str:
+    """배송비 값을 표시 문자열로"""
+    if isinstance(value, str) and not value.strip().isdigit():
+        return value.strip()
+    fee = _to_int(value)
+    if fee is None:
+        return "배송비정보없음"
+    return "무료배송" if fee == 0 else f"배송비 {fee:,}원"
+
+
+def _walk(root: Any):
+    """JSON 트리의 모든 dict를 얕은 것부터 순회 (문자열로 들어 있는 JSON은 풀지 않음)"""
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            yield node
+            queue.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            queue.extend(value for value in node if isinstance(value, (dict, list)))
+
+
+def parse_page_state(states: List[Any], with_mall_prices: bool = False) -> Optional[Dict]:
+    """내장 상태 JSON 목록에서 상품 정보 추출 (상품을 찾지 못하면 None)
+
+    상품은 이름과 가격이 함께 있는 가장 얕은(검색 결과면 첫 번째) 객체로 본다.
+    with_mall_prices면(가격비교 상세 페이지) 쇼핑몰 이름과 가격이 있는 객체를 모아 최저가를 정한다.
+    catalog_id는 카탈로그 키가 있거나 판매처가 둘 이상인 상품 노드에서만 채운다(단일 판매처 상품은 None).
+    반환: {'product_name', 'price'(정수), 'review_count', 'mall_count', 'catalog_id'(없으면 None),
+           'mall_prices'([{'mall_name', 'price', 'delivery'}], 가격순)}
+    """
+    keys = NAVER_STATE_KEYS
+    product = None
+    review_count = None
+    mall_count = None
+    offers: Dict[tuple, Dict] = {}
+
+    for state in states:
+        for node in _walk(state):
+            price = _to_int(_first_value(node, keys['price']))
+            mall_name = _first_value(node, keys['mall_name'])
+
+            if with_mall_prices and isinstance(mall_name, str) and price:
+                # 쇼핑몰별 판매 정보
+                offer = (mall_name.strip(), price)
+                if offer not in offers:
+                    offers[offer] = {
+                        'mall_name': offer[0],
+                        'price': f"{price:,}원",
+                        'delivery': _format_delivery(_first_value(node, keys['delivery']))
+                    }
+
+            name = _first_value(node, keys['name'])
+            if product is None and isinstance(name, str) and price:
+                product = {'name': _TAG_PATTERN.sub('', name).strip(), 'price': price, 'node': node}
+
+            if review_count is None:
+                review_count = _to_int(_first_value(node, keys['review_count']))
+            if mall_count is None:
+                mall_count = _to_int(_first_value(node, keys['mall_count']))
+
+    if product is None:
+        return None
+
+    # 상품 노드에 있는 값이 있으면 우선 사용
+    node = product['node']
+    review_count = _to_int(_first_value(node, keys['review_count'])) or review_count
+    mall_count = _to_int(_first_value(node, keys['mall_count'])) or mall_count
+    catalog_id = _first_value(node, keys['catalog_id'])
+    if catalog_id is None and (_to_int(_first_value(node, keys['mall_count'])) or 0) > 1:
+        catalog_id = _first_value(node, keys['product_id'])
+
+    mall_prices = sorted(offers.values(), key=lambda offer: _to_int(offer['price']))[:MAX_MALL_PRICES]
+    lowest = _to_int(mall_prices[0]['price']) if mall_prices else product['price']
+    return {
+        'product_name': product['name'],
+        'price': lowest,
+        'review_count': review_count or 0,
+        'mall_count': mall_count or len(offers),
+        'catalog_id': str(catalog_id) if isinstance(catalog_id, (str, int)) else None,
+        'mall_prices': mall_prices
+    }
+
+
+def load_page_state(raw: Optional[Dict]) -> List[Any]:
+    """PAGE_STATE_SCRIPT 결과를 JSON 객체 목록으로 (깨진 JSON은 건너뜀)"""
+    states = []
+    for text in (raw or {}).values():
+        if not text:
+            continue
+        try:
+            states.append(json.loads(text))
+        except ValueError:
+            continue
+    return states
+
+
+def read_page_state_html(html: str) -> Dict[str, Optional[str]]:
+    """HTML에서 PAGE_STATE_SCRIPT 결과와 같은 형태의 원본 추출 (Apollo 상태는 스크립트 실행이 필요해 None)"""
+    found = _NEXT_DATA_PATTERN.search(html or '')
+    return {'next': found.group(1) if found else None, 'apollo': None}
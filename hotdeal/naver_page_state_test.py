@@ -0,0 +1,86 @@
+"""
+네이버쇼핑 내장 상태 추출 테스트 - 저장한 상태 JSON(naver_page_state_fixtures) 사용
+
+검색 결과 페이지와 가격비교(카탈로그) 페이지의 PAGE_STATE_SCRIPT 결과를 parse_page_state로 읽어
+상품명, 최저가, 리뷰 수, 판매처 수, 카탈로그 번호, 쇼핑몰별 가격 목록을 확인한다.
+브라우저 없이 받은 검색 페이지 HTML(read_page_state_html)도 같은 방식으로 확인한다.
+"""
+import json
+import sys
+from pathlib import Path
+
+from naver_page_state import load_page_state, parse_page_state, read_page_state_html
+
+FIXTURES_DIR = Path(__file__).parent / 'naver_page_state_fixtures'
+HTML_FIXTURES_DIR = Path(__file__).parent / 'price_lookup_fixtures'
+
+# (설명, 원본 파일, 쇼핑몰별 가격 포함 여부, 예상 결과)
+TEST_CASES = [
+    ("검색 결과 (가격비교 묶음이 첫 상품)", FIXTURES_DIR / 'search_state.json', False, {
+        'product_name': "페리오 토탈7 치약 100g",
+        'price': 2480,
+        'review_count': 5321,
+        'mall_count': 87,
+        'catalog_id': "21745530118",
+        'mall_prices': []
+    }),
+    ("가격비교 상세 (Apollo 상태의 판매처, 중복 제거·가격순)", FIXTURES_DIR / 'catalog_state.json', True, {
+        'product_name': "페리오 토탈7 치약 100g",
+        'price': 2480,
+        'review_count': 5321,
+        'mall_count': 87,
+        'catalog_id': "21745530118",
+        'mall_prices': [
+            {'mall_name': "쿠팡", 'price': "2,480원", 'delivery': "무료배송"},
+            {'mall_name': "G마켓", 'price': "2,550원", 'delivery': "무료배송"},
+            {'mall_name': "11번가", 'price': "2,590원", 'delivery': "배송비 3,000원"},
+            {'mall_name': "LG생활건강 공식스토어", 'price': "2,700원", 'delivery': "3만원 이상 무료"}
+        ]
+    }),
+    ("검색 페이지 HTML (단일 판매처 상품, 카탈로그 아님)", HTML_FIXTURES_DIR / 'search_logitech.html', False, {
+        'product_name': "로지텍 MX Master 3S 무선 마우스 그라파이트",
+        'price': 129000,
+        'review_count': 834,
+        'mall_count': 0,
+        'catalog_id': None,
+        'mall_prices': []
+    }),
+]
+
+
+def load_fixture(path: Path) -> list:
+    """저장한 원본을 parse_page_state 입력으로 (.json은 PAGE_STATE_SCRIPT 결과, .html은 페이지)"""
+    text = path.read_text(encoding='utf-8')
+    raw = read_page_state_html(text) if path.suffix == '.html' else json.loads(text)
+    return load_page_state(raw)
+
+
+def run_tests() -> int:
+    """표의 경우를 모두 확인하고 실패 건수 반환"""
+    failures = 0
+    for description, path, with_mall_prices, expected in TEST_CASES:
+        state = parse_page_state(load_fixture(path), with_mall_prices)
+        mismatched = [key for key in expected if state is None or state.get(key) != expected[key]]
+        failures += bool(mismatched)
+        print(f"{'✅' if not mismatched else '❌'} {description} ({path.name})")
+        if state is None:
+            print("    상품을 찾지 못함")
+            continue
+        print(f"    {state['product_name']}, {state['price']:,}원, 리뷰 {state['review_count']}, "
+              f"판매처 {state['mall_count']}, 카탈로그 {state['catalog_id']}, 쇼핑몰 가격 {len(state['mall_prices'])}건")
+        for key in mismatched:
+            print(f"    {key}: {state.get(key)!r} (예상: {expected[key]!r})")
+    return failures
+
+
+def main():
+    """메인 실행"""
+    print("🚀 내장 상태 추출 테스트 시작")
+    print("=" * 60)
+    failures = run_tests()
+    print(f"\n{'✅ 테스트 완료' if not failures else f'❌ 실패 {failures}건'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,80 +1,83 @@
 """
 네이버쇼핑 크롤러 - Playwright 기반 개선된 버전
+
+검색 방식은 두 가지다.
+- direct: 쇼핑 검색 결과(가격비교) 주소로 바로 이동
+- humanized: 네이버 메인에서 검색어를 입력하고 쇼핑 → 가격비교 탭을 차례로 누름
+
+direct에서 접속 제한이 감지되면 정해진 횟수만큼 humanized로 검색한 뒤 다시 direct를 시도한다.
+방식별 소요 시간과 성공률은 브라우저 종료시 로그로 남긴다.
+
+결과 페이지의 정보는 내장 상태 JSON(naver_page_state)에서 한 번에 읽고,
+찾지 못한 경우에만 셀렉터를 차례로 시도한다.
 """
 import asyncio
 import random
+import re
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote, urljoin
-from playwright.async_api import async_playwright
 import logging
 from bs4 import BeautifulSoup
 
-from config import NAVER_SHOPPING_CONFIG, CRAWLING_CONFIG
-from utils import safe_sleep, retry_on_failure
+from config import (NAVER_SHOPPING_CONFIG, NAVER_WORKER_CONFIG, NAVER_QUARANTINE_CONFIG,
+                    PAGE_WAIT_CONFIG, PACING_CONFIG)
+from utils import safe_sleep, retry_on_failure, run_async
+from browser_pool import BrowserPool
+from page_waits import wait_for_any_selector
+from naver_page_state import PAGE_STATE_SCRIPT, load_page_state, parse_page_state
+from concurrency_controller import AimdController
+from query_normalizer import SimilarQueryIndex
+
+# 검색 방식
+SEARCH_DIRECT = 'direct'
+SEARCH_HUMANIZED = 'humanized'
+
+# 주소 직접 이동 검색 결과
+SEARCH_OK = 'ok'
+SEARCH_BLOCKED = 'blocked'
+SEARCH_FAILED = 'failed'
+
+# 접속 제한 페이지 문구
+BLOCK_MARKERS = re.compile('접속이 일시적으로 제한|잠시 후 다시 확인해주세요|자동 프로그램 접속 차단|보안문자')
 
 
 class NaverShoppingCrawler:
     """네이버쇼핑 크롤러 - Playwright 기반 개선된 버전"""
     
-    def __init__(self, driver=None):
+    def __init__(self, driver=None, browser_pool: Optional[BrowserPool] = None):
         # 기존 Selenium driver는 무시하고 Playwright 사용
         self.logger = logging.getLogger(__name__)
-        self.browser = None
+        # 공용 풀을 받지 못하면 자체 풀을 만들고 종료 시 함께 닫는다
+        self.browser_pool = browser_pool or BrowserPool()
+        self._owns_pool = browser_pool is None
         self.context = None
         self.page = None
-        self.playwright = None
+        # 검색 방식 (접속 제한 후 humanized로 남은 검색 횟수가 있으면 그 방식 우선)
+        self.search_mode = NAVER_SHOPPING_CONFIG['search_mode']
+        self._fallback_remaining = 0
+        self.mode_stats = {mode: {'attempts': 0, 'successes': 0, 'seconds': 0.0}
+                           for mode in (SEARCH_DIRECT, SEARCH_HUMANIZED)}
+        # 정보 추출 방식별 건수 (내장 상태 JSON / 셀렉터)
+        self.extraction_stats = {'state': 0, 'selectors': 0}
+        # 접속 제한·검증 페이지 감지 횟수
+        self.block_count = 0
+        # 마지막 검색이 차단으로 결과를 얻지 못했는지 여부 (동시 검색 작업자가 격리 판단에 사용)
+        self.last_search_blocked = False
+        self._attempt_blocked = False
+        # 검증 페이지에서 사람이 풀 때까지 대기할지 여부 (동시 검색 작업자는 대기하지 않음)
+        self.manual_verification = True
+        # 검증 페이지 사건 진행 중 여부 (사건마다 스크린샷 한 번)
+        self._verification_incident = False
+        # 최근 검색어 → 결과 (동시 검색 작업자가 비슷한 검색어 결과 재사용, 배치가 바뀌어도 유지)
+        self.query_index = SimilarQueryIndex()
         
     async def setup_browser(self) -> bool:
-        """브라우저 설정"""
+        """공용 풀에서 브라우저 컨텍스트 대여"""
         try:
-            if not self.playwright:
-                self.playwright = await async_playwright().start()
-            
-            # 더 강화된 봇 감지 우회 설정
-            self.browser = await self.playwright.chromium.launch(
-                headless=False,  # 검증 페이지 확인을 위해 헤드리스 비활성화
-                args=[
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-extensions',
-                    '--disable-default-apps',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                ]
-            )
-            
-            self.context = await self.browser.new_context(
-                viewport={'width': 1366, 'height': 768},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='ko-KR',
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-            )
-            
+            self.context = await self.browser_pool.new_context('naver')
             self.page = await self.context.new_page()
             
-            # 강화된 webdriver 탐지 방지
-            await self.page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
-                window.chrome = {runtime: {}};
-                Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})});
-            """)
-            
             self.logger.info("Playwright 브라우저 설정 완료")
             return True
             
@@ -83,21 +86,45 @@ class NaverShoppingCrawler:
             return False
     
     async def close_browser(self):
-        """브라우저 종료"""
+        """브라우저 컨텍스트 반납 (자체 풀인 경우 브라우저까지 종료)"""
         try:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            self.log_mode_stats()
+            await self.browser_pool.release_context(self.context)
+            self.context = None
+            self.page = None
+            if self._owns_pool:
+                await self.browser_pool.close()
             self.logger.info("Playwright 브라우저 종료 완료")
         except Exception as e:
             self.logger.error(f"브라우저 종료 실패: {e}")
     
+    async def reset_context(self):
+        """컨텍스트만 반납하고 다음 검색에서 새 컨텍스트 사용 (검증 페이지에 걸린 쿠키·세션 폐기)"""
+        try:
+            await self.browser_pool.release_context(self.context)
+        except Exception as e:
+            self.logger.debug(f"컨텍스트 반납 실패: {e}")
+        self.context = None
+        self.page = None
+        self._verification_incident = False
+    
     def _random_delay(self, min_seconds=2, max_seconds=5):
         """랜덤 지연"""
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
     
+    async def _human_pause(self):
+        """화면 조작 사이 임의 지연 (로드 대기와 별개)"""
+        await asyncio.sleep(random.uniform(*PACING_CONFIG['naver_human_delay']))
+    
+    async def _wait_for_page(self, page_type: str) -> bool:
+        """페이지 종류별 요소가 나타날 때까지 대기 (기한 초과시 False)"""
+        wait = PAGE_WAIT_CONFIG[page_type]
+        found = await wait_for_any_selector(self.page, wait['selectors'], wait['timeout'])
+        if found is None:
+            self.logger.debug(f"대기 셀렉터 미발견, 기한 초과 후 진행 ({page_type})")
+        return found is not None
+    
     async def _simulate_human_behavior(self):
         """인간의 행동 모방"""
         try:
@@ -115,8 +142,50 @@ class NaverShoppingCrawler:
         except:
             pass
     
+    async def _is_blocked(self) -> bool:
+        """현재 페이지가 접속 제한 페이지인지 확인"""
+        try:
+            return bool(BLOCK_MARKERS.search(await self.page.content()))
+        except Exception as e:
+            self.logger.debug(f"접속 제한 확인 실패: {e}")
+            return False
+    
+    async def search_product_by_url(self, product_name: str) -> str:
+        """검색 결과 주소로 바로 이동해 상품 검색 - SEARCH_OK / SEARCH_BLOCKED / SEARCH_FAILED
+
+        direct_search_urls를 차례로 열어 상품 목록이 나타나는 첫 주소를 사용한다.
+        """
+        try:
+            self.logger.info(f"네이버쇼핑 주소 검색: {product_name}")
+            
+            if not self.page:
+                if not await self.setup_browser():
+                    return SEARCH_FAILED
+            
+            query = quote(product_name)
+            for template in NAVER_SHOPPING_CONFIG['direct_search_urls']:
+                url = template.format(query=query)
+                await self.page.goto(url, wait_until='domcontentloaded',
+                                     referer=NAVER_SHOPPING_CONFIG['base_url'])
+                found = await self._wait_for_page('naver_products')
+                
+                if await self._is_blocked():
+                    self.logger.warning(f"네이버쇼핑 접속 제한 감지 (주소 검색): {self.page.url}")
+                    self._record_block()
+                    return SEARCH_BLOCKED
+                if found:
+                    self.logger.info(f"검색 결과 페이지: {self.page.url}")
+                    return SEARCH_OK
+            
+            self.logger.info(f"주소 검색 결과 없음: {product_name}")
+            return SEARCH_FAILED
+            
+        except Exception as e:
+            self.logger.error(f"주소 검색 실패 ({product_name}): {e}")
+            return SEARCH_FAILED
+    
     async def search_product_direct_url(self, product_name: str) -> bool:
-        """네이버 쇼핑에서 자연스럽게 상품 검색"""
+        """네이버 쇼핑에서 자연스럽게 상품 검색 (humanized 방식)"""
         try:
             self.logger.info(f"네이버쇼핑 검색: {product_name}")
             
@@ -130,8 +199,8 @@ class NaverShoppingCrawler:
             print(f"🌐 네이버 메인 접속: {main_url}")
             self.logger.info(f"접속 시도: {main_url}")
             
-            await self.page.goto(main_url)
-            await asyncio.sleep(random.uniform(3, 5))
+            await self.page.goto(main_url, wait_until='domcontentloaded')
+            await self._wait_for_page('naver_main')
             
             current_url = self.page.url
             print(f"✅ 네이버 메인 접속 완료: {current_url}")
@@ -141,7 +210,7 @@ class NaverShoppingCrawler:
             await self._simulate_human_behavior()
             
             # 3. 네이버 메인에서 검색어 입력
-            await asyncio.sleep(random.uniform(2, 4))
+            await self._human_pause()
             
             # 네이버 메인 검색창 찾기
             main_search_selectors = [
@@ -177,12 +246,7 @@ class NaverShoppingCrawler:
                         await search_input.press('Enter')
                         
                         # 검색 결과 대기
-                        try:
-                            await self.page.wait_for_load_state('networkidle', timeout=15000)
-                        except:
-                            await asyncio.sleep(3)
-                        
-                        await asyncio.sleep(random.uniform(2, 4))
+                        await self._wait_for_page('naver_results')
                         
                         current_url = self.page.url
                         print(f"✅ 네이버 통합검색 결과: {current_url}")
@@ -202,7 +266,7 @@ class NaverShoppingCrawler:
                 return False
             
             # 4. 쇼핑 탭 클릭
-            await asyncio.sleep(random.uniform(2, 4))
+            await self._human_pause()
             
             shopping_tab_selectors = [
                 'a[href*="shopping.naver.com"]',
@@ -223,7 +287,7 @@ class NaverShoppingCrawler:
                                 self.logger.info(f"쇼핑 탭 발견: {tab_text}")
                                 
                                 await shopping_tab.click()
-                                await asyncio.sleep(random.uniform(3, 5))
+                                await self._wait_for_page('naver_products')
                                 
                                 current_url = self.page.url
                                 print(f"✅ 쇼핑 탭 이동 완료: {current_url}")
@@ -233,6 +297,7 @@ class NaverShoppingCrawler:
                                 page_content = await self.page.content()
                                 if "잠시 후 다시 확인해주세요" in page_content or "접속이 일시적으로 제한" in page_content:
                                     print("🚫 쇼핑 탭 접속 제한 감지!")
+                                    self._record_block()
                                     continue
                                 
                                 shopping_clicked = True
@@ -252,7 +317,7 @@ class NaverShoppingCrawler:
                 self.logger.info("쇼핑 탭 없음, 통합검색 결과 사용")
             
             # 5. 가격비교 탭으로 이동 (있으면)
-            await asyncio.sleep(2)
+            await self._human_pause()
             
             try:
                 # 가격비교 탭 셀렉터들
@@ -272,7 +337,7 @@ class NaverShoppingCrawler:
                             self.logger.info(f"가격비교 탭 발견: {compare_href}")
                             
                             await price_compare_tab.click()
-                            await asyncio.sleep(random.uniform(3, 5))
+                            await self._wait_for_page('naver_products')
                             
                             current_url = self.page.url
                             print(f"✅ 가격비교 페이지: {current_url}")
@@ -299,6 +364,7 @@ class NaverShoppingCrawler:
             
             # 검증 페이지 확인
             if await self._check_verification_page():
+                self._record_block()
                 print("🤖 네이버 검증 페이지 감지!")
                 print("📋 가능한 해결 방법:")
                 print("   1. 브라우저에서 수동으로 검증 완료")
@@ -306,7 +372,7 @@ class NaverShoppingCrawler:
                 print("   3. 잠시 기다린 후 다시 시도")
                 
                 # 수동 검증 대기
-                if await self._wait_for_manual_verification():
+                if self.manual_verification and await self._wait_for_manual_verification():
                     print("✅ 검증 완료, 계속 진행")
                     current_url = self.page.url
                     print(f"🔍 검증 후 페이지: {current_url}")
@@ -318,6 +384,7 @@ class NaverShoppingCrawler:
             if "접속이 일시적으로 제한" in page_content or "잠시 후 다시 확인해주세요" in page_content:
                 print("🚫 네이버 쇼핑 접속 제한 감지!")
                 self.logger.error("네이버 쇼핑 접속 제한 감지")
+                self._record_block()
                 return False
             
             print("✅ 검색 완료, 페이지 로드 성공")
@@ -338,6 +405,7 @@ class NaverShoppingCrawler:
             page_content = await self.page.content()
             if "접속이 일시적으로 제한" in page_content:
                 self.logger.error("네이버 쇼핑 접속 제한 감지")
+                self._record_block()
                 return self._create_no_data_result("접속 제한")
             
             # 현재 URL 저장
@@ -364,29 +432,35 @@ class NaverShoppingCrawler:
             first_product = await self.page.query_selector('.basicList_item__2XT81:first-child a, .product_item:first-child a, .basicList_link__1MaTN')
             if first_product:
                 await first_product.click()
-                await self.page.wait_for_load_state('networkidle')
-                await asyncio.sleep(3)
+                await self._wait_for_page('naver_catalog')
                 self.logger.info("첫 번째 상품 클릭 완료")
             
-            # 상품명 추출
-            product_name = await self._extract_product_name()
-            
-            # 쇼핑몰별 가격 리스트 추출
-            mall_prices = await self._extract_all_mall_prices()
-            
-            # 최저가 계산
-            min_price = "가격 정보 없음"
-            if mall_prices:
-                prices = []
-                for mall_info in mall_prices:
-                    price_str = mall_info.get('price', '0').replace(',', '').replace('원', '')
-                    if price_str.isdigit():
-                        prices.append(int(price_str))
-                if prices:
-                    min_price = f"{min(prices):,}원"
-            
-            # 전체 리뷰 수 추출
-            review_count = await self._extract_review_count()
+            state = await self._read_page_state(with_mall_prices=True)
+            if state:
+                product_name = state['product_name']
+                mall_prices = state['mall_prices']
+                min_price = f"{state['price']:,}원"
+                review_count = str(state['review_count'])
+            else:
+                # 상품명 추출
+                product_name = await self._extract_product_name()
+                
+                # 쇼핑몰별 가격 리스트 추출
+                mall_prices = await self._extract_all_mall_prices()
+                
+                # 최저가 계산
+                min_price = "가격 정보 없음"
+                if mall_prices:
+                    prices = []
+                    for mall_info in mall_prices:
+                        price_str = mall_info.get('price', '0').replace(',', '').replace('원', '')
+                        if price_str.isdigit():
+                            prices.append(int(price_str))
+                    if prices:
+                        min_price = f"{min(prices):,}원"
+                
+                # 전체 리뷰 수 추출
+                review_count = await self._extract_review_count()
             
             result = {
                 'naver_link': self.page.url,
@@ -531,17 +605,24 @@ class NaverShoppingCrawler:
 
     async def _extract_basic_product_info(self, current_url: str) -> Dict:
         """일반 검색 결과에서 기본 정보 추출"""
-        # 제품명 추출
-        product_name = await self._extract_product_name()
-        
-        # 가격 정보 추출
-        price = await self._extract_price()
-        
-        # 리뷰 수 추출
-        review_count = await self._extract_review_count()
-        
-        # 추가 정보 추출
-        shop_count = await self._extract_shop_count()
+        state = await self._read_page_state()
+        if state:
+            product_name = state['product_name']
+            price = f"{state['price']:,}원"
+            review_count = str(state['review_count'])
+            shop_count = str(state['mall_count'])
+        else:
+            # 제품명 추출
+            product_name = await self._extract_product_name()
+            
+            # 가격 정보 추출
+            price = await self._extract_price()
+            
+            # 리뷰 수 추출
+            review_count = await self._extract_review_count()
+            
+            # 추가 정보 추출
+            shop_count = await self._extract_shop_count()
         
         result = {
             'naver_link': current_url,
@@ -556,6 +637,20 @@ class NaverShoppingCrawler:
         self.logger.info(f"기본 정보 추출 완료 - 상품명: {product_name[:30]}..., 가격: {price}, 리뷰: {review_count}")
         return result
     
+    async def _read_page_state(self, with_mall_prices: bool = False) -> Optional[Dict]:
+        """내장 상태 JSON에서 상품 정보 추출 - evaluate 한 번 (찾지 못하면 None, 셀렉터 방식 사용)"""
+        try:
+            raw = await self.page.evaluate(PAGE_STATE_SCRIPT)
+            state = parse_page_state(load_page_state(raw), with_mall_prices)
+        except Exception as e:
+            self.logger.debug(f"내장 상태 추출 실패: {e}")
+            state = None
+        
+        self.extraction_stats['state' if state else 'selectors'] += 1
+        if state is None:
+            self.logger.info("내장 상태 JSON 없음, 셀렉터로 추출")
+        return state
+    
     async def _extract_product_name(self) -> str:
         """상품명 추출 - 가격비교 페이지 최적화"""
         # 가격비교 페이지 전용 셀렉터들
@@ -703,71 +798,107 @@ class NaverShoppingCrawler:
     
     def search_products_batch(self, product_names: List[str]) -> List[Dict]:
         """상품 목록 일괄 검색 - 동기 인터페이스"""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # 이미 실행 중인 이벤트 루프가 있는 경우
-                import nest_asyncio
-                nest_asyncio.apply()
-                return asyncio.run(self._search_products_batch_async(product_names))
-            else:
-                return asyncio.run(self._search_products_batch_async(product_names))
-        except RuntimeError:
-            # 새로운 이벤트 루프 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self._search_products_batch_async(product_names))
-            finally:
-                loop.close()
+        return run_async(self._search_products_batch_async(product_names))
     
     async def _search_products_batch_async(self, product_names: List[str]) -> List[Dict]:
-        """상품 목록 일괄 검색 - 비동기 구현"""
+        """상품 목록 일괄 검색 - 비동기 구현 (NaverSearchWorkers로 동시 검색, 결과는 입력 순서)"""
         self.logger.info(f"네이버쇼핑 일괄 검색 시작: {len(product_names)}개")
         
         if not product_names:
             return []
         
-        results = []
+        workers = NaverSearchWorkers(self)
+        try:
+            results = await asyncio.gather(
+                *(workers.search_product_async(product_name) for product_name in product_names),
+                return_exceptions=True)
+        finally:
+            await workers.close_browser()
         
+        failed = [i for i, result in enumerate(results) if isinstance(result, BaseException)]
+        for i in failed:
+            self.logger.error(f"일괄 검색 실패 ({product_names[i]}): {results[i]}")
+            results[i] = self._create_no_data_result("일괄 검색 실패")
+        
+        self.logger.info("네이버쇼핑 일괄 검색 완료")
+        return results
+    
+    async def search_product_async(self, product_name: str) -> Dict:
+        """단일 상품 검색 및 정보 추출 - 비동기 (direct에서 접속 제한시 humanized로 재검색)"""
+        self.last_search_blocked = False
         try:
-            # 브라우저 설정
-            if not await self.setup_browser():
-                return [self._create_no_data_result("브라우저 설정 실패") for _ in product_names]
-            
-            for i, product_name in enumerate(product_names):
-                self.logger.info(f"진행률: {i+1}/{len(product_names)} - {product_name}")
+            if self._current_search_mode() == SEARCH_DIRECT:
+                result = await self._search_with_mode(SEARCH_DIRECT, product_name)
+                if result is not None:
+                    return result
                 
-                try:
-                    # 상품 검색
-                    if await self.search_product_direct_url(product_name):
-                        result = await self.get_price_comparison_info_v2()
-                        if result:
-                            results.append(result)
-                        else:
-                            results.append(self._create_no_data_result("정보 추출 실패"))
-                    else:
-                        results.append(self._create_no_data_result("검색 실패"))
-                    
-                    # 요청 간 지연
-                    if i < len(product_names) - 1:
-                        await asyncio.sleep(CRAWLING_CONFIG.get('sleep_between_requests', 3))
-                        
-                except Exception as e:
-                    self.logger.error(f"상품 처리 실패 ({product_name}): {e}")
-                    results.append(self._create_no_data_result("처리 실패"))
+                self._fallback_remaining = NAVER_SHOPPING_CONFIG['fallback_searches']
+                self.logger.warning(
+                    f"주소 검색 접속 제한 - 다음 {self._fallback_remaining}건은 humanized 방식으로 검색")
+            else:
+                self._fallback_remaining = max(self._fallback_remaining - 1, 0)
+            
+            return await self._search_with_mode(SEARCH_HUMANIZED, product_name)
             
         except Exception as e:
-            self.logger.error(f"일괄 검색 실패: {e}")
-            # 남은 상품들에 대해 실패 결과 추가
-            while len(results) < len(product_names):
-                results.append(self._create_no_data_result("일괄 검색 실패"))
+            self.logger.error(f"상품 처리 실패 ({product_name}): {e}")
+            return self._create_no_data_result("처리 실패")
+    
+    def _record_block(self) -> None:
+        """접속 제한·검증 페이지 감지 기록 (현재 검색 시도에도 표시)"""
+        self.block_count += 1
+        self._attempt_blocked = True
+    
+    def _current_search_mode(self) -> str:
+        """이번 검색에 쓸 방식 (접속 제한 후 남은 횟수 동안은 humanized)"""
+        if self.search_mode == SEARCH_DIRECT and self._fallback_remaining > 0:
+            return SEARCH_HUMANIZED
+        return self.search_mode
+    
+    async def _search_with_mode(self, mode: str, product_name: str) -> Optional[Dict]:
+        """한 방식으로 검색 및 정보 추출, 방식별 소요 시간·성공 집계 (direct가 접속 제한이면 None)
+
+        검색 도중 차단이 감지됐고 쓸 수 있는 결과도 얻지 못했으면 last_search_blocked를 True로 둔다.
+        """
+        start = time.perf_counter()
+        result = None
+        self._attempt_blocked = False
+        try:
+            if mode == SEARCH_DIRECT:
+                status = await self.search_product_by_url(product_name)
+                if status == SEARCH_BLOCKED:
+                    return None
+                found = status == SEARCH_OK
+            else:
+                found = await self.search_product_direct_url(product_name)
+            
+            if found:
+                result = await self.get_price_comparison_info_v2()
+                if not result:
+                    result = self._create_no_data_result("정보 추출 실패")
+            else:
+                result = self._create_no_data_result("검색 실패")
+            return result
         
         finally:
-            await self.close_browser()
-        
-        self.logger.info("네이버쇼핑 일괄 검색 완료")
-        return results
+            stats = self.mode_stats[mode]
+            stats['attempts'] += 1
+            stats['seconds'] += time.perf_counter() - start
+            usable = result is not None and not str(result['naver_link']).startswith('검색실패_')
+            if usable:
+                stats['successes'] += 1
+            self.last_search_blocked = self._attempt_blocked and not usable
+    
+    def log_mode_stats(self) -> None:
+        """검색 방식별 평균 소요 시간·성공률과 정보 추출 방식별 건수 로그"""
+        for mode, stats in self.mode_stats.items():
+            if stats['attempts']:
+                self.logger.info(
+                    f"네이버쇼핑 검색 ({mode}): {stats['successes']}/{stats['attempts']}건 성공, "
+                    f"평균 {stats['seconds'] / stats['attempts']:.1f}초")
+        if any(self.extraction_stats.values()):
+            self.logger.info(f"네이버쇼핑 정보 추출: 내장 상태 {self.extraction_stats['state']}건, "
+                             f"셀렉터 {self.extraction_stats['selectors']}건")
     
     def _create_no_data_result(self, reason: str) -> Dict:
         """데이터 없음 결과 생성"""
@@ -801,6 +932,11 @@ class NaverShoppingCrawler:
             
             for pattern in verification_patterns:
                 if pattern in page_content.lower():
+                    # 같은 사건(검증 페이지가 풀리기 전)에서는 로그와 스크린샷을 한 번만 남김
+                    if self._verification_incident:
+                        return True
+                    self._verification_incident = True
+                    
                     print(f"🚫 네이버 검증 페이지 감지: {pattern}")
                     print(f"🔍 현재 URL: {current_url}")
                     self.logger.warning(f"검증 페이지 감지: {pattern}")
@@ -811,7 +947,8 @@ class NaverShoppingCrawler:
                     print(f"📸 검증 페이지 스크린샷 저장: {screenshot_path}")
                     
                     return True
-                    
+            
+            self._verification_incident = False
             return False
             
         except Exception as e:
@@ -827,9 +964,6 @@ class NaverShoppingCrawler:
             start_time = time.time()
             
             while time.time() - start_time < timeout_seconds:
-                current_url = self.page.url
-                page_content = await self.page.content()
-                
                 # 검증이 완료되었는지 확인
                 if not await self._check_verification_page():
                     print("✅ 수동 검증 완료!")
@@ -843,4 +977,142 @@ class NaverShoppingCrawler:
             
         except Exception as e:
             print(f"❌ 수동 검증 대기 실패: {e}")
-            return False 
\ No newline at end of file
+            return False
+
+
+class NaverSearchWorkers:
+    """네이버쇼핑 동시 검색 작업자 - 작업자마다 별도 브라우저 컨텍스트, AIMD로 동시 검색 수 조절
+
+    NaverShoppingCrawler와 같은 search_product_async/close_browser/browser_pool을 제공한다.
+    작업자는 검증 페이지에서 사람을 기다리지 않고, 차단이 감지되면 컨트롤러가 동시 검색 수를 줄인다.
+    차단된 상품은 격리해 다른 검색을 막지 않은 채 대기 시간 뒤 새 컨텍스트로 다시 검색한다.
+    정규화한 검색어가 최근 검색어(진행 중인 검색 포함)와 같거나 비슷하면 검색하지 않고 그 결과를 쓴다.
+    """
+    
+    def __init__(self, crawler: NaverShoppingCrawler, max_workers: Optional[int] = None,
+                 controller: Optional[AimdController] = None):
+        self.logger = logging.getLogger(__name__)
+        self.crawler = crawler
+        self.browser_pool = crawler.browser_pool
+        self.max_workers = max_workers or NAVER_WORKER_CONFIG['max_workers']
+        self.controller = controller or AimdController(
+            self.max_workers,
+            initial=NAVER_WORKER_CONFIG['initial'],
+            increase=NAVER_WORKER_CONFIG['increase'],
+            decrease_factor=NAVER_WORKER_CONFIG['decrease_factor'],
+            pause=NAVER_WORKER_CONFIG['block_pause'])
+        
+        # 첫 작업자는 받은 크롤러, 나머지는 같은 브라우저 풀에서 컨텍스트를 따로 빌리는 크롤러
+        self.workers = [crawler] + [NaverShoppingCrawler(browser_pool=self.browser_pool)
+                                    for _ in range(self.max_workers - 1)]
+        self._manual_verification = crawler.manual_verification
+        for worker in self.workers:
+            worker.manual_verification = False
+        self._idle: Optional[asyncio.Queue] = None
+        self._next_start: Dict[int, float] = {}
+        # 격리된 상품 → 재검색 예정 시각 (이벤트 루프 시간)
+        self.quarantined: Dict[str, float] = {}
+        self.quarantine_stats = {'quarantined': 0, 'recovered': 0, 'given_up': 0}
+        # 받은 크롤러의 검색어 색인 (크롤러를 다시 쓰면 이전 배치 결과도 재사용)
+        self.query_index = crawler.query_index
+        self.reuse_stats = {'in_batch': 0, 'previous': 0}
+    
+    def _get_idle(self) -> asyncio.Queue:
+        """쉬고 있는 작업자 큐 (처음 호출시 생성)"""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for worker in self.workers:
+                self._idle.put_nowait(worker)
+        return self._idle
+    
+    async def search_product_async(self, product_name: str) -> Dict:
+        """상품 검색 - 같거나 비슷한 검색어의 결과가 있으면(진행 중이면 끝나기를 기다려) 재사용"""
+        result, reuse, matched = await self.query_index.get_or_search(
+            product_name, self.search_with_quarantine,
+            lambda found: not str(found['naver_link']).startswith('검색실패_'))
+        if reuse is None:
+            return result
+        self.reuse_stats[reuse] += 1
+        self.logger.debug(f"검색 결과 재사용: {product_name} → {matched}")
+        return dict(result)
+    
+    async def search_with_quarantine(self, product_name: str) -> Dict:
+        """상품 검색 - 차단되면 격리 후 대기 시간(회차마다 두 배)이 지나면 다시 검색
+
+        격리 중에는 실행 자리와 작업자를 반납하므로 다른 상품 검색은 계속 진행된다.
+        """
+        retries = NAVER_QUARANTINE_CONFIG['max_retries']
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = NAVER_QUARANTINE_CONFIG['cooldown'] * 2 ** (attempt - 1)
+                loop = asyncio.get_running_loop()
+                self.quarantined[product_name] = loop.time() + delay
+                self.quarantine_stats['quarantined'] += 1
+                self.logger.warning(f"검색 격리 ({attempt}/{retries}): {product_name} - {delay:.0f}초 후 재검색 "
+                                    f"(격리 중 {len(self.quarantined)}건)")
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    self.quarantined.pop(product_name, None)
+            
+            result, blocked = await self._search_once(product_name)
+            if not blocked:
+                if attempt:
+                    self.quarantine_stats['recovered'] += 1
+                    self.logger.info(f"격리 상품 재검색 성공: {product_name}")
+                return result
+        
+        self.quarantine_stats['given_up'] += 1
+        self.logger.error(f"격리 상품 재검색 포기: {product_name}")
+        return result
+    
+    async def _search_once(self, product_name: str) -> Tuple[Dict, bool]:
+        """한도 안에서 쉬고 있는 작업자로 한 번 검색 - (결과, 차단 여부)
+
+        작업자별로 PACING_CONFIG['naver'] 간격을 유지하고, 차단된 작업자는 컨텍스트를 새로 받는다.
+        """
+        async with self.controller.slot():
+            worker = await self._get_idle().get()
+            loop = asyncio.get_running_loop()
+            try:
+                delay = self._next_start.get(id(worker), 0) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                
+                result = await worker.search_product_async(product_name)
+                blocked = worker.last_search_blocked
+                if blocked:
+                    self.controller.record_block()
+                    await worker.reset_context()
+                else:
+                    self.controller.record_success()
+                return result, blocked
+            
+            finally:
+                self._next_start[id(worker)] = loop.time() + PACING_CONFIG['naver']
+                self._idle.put_nowait(worker)
+    
+    def log_metrics(self) -> None:
+        """동시 검색 한도와 차단율 로그"""
+        metrics = self.controller.metrics()
+        if metrics['attempts']:
+            self.logger.info(
+                f"네이버쇼핑 동시 검색: 한도 {metrics['limit']}/{self.max_workers}, "
+                f"시도 {metrics['attempts']}건, 차단 {metrics['blocks']}건 "
+                f"(최근 차단율 {metrics['block_rate']:.0%})")
+        if self.quarantine_stats['quarantined']:
+            self.logger.info(
+                f"검색 격리: {self.quarantine_stats['quarantined']}회, 재검색 성공 {self.quarantine_stats['recovered']}건, "
+                f"포기 {self.quarantine_stats['given_up']}건")
+        if any(self.reuse_stats.values()):
+            self.logger.info(
+                f"검색 결과 재사용: 배치 안 중복 {self.reuse_stats['in_batch']}건, "
+                f"이전 검색 {self.reuse_stats['previous']}건 (색인 {len(self.query_index)}건)")
+    
+    async def close_browser(self):
+        """작업자 컨텍스트 반납 (받은 크롤러는 마지막에 닫음)"""
+        self.log_metrics()
+        for worker in self.workers[1:]:
+            await worker.close_browser()
+        self.crawler.manual_verification = self._manual_verification
+        await self.crawler.close_browser()
@@ -0,0 +1,89 @@
+"""
+페이지 풀 - Playwright 기반
+
+컨텍스트 하나에서 최대 size개의 페이지를 필요할 때 열어 빌려주고,
+돌려받을 때 about:blank로 초기화한다. 초기화에 실패한 페이지는
+브라우저를 다시 띄우지 않고 그 페이지만 닫고 새로 연다.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+from playwright.async_api import BrowserContext, Page
+
+# 반납 페이지 초기화 제한 시간 (밀리초)
+_RESET_TIMEOUT = 5000
+
+
+class PagePool:
+    """페이지를 빌려주고 초기화해 돌려받는 풀 (동시에 빌릴 수 있는 수는 size개)"""
+
+    def __init__(self, context: BrowserContext, size: int):
+        self.logger = logging.getLogger(__name__)
+        self.context = context
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._pages: List[Page] = []
+        # 열었거나 여는 중인 페이지 수 (new_page를 기다리는 동안에도 자리를 차지해 size를 넘지 않게 함)
+        self._slots = 0
+        self.replaced_count = 0
+
+    async def acquire(self) -> Page:
+        """페이지 대여 (남는 페이지가 없으면 size개까지 새로 열고, 그 이상은 반납을 기다림)"""
+        if self._idle.empty() and self._slots < self.size:
+            self._slots += 1
+            try:
+                page = await self.context.new_page()
+            except Exception:
+                self._slots -= 1
+                raise
+            self._pages.append(page)
+            return page
+
+        page = await self._idle.get()
+        if page.is_closed():
+            page = await self._replace(page)
+        return page
+
+    async def release(self, page: Page) -> None:
+        """페이지 반납 (about:blank로 초기화, 실패하면 새 페이지로 교체)"""
+        try:
+            if page.is_closed():
+                raise RuntimeError("이미 닫힌 페이지")
+            await page.goto('about:blank', timeout=_RESET_TIMEOUT)
+        except Exception as e:
+            self.logger.warning(f"페이지 초기화 실패, 새 페이지로 교체: {e}")
+            try:
+                page = await self._replace(page)
+            except Exception as e:
+                # 컨텍스트가 닫힌 경우 등 - 자리만 비워 두면 다음 대여 때 다시 연다
+                self.logger.error(f"페이지 교체 실패: {e}")
+                return
+        self._idle.put_nowait(page)
+
+    async def _replace(self, page: Page) -> Page:
+        """망가진 페이지를 닫고 같은 컨텍스트에 새 페이지를 연다"""
+        if page in self._pages:
+            self._pages.remove(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+        try:
+            new_page = await self.context.new_page()
+        except Exception:
+            self._slots -= 1
+            raise
+        self._pages.append(new_page)
+        self.replaced_count += 1
+        return new_page
+
+    @asynccontextmanager
+    async def borrow(self) -> AsyncIterator[Page]:
+        """페이지를 빌렸다가 블록이 끝나면 초기화해 반납"""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
@@ -0,0 +1,77 @@
+"""
+페이지 로드 대기 전략
+
+고정 sleep 대신 페이지 종류별 셀렉터 목록을 동시에 기다렸다가
+하나라도 나타나면 바로 진행하고, 정해진 기한이 지나면 포기한다.
+"""
+import asyncio
+import logging
+import time
+from typing import List, Optional, Union
+from playwright.async_api import Page, Frame
+
+logger = logging.getLogger(__name__)
+
+
+def to_locator(selector: str) -> str:
+    """XPath면 xpath= 접두어를 붙여 Playwright 셀렉터로 변환"""
+    if selector.startswith('/') or selector.startswith('('):
+        return f'xpath={selector}'
+    return selector
+
+
+async def wait_for_any_selector(target: Union[Page, Frame], selectors: List[str],
+                                timeout: float, state: str = 'attached') -> Optional[int]:
+    """셀렉터들을 동시에 기다려 가장 먼저 나타난 셀렉터의 인덱스 반환 (기한 초과시 None)"""
+    if not selectors or timeout <= 0:
+        return None
+
+    tasks = {
+        asyncio.create_task(target.wait_for_selector(to_locator(selector), state=state,
+                                                     timeout=timeout * 1000)): index
+        for index, selector in enumerate(selectors)
+    }
+    deadline = time.monotonic() + timeout
+    pending = set(tasks)
+
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # 개별 대기는 시간 초과/프레임 분리 등으로 실패할 수 있음 - 나머지를 계속 기다림
+                if not task.cancelled() and task.exception() is None:
+                    return tasks[task]
+        return None
+
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def wait_for_frame(page: Page, frame_selector: str, timeout: float) -> Optional[Frame]:
+    """iframe 요소가 나타날 때까지 기다려 프레임 반환 (기한 초과시 None)"""
+    try:
+        element = await page.wait_for_selector(frame_selector, state='attached', timeout=timeout * 1000)
+        return await element.content_frame() if element else None
+    except Exception as e:
+        logger.debug(f"프레임 대기 실패 ({frame_selector}): {e}")
+        return None
+
+
+async def wait_for_frame_content(page: Page, frame_selector: str, selectors: List[str],
+                                 timeout: float) -> Optional[int]:
+    """iframe과 그 안의 셀렉터 중 하나가 나타날 때까지 하나의 기한 안에서 대기"""
+    started = time.monotonic()
+    frame = await wait_for_frame(page, frame_selector, timeout)
+    if frame is None:
+        return None
+
+    remaining = timeout - (time.monotonic() - started)
+    return await wait_for_any_selector(frame, selectors, remaining)
@@ -0,0 +1,287 @@
+"""
+핫딜 스트리밍 파이프라인
+
+카페 게시글 → 쇼핑몰 상품명 → 네이버쇼핑 최저가 단계를 크기 제한 큐로 연결해,
+게시글 하나가 발견되는 즉시 다음 단계로 흘려보내고 완료된 행은 바로 대기 파일(JSONL)에 추가한다.
+대기 파일은 실행이 끝날 때 results.xlsx로 한 번에 내보낸다 (행마다 엑셀 전체를 다시 쓰지 않도록).
+게시글별 단계 완료는 진행 기록(progress_log)에 남겨, 중간에 멈춰도 다음 실행에서 남은 단계만 처리한다.
+쇼핑몰 주소는 단축 링크를 풀고 정규화(url_canonicalizer)한 뒤 조회하며,
+쇼핑몰 상품명과 네이버쇼핑 결과는 결과 캐시(result_cache)에서 먼저 찾고, 없을 때만 조회한다.
+네이버쇼핑 가격은 가격 조회 엔진(price_lookup)을 비용이 적은 순서로 시도한다.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from config import FILES, PIPELINE_CONFIG, QUERY_NORMALIZER_CONFIG
+from utils import append_result_rows, export_pending_results, save_search_info
+from cafe_crawler import CafeCrawler
+from shopping_mall_crawler import ShoppingMallCrawler, FAILED_TITLE_MARKERS
+from naver_shopping_crawler import NaverShoppingCrawler
+from price_lookup import PriceLookupCascade, build_price_lookup, is_found
+from progress_log import ProgressLog, STAGE_LISTED, STAGE_LINK, STAGE_TITLE, STAGE_NAVER, STAGE_SAVED
+from result_cache import ResultCache, LAYER_MALL_TITLE, LAYER_NAVER_RESULT, naver_query_key
+from url_canonicalizer import UrlCanonicalizer, product_key
+
+# 네이버쇼핑 결과 키 → 결과 파일 컬럼
+NAVER_RESULT_COLUMNS = {
+    '네이버 주소': 'naver_link',
+    '네이버 번호': 'catalog_id',
+    '네이버 제목': 'product_name',
+    '네이버 가격': 'price',
+    '네이버 배송료': 'delivery_info',
+    '네이버 리뷰 개수': 'review_count'
+}
+
+# 단계 종료 신호
+_END = None
+
+
+class DealPipeline:
+    """카페 → 쇼핑몰 → 네이버쇼핑 스트리밍 파이프라인"""
+
+    def __init__(self, cafe_crawler: CafeCrawler, mall_crawler: ShoppingMallCrawler,
+                 naver_crawler: NaverShoppingCrawler, queue_size: Optional[int] = None,
+                 progress_log: Optional[ProgressLog] = None, result_cache: Optional[ResultCache] = None,
+                 url_canonicalizer: Optional[UrlCanonicalizer] = None,
+                 price_lookup: Optional[PriceLookupCascade] = None):
+        self.logger = logging.getLogger(__name__)
+        self.cafe_crawler = cafe_crawler
+        self.mall_crawler = mall_crawler
+        self.naver_crawler = naver_crawler
+        self.price_lookup = price_lookup or build_price_lookup(naver_crawler, mall_crawler.http_client)
+        self.progress = progress_log or ProgressLog()
+        self.cache = result_cache or ResultCache()
+        self.canonicalizer = url_canonicalizer or UrlCanonicalizer(mall_crawler.http_client, self.cache)
+
+        size = queue_size or PIPELINE_CONFIG['queue_size']
+        self.mall_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.naver_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.save_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+
+        self._naver_warmup: Optional[asyncio.Task] = None
+        self.saved_count = 0
+
+    async def run(self, last_search_num: int) -> Tuple[int, int]:
+        """파이프라인 실행 - (저장된 행 수, 최신 게시글 번호) 반환"""
+        # 이전 실행의 진행 기록 복원 (검색 번호 이하로 저장까지 끝난 게시글은 정리)
+        self.progress.load()
+        self.progress.compact(last_search_num)
+        resumed = self.progress.pending()
+        self.cache.purge_expired()
+        # 이전 실행이 내보내지 못한 행 먼저 저장
+        await self._export_results()
+        # 지난 실행의 검색 결과로 유사 검색어 색인 채우기
+        self.price_lookup.seed(self.cache.items(LAYER_NAVER_RESULT, QUERY_NORMALIZER_CONFIG['max_entries']))
+
+        stages = [
+            asyncio.create_task(self._cafe_stage(last_search_num, resumed)),
+            asyncio.create_task(self._mall_stage()),
+            asyncio.create_task(self._naver_stage()),
+            asyncio.create_task(self._save_stage())
+        ]
+
+        try:
+            current_max_num, _, _, _ = await asyncio.gather(*stages)
+        except Exception:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
+        finally:
+            if self._naver_warmup is not None:
+                await asyncio.gather(self._naver_warmup, return_exceptions=True)
+            self.progress.close()
+            await self._export_results()
+            self.canonicalizer.log_stats()
+            self.logger.info(f"결과 캐시 적중: {self.cache.summary()}")
+            self.cache.close()
+
+        return self.saved_count, current_max_num
+
+    async def _on_listed(self, article_info: Dict) -> None:
+        """게시판에서 새 게시글을 찾으면 진행 기록에 남김"""
+        self.progress.record(article_info['matching_number'], STAGE_LISTED, article=article_info)
+
+    async def _on_article(self, row: Dict) -> None:
+        """카페에서 발견한 게시글을 쇼핑몰 단계로 전달"""
+        if not self.progress.has_stage(row['게시글 id'], STAGE_LINK):
+            self.progress.record(row['게시글 id'], STAGE_LINK, row=row)
+
+        if self._naver_warmup is None:
+            # 첫 게시글이 나오면 네이버쇼핑용 브라우저를 미리 실행
+            self._naver_warmup = asyncio.create_task(self.price_lookup.warm_up())
+        await self.mall_queue.put(row)
+
+    async def _resume_article(self, entry: Dict) -> None:
+        """이전 실행에서 끝나지 않은 게시글을 남은 단계부터 다시 흘려보냄"""
+        self.logger.info(f"미완료 게시글 재개: {entry['id']} (완료 단계: {', '.join(entry['stages'])})")
+        if STAGE_LINK in entry['stages']:
+            row = dict(entry['row'])
+        else:
+            article_info = entry['article']
+            link = await self.cafe_crawler._fetch_article_link(article_info['article_url'])
+            row = self.cafe_crawler.build_article_row(article_info, link)
+        await self._on_article(row)
+
+    async def _cafe_stage(self, last_search_num: int, resumed: List[Dict]) -> int:
+        """카페 게시글 수집 단계 (미완료 게시글을 먼저 보내고 새 게시글 수집)"""
+        try:
+            for entry in resumed:
+                await self._resume_article(entry)
+        except Exception:
+            await self.cafe_crawler.close_browser()
+            raise
+
+        # 진행 기록에 있는 게시글은 게시판에서 다시 나와도 건너뜀
+        new_articles, current_max_num = await self.cafe_crawler._crawl_new_articles_async(
+            last_search_num, on_article=self._on_article, on_listed=self._on_listed,
+            skip_numbers=self.progress.known_ids())
+
+        # 게시판을 검색 번호까지 다 훑었으므로 그 사이 게시글은 모두 기록됨 - 기록된 번호까지 검색 번호를 올림
+        current_max_num = max([current_max_num, *self.progress.known_ids()])
+        if current_max_num > last_search_num:
+            save_search_info(FILES['search_info'], current_max_num)
+
+        # 종료 신호는 정상 완료시에만 보냄 (실패시에는 run()이 모든 단계를 취소)
+        await self.mall_queue.put(_END)
+        return current_max_num
+
+    async def _mall_stage(self) -> None:
+        """쇼핑몰 상품명 추출 단계 (여러 건을 동시에 처리하되 순서대로 전달)"""
+        in_flight = deque()
+        try:
+            while True:
+                row = await self.mall_queue.get()
+                if row is _END:
+                    break
+
+                # 이전 실행에서 상품명까지 구한 게시글은 그대로 전달
+                task = None
+                if not self.progress.has_stage(row['게시글 id'], STAGE_TITLE):
+                    task = asyncio.create_task(self._lookup_mall_title(row))
+                in_flight.append((row, task))
+
+                # 동시 처리 한도만큼 쌓이면 가장 오래된 건부터 전달
+                if len(in_flight) >= self.mall_crawler.max_pages:
+                    await self._forward_mall_result(*in_flight.popleft())
+
+            while in_flight:
+                await self._forward_mall_result(*in_flight.popleft())
+            await self.naver_queue.put(_END)
+        finally:
+            for _, task in in_flight:
+                if task is not None:
+                    task.cancel()
+            await self.mall_crawler.close_browser()
+
+    async def _lookup_mall_title(self, row: Dict) -> str:
+        """쇼핑몰 상품명 - 캐시에 없을 때만 정규 주소로 쇼핑몰 페이지 조회 (대체 제목은 캐시하지 않음)"""
+        url = await self.canonicalizer.canonicalize(row['쇼핑몰 주소'])
+        key = product_key(url)
+        title = self.cache.get(LAYER_MALL_TITLE, key)
+        if title is not None:
+            return title
+
+        title = await self.mall_crawler.extract_title_concurrent_async(url, row['보정 제품명'])
+        if title != row['보정 제품명'] and title not in FAILED_TITLE_MARKERS:
+            self.cache.put(LAYER_MALL_TITLE, key, title)
+        return title
+
+    async def _forward_mall_result(self, row: Dict, task: Optional[asyncio.Task]) -> None:
+        """쇼핑몰 상품명 결과를 네이버쇼핑 단계로 전달"""
+        if task is not None:
+            row['쇼핑몰 제목'] = await task
+            self.progress.record(row['게시글 id'], STAGE_TITLE, row={'쇼핑몰 제목': row['쇼핑몰 제목']})
+        await self.naver_queue.put(row)
+
+    async def _naver_stage(self) -> None:
+        """네이버쇼핑 최저가 검색 단계 (가격 조회 엔진으로 여러 건을 처리하고 끝난 순서대로 전달)
+
+        차단으로 격리된 검색은 몇 분 뒤에 끝나므로, 순서를 지키면 뒤의 행이 모두 기다리게 된다.
+        """
+        in_flight: Dict[asyncio.Task, Dict] = {}
+        try:
+            while True:
+                row = await self.naver_queue.get()
+                if row is _END:
+                    break
+
+                # 이전 실행에서 검색까지 끝낸 게시글은 저장만 함
+                if self.progress.has_stage(row['게시글 id'], STAGE_NAVER):
+                    await self.save_queue.put(row)
+                    continue
+
+                task = asyncio.create_task(self._lookup_naver_result(row['쇼핑몰 제목']))
+                in_flight[task] = row
+
+                # 검색 중인 건(격리 제외)이 동시 조회 수만큼 쌓이면 먼저 끝난 건부터 전달
+                while len(in_flight) - self.price_lookup.waiting >= self.price_lookup.max_concurrency:
+                    await self._forward_naver_results(in_flight)
+
+            while in_flight:
+                await self._forward_naver_results(in_flight)
+            await self.save_queue.put(_END)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await self.price_lookup.close()
+
+    async def _lookup_naver_result(self, query: str) -> Dict:
+        """네이버쇼핑 결과 - 캐시에 없을 때만 검색 (검색 실패 결과는 다음에 다시 검색하도록 캐시하지 않음)"""
+        key = naver_query_key(query)
+        result = self.cache.get(LAYER_NAVER_RESULT, key)
+        if result is not None:
+            return result
+
+        result = await self.price_lookup.lookup(query)
+        if is_found(result):
+            self.cache.put(LAYER_NAVER_RESULT, key, result)
+        return result
+
+    async def _forward_naver_results(self, in_flight: Dict[asyncio.Task, Dict]) -> None:
+        """끝난 네이버쇼핑 검색 결과를 저장 단계로 전달 (격리 여부를 다시 보도록 최대 1초 대기)"""
+        done, _ = await asyncio.wait(in_flight, timeout=1, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            row = in_flight.pop(task)
+            result = task.result()
+            naver_row = {column: result[key] for column, key in NAVER_RESULT_COLUMNS.items()}
+            row.update(naver_row)
+            self.progress.record(row['게시글 id'], STAGE_NAVER, row=naver_row)
+            await self.save_queue.put(row)
+
+    async def _save_stage(self) -> None:
+        """완료된 행 저장 단계 (행 단위로 대기 파일에 즉시 추가)
+
+        저장과 저장 완료 기록은 한 묶음이라, 다른 단계 실패로 취소돼도 진행 중인 저장을 마친 뒤 취소된다.
+        """
+        while True:
+            row = await self.save_queue.get()
+            if row is _END:
+                break
+
+            save = asyncio.ensure_future(self._save_row(row))
+            try:
+                await asyncio.shield(save)
+            except asyncio.CancelledError:
+                await asyncio.gather(save, return_exceptions=True)
+                raise
+
+    async def _save_row(self, row: Dict) -> None:
+        """행 저장 후 저장 완료 기록 (저장에 실패하면 기록하지 않고 예외 전달 - 다음 실행에서 다시 저장)"""
+        # 파일 쓰기는 동기 I/O라 별도 스레드에서 실행
+        await asyncio.to_thread(append_result_rows, FILES['results_pending'], [row])
+        self.progress.record(row['게시글 id'], STAGE_SAVED)
+        self.saved_count += 1
+        self.logger.info(f"결과 저장: {row['게시글 id']} - {row['쇼핑몰 제목']}")
+
+    async def _export_results(self) -> None:
+        """대기 파일의 행을 결과 파일로 내보냄 (실패하면 대기 파일을 남겨 다음 실행에서 다시 시도)"""
+        try:
+            exported = await asyncio.to_thread(export_pending_results, FILES['results_pending'], FILES['results'])
+        except Exception as e:
+            self.logger.error(f"결과 파일 내보내기 실패 (다음 실행에서 다시 시도): {e}")
+            return
+        if exported:
+            self.logger.info(f"결과 파일 저장: {exported}행 → {FILES['results']}")
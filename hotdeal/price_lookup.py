@@ -0,0 +1,392 @@
+"""
+네이버쇼핑 가격 조회 엔진
+
+검색어 하나의 최저가 정보를 세 가지 방식으로 조회할 수 있다.
+- api: 네이버 커머스 API 카탈로그(product-models) 조회 (수십 ms)
+- http: 검색 결과 페이지를 브라우저 없이 받아 내장 상태 JSON 읽기 (1초 안팎)
+- browser: Playwright 검색 (NaverSearchWorkers, 건당 수십 초)
+
+PriceLookupCascade는 PRICE_LOOKUP_CONFIG['backends'] 순서(비용이 적은 순)로 시도하고,
+앞 엔진이 찾지 못하면(None 또는 검색실패_ 결과) 다음 엔진으로 넘어간다.
+같거나 비슷한 검색어(query_normalizer)의 결과는 엔진을 고르기 전에 재사용해 API 할당량과 요청 간격을 아낀다.
+결과는 NaverShoppingCrawler와 같은 형태의 dict다.
+"""
+import asyncio
+import base64
+import logging
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+from config import NAVER_SHOPPING_CONFIG, PRICE_LOOKUP_CONFIG
+from http_client import HttpClient, decode_html
+from naver_page_state import load_page_state, parse_page_state, read_page_state_html
+from naver_shopping_crawler import BLOCK_MARKERS, NaverShoppingCrawler, NaverSearchWorkers
+from query_normalizer import SimilarQueryIndex
+from rate_limiter import HostRateLimiter
+
+try:
+    import bcrypt
+except ImportError:  # 선택 의존성 (커머스 API 전자서명)
+    bcrypt = None
+
+logger = logging.getLogger(__name__)
+
+# 접속 제한으로 보는 검색 페이지 응답 상태 코드 (차단, 요청 과다)
+BLOCK_STATUS_CODES = frozenset({403, 429})
+
+
+def is_found(result: Optional[Dict]) -> bool:
+    """가격 조회 성공 여부 (None이나 검색실패_ 결과면 False)"""
+    return result is not None and not str(result['naver_link']).startswith('검색실패_')
+
+
+def no_data_result(reason: str) -> Dict:
+    """데이터 없음 결과 (NaverShoppingCrawler._create_no_data_result와 같은 형태)"""
+    return {
+        'naver_link': f"검색실패_{reason}",
+        'catalog_id': "ID_없음",
+        'product_name': "상품명_없음",
+        'price': "가격_없음",
+        'delivery_info': "배송정보_없음",
+        'review_count': "0"
+    }
+
+
+def _state_result(state: Dict, link: str) -> Dict:
+    """parse_page_state 결과를 가격 조회 결과로 (카탈로그 번호가 있으면 가격비교 주소, 없으면 link 사용)"""
+    catalog_id = state['catalog_id']
+    if catalog_id:
+        link = PRICE_LOOKUP_CONFIG['catalog_url'].format(catalog_id=catalog_id)
+
+    mall_prices = state['mall_prices']
+    if mall_prices:
+        delivery_info = f"가격비교 상세 (총 {len(mall_prices)}개 쇼핑몰)"
+    elif state['mall_count']:
+        delivery_info = f"일반 검색 결과 (판매처: {state['mall_count']}개)"
+    else:
+        delivery_info = "일반 검색 결과"
+
+    return {
+        'naver_link': link,
+        'catalog_id': catalog_id or "ID_없음",
+        'product_name': state['product_name'],
+        'price': f"{state['price']:,}원",
+        'delivery_info': delivery_info,
+        'review_count': str(state['review_count']),
+        'mall_prices': mall_prices
+    }
+
+
+class PriceLookupBackend:
+    """가격 조회 엔진 인터페이스"""
+
+    name = 'base'
+    concurrency = 1  # 동시에 처리할 수 있는 조회 수
+    self_limited = False  # 엔진 안에서 동시 실행 수를 직접 제한하면 True (PriceLookupCascade 세마포어 생략)
+
+    async def lookup(self, query: str) -> Optional[Dict]:
+        """검색어의 가격 정보 (찾지 못하면 None 또는 검색실패_ 결과)"""
+        raise NotImplementedError
+
+    @property
+    def waiting(self) -> int:
+        """차단 등으로 오래 기다리는 조회 수 (동시 처리 수 계산에서 제외)"""
+        return 0
+
+    async def warm_up(self) -> None:
+        """첫 조회 전 준비 (브라우저 실행 등)"""
+
+    async def close(self) -> None:
+        """자원 정리"""
+
+
+class CommerceApiLookup(PriceLookupBackend):
+    """네이버 커머스 API 카탈로그 조회 (가격 필드가 없는 카탈로그는 찾지 못한 것으로 봄)"""
+
+    name = 'api'
+
+    def __init__(self, http_client: HttpClient, settings: Optional[Dict] = None):
+        self.logger = logging.getLogger(__name__)
+        self.http_client = http_client
+        self.settings = settings or PRICE_LOOKUP_CONFIG['api']
+        self.base_url = self.settings['base_url'].rstrip('/')
+        self.concurrency = self.settings['concurrency']
+        self._token: Optional[str] = None
+        self._token_expires = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    def unavailable_reason(settings: Optional[Dict] = None) -> Optional[str]:
+        """사용할 수 없는 이유 (사용할 수 있으면 None)"""
+        settings = settings or PRICE_LOOKUP_CONFIG['api']
+        if not (settings['client_id'] and settings['client_secret']):
+            return "인증 정보 없음 (NAVER_COMMERCE_CLIENT_ID, NAVER_COMMERCE_CLIENT_SECRET)"
+        if bcrypt is None:
+            return "bcrypt 미설치"
+        return None
+
+    def _sign(self, timestamp: int) -> str:
+        """전자서명 ('클라이언트 ID_타임스탬프'를 시크릿으로 bcrypt 해싱 후 base64)"""
+        password = f"{self.settings['client_id']}_{timestamp}".encode('utf-8')
+        hashed = bcrypt.hashpw(password, self.settings['client_secret'].encode('utf-8'))
+        return base64.b64encode(hashed).decode('utf-8')
+
+    async def _get_token(self) -> str:
+        """접근 토큰 (만료 1분 전까지 재사용, 동시에 요청해도 한 번만 발급)"""
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            if self._token and time.time() < self._token_expires - 60:
+                return self._token
+
+            timestamp = int(time.time() * 1000)
+            response = await self.http_client.fetch_post(
+                f"{self.base_url}/external/v1/oauth2/token",
+                data={
+                    'client_id': self.settings['client_id'],
+                    'timestamp': timestamp,
+                    'client_secret_sign': await asyncio.to_thread(self._sign, timestamp),
+                    'grant_type': 'client_credentials',
+                    'type': 'SELF'
+                },
+                headers={'Accept': 'application/json'},
+                timeout=self.settings['timeout'])
+            response.raise_for_status()
+
+            token_info = response.json()
+            self._token = token_info['access_token']
+            self._token_expires = time.time() + token_info.get('expires_in', 10800)
+            self.logger.info("커머스 API 토큰 발급 완료")
+            return self._token
+
+    async def _get_json(self, path: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """인증 GET 요청의 JSON 응답 (404면 None, 401이면 토큰을 새로 받아 한 번 더 요청)"""
+        for attempt in range(2):
+            token = await self._get_token()
+            response = await self.http_client.fetch(
+                f"{self.base_url}{path}", params=params, timeout=self.settings['timeout'],
+                headers={'Authorization': f'Bearer {token}', 'Accept': 'application/json;charset=UTF-8'})
+            if response.status_code == 401 and not attempt:
+                self._token = None
+                continue
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+
+    async def lookup(self, query: str) -> Optional[Dict]:
+        """첫 번째 카탈로그와 상세 정보에서 가격 정보 추출"""
+        listing = await self._get_json('/external/v1/product-models', {'name': query, 'page': 1, 'size': 1})
+        contents = (listing or {}).get('contents') or []
+        if not contents:
+            return None
+
+        catalog = contents[0]
+        detail = await self._get_json(f"/external/v1/product-models/{catalog['id']}")
+        state = parse_page_state([detail or {}, catalog])
+        if state is None:
+            self.logger.debug(f"커머스 API 카탈로그에 가격 없음: {query} ({catalog['id']})")
+            return None
+
+        state['catalog_id'] = state['catalog_id'] or str(catalog['id'])
+        return _state_result(state, f"{self.base_url}/external/v1/product-models/{catalog['id']}")
+
+
+class HttpScrapeLookup(PriceLookupBackend):
+    """검색 결과 페이지를 브라우저 없이 받아 내장 상태(__NEXT_DATA__) JSON에서 읽기
+
+    접속 제한 페이지나 403·429 응답이 오면 block_pause초 동안 조회하지 않고 바로 다음 엔진으로 넘긴다.
+    """
+
+    name = 'http'
+
+    def __init__(self, http_client: HttpClient, settings: Optional[Dict] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        self.logger = logging.getLogger(__name__)
+        self.http_client = http_client
+        self.settings = settings or PRICE_LOOKUP_CONFIG['http']
+        self.concurrency = self.settings['concurrency']
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.block_count = 0
+        self._paused_until = 0.0
+
+    def _record_block(self, reason: str) -> None:
+        """접속 제한 기록 후 block_pause초 동안 사용 중지"""
+        self.block_count += 1
+        self._paused_until = time.monotonic() + self.settings['block_pause']
+        self.logger.warning(f"검색 페이지 HTTP 조회 접속 제한 ({reason}) - {self.settings['block_pause']}초 동안 사용 안 함")
+
+    async def lookup(self, query: str) -> Optional[Dict]:
+        """검색 결과 첫 상품의 가격 정보 (접속 제한·상품 없음이면 None)"""
+        if time.monotonic() < self._paused_until:
+            return None
+
+        url = self.settings['search_url'].format(query=quote(query))
+        await self.rate_limiter.wait(url)
+        response = await self.http_client.fetch(url, timeout=self.settings['timeout'],
+                                                headers={'Referer': NAVER_SHOPPING_CONFIG['base_url']})
+        if response.status_code in BLOCK_STATUS_CODES:
+            self._record_block(f"상태 코드 {response.status_code}")
+            return None
+        if response.status_code != 200:
+            self.logger.debug(f"검색 페이지 HTTP 조회 실패: 상태 코드 {response.status_code}")
+            return None
+
+        html = decode_html(response.content, response.encoding)
+        if BLOCK_MARKERS.search(html):
+            self._record_block("접속 제한 페이지")
+            return None
+
+        state = parse_page_state(load_page_state(read_page_state_html(html)))
+        return _state_result(state, response.url) if state else None
+
+
+class BrowserLookup(PriceLookupBackend):
+    """Playwright 검색 (NaverSearchWorkers - 동시 검색, 차단시 격리·재검색)
+
+    동시 검색 수는 NaverSearchWorkers의 AIMD 제어기가 정하고, 격리되어 기다리는 검색이
+    자리를 차지하지 않도록 PriceLookupCascade 세마포어를 쓰지 않는다.
+    유사 검색어 재사용은 PriceLookupCascade가 하므로 작업자의 검색어 색인은 거치지 않는다.
+    """
+
+    name = 'browser'
+    self_limited = True
+
+    def __init__(self, workers: NaverSearchWorkers):
+        self.workers = workers
+        self.concurrency = workers.max_workers
+
+    async def lookup(self, query: str) -> Optional[Dict]:
+        """브라우저로 검색"""
+        return await self.workers.search_with_quarantine(query)
+
+    @property
+    def waiting(self) -> int:
+        """격리되어 재검색을 기다리는 검색 수"""
+        return len(self.workers.quarantined)
+
+    async def warm_up(self) -> None:
+        """네이버쇼핑용 브라우저 미리 실행"""
+        await self.workers.browser_pool.warm_up('naver')
+
+    async def close(self) -> None:
+        """작업자 컨텍스트 반납"""
+        await self.workers.close_browser()
+
+
+class PriceLookupCascade:
+    """가격 조회 엔진을 앞에서부터 시도하는 조회기 (엔진별 시도·성공·오류 횟수와 소요 시간 집계)
+
+    엔진마다 concurrency 크기의 세마포어를 두어, 조회기 전체 동시 실행 수(max_concurrency)가
+    더 커도 각 엔진에는 정해진 수만큼만 동시에 보낸다.
+    엔진을 고르기 전에 같거나 비슷한 검색어의 결과(진행 중인 조회 포함)를 찾아 재사용한다.
+    """
+
+    def __init__(self, backends: List[PriceLookupBackend]):
+        self.logger = logging.getLogger(__name__)
+        self.backends = backends
+        self.stats = {backend.name: {'attempts': 0, 'hits': 0, 'errors': 0, 'seconds': 0.0}
+                      for backend in backends}
+        self._limits = {backend.name: asyncio.Semaphore(backend.concurrency)
+                        for backend in backends if not backend.self_limited}
+        self.query_index = SimilarQueryIndex()
+        self.reuse_stats = {'in_batch': 0, 'previous': 0}
+
+    @property
+    def max_concurrency(self) -> int:
+        """동시에 진행할 조회 수 (엔진 중 가장 큰 값)"""
+        return max((backend.concurrency for backend in self.backends), default=1)
+
+    @property
+    def waiting(self) -> int:
+        """오래 기다리는 조회 수"""
+        return sum(backend.waiting for backend in self.backends)
+
+    async def lookup(self, query: str) -> Dict:
+        """같거나 비슷한 검색어의 결과가 있으면 재사용, 없으면 엔진별로 조회"""
+        result, reuse, matched = await self.query_index.get_or_search(query, self._lookup_backends, is_found)
+        if reuse is None:
+            return result
+        self.reuse_stats[reuse] += 1
+        self.logger.debug(f"가격 조회 결과 재사용: {query} → {matched}")
+        return dict(result)
+
+    async def _lookup_backends(self, query: str) -> Dict:
+        """앞 엔진부터 조회해 처음 찾은 결과 반환 (모두 못 찾으면 마지막 실패 결과)"""
+        result = None
+        for backend in self.backends:
+            stats = self.stats[backend.name]
+            # 엔진 세마포어를 기다린 시간은 소요 시간에서 제외
+            async with self._limits.get(backend.name) or nullcontext():
+                stats['attempts'] += 1
+                start = time.perf_counter()
+                try:
+                    found = await backend.lookup(query)
+                except Exception as e:
+                    self.logger.warning(f"가격 조회 오류 ({backend.name}, {query}): {e}")
+                    stats['errors'] += 1
+                    found = None
+                finally:
+                    stats['seconds'] += time.perf_counter() - start
+
+            if is_found(found):
+                stats['hits'] += 1
+                return found
+            result = found or result
+            self.logger.debug(f"가격 조회 실패 ({backend.name}): {query}")
+
+        return result or no_data_result("검색 실패")
+
+    def seed(self, items: Iterable[Tuple[str, Any, float]]) -> None:
+        """이전 결과 (검색어, 결과, 저장 시각) 목록으로 재사용 색인 채우기"""
+        self.query_index.seed(items)
+
+    async def warm_up(self) -> None:
+        """엔진별 준비"""
+        await asyncio.gather(*(backend.warm_up() for backend in self.backends))
+
+    def log_stats(self) -> None:
+        """엔진별 성공률과 평균 소요 시간, 결과 재사용 로그"""
+        for name, stats in self.stats.items():
+            if stats['attempts']:
+                self.logger.info(
+                    f"가격 조회 ({name}): {stats['hits']}/{stats['attempts']}건 성공, 오류 {stats['errors']}건, "
+                    f"평균 {stats['seconds'] / stats['attempts']:.2f}초")
+        if any(self.reuse_stats.values()):
+            self.logger.info(
+                f"가격 조회 결과 재사용: 진행 중 조회 {self.reuse_stats['in_batch']}건, "
+                f"이전 결과 {self.reuse_stats['previous']}건 (색인 {len(self.query_index)}건)")
+
+    async def close(self) -> None:
+        """통계 로그 후 엔진별 자원 정리"""
+        self.log_stats()
+        for backend in self.backends:
+            try:
+                await backend.close()
+            except Exception as e:
+                self.logger.error(f"가격 조회 엔진 종료 실패 ({backend.name}): {e}")
+
+
+def build_price_lookup(naver_crawler: Optional[NaverShoppingCrawler], http_client: HttpClient,
+                       names: Optional[List[str]] = None) -> PriceLookupCascade:
+    """설정 순서대로 가격 조회 엔진 생성 (사용할 수 없는 api 엔진은 건너뜀)"""
+    factories = {
+        'api': lambda: CommerceApiLookup(http_client),
+        'http': lambda: HttpScrapeLookup(http_client),
+        'browser': lambda: BrowserLookup(NaverSearchWorkers(naver_crawler))
+    }
+
+    backends = []
+    for name in names or PRICE_LOOKUP_CONFIG['backends']:
+        if name == 'api':
+            reason = CommerceApiLookup.unavailable_reason()
+            if reason:
+                logger.info(f"가격 조회 엔진 api 사용 안 함: {reason}")
+                continue
+        backends.append(factories[name]())
+
+    logger.info(f"가격 조회 엔진: {' → '.join(backend.name for backend in backends)}")
+    return PriceLookupCascade(backends)
@@ -0,0 +1,128 @@
+"""
+가격 조회 엔진 테스트용 로컬 HTTP 서버
+
+price_lookup_fixtures/의 기록된 응답으로 커머스 API(토큰 발급, product-models 목록·단건)와
+네이버쇼핑 검색 결과 페이지(/search/all)를 흉내 낸다. search_statuses에 있는 검색어는 해당 상태 코드로 응답한다.
+받은 요청은 (메서드, 경로) 순서대로 남긴다.
+
+    python price_lookup_stub.py [포트]
+"""
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / 'price_lookup_fixtures'
+
+TOKEN_PATH = '/external/v1/oauth2/token'
+PRODUCT_MODELS_PATH = '/external/v1/product-models'
+SEARCH_PATH = '/search/all'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """요청을 PriceLookupStubServer.respond로 넘겨 응답"""
+
+    def _reply(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        status, content_type, body = self.server.stub.respond(
+            method, parts.path, parse_qs(parts.query), self.headers.get('Authorization'))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply('GET')
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self._reply('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PriceLookupStubServer:
+    """기록된 응답을 돌려주는 로컬 서버 (with 문으로 시작·종료)"""
+
+    def __init__(self, port: int = 0, fixtures_dir: Optional[Path] = None):
+        self.fixtures_dir = Path(fixtures_dir or FIXTURES_DIR)
+        self.responses = json.loads((self.fixtures_dir / 'responses.json').read_text(encoding='utf-8'))
+        self.requests: List[Tuple[str, str]] = []
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), _StubHandler)
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기본 주소"""
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> 'PriceLookupStubServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'PriceLookupStubServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def count(self, path_prefix: str) -> int:
+        """경로가 path_prefix로 시작하는 요청 수"""
+        return sum(1 for _, path in self.requests if path.startswith(path_prefix))
+
+    def respond(self, method: str, path: str, query: Dict[str, List[str]],
+                authorization: Optional[str]) -> Tuple[int, str, bytes]:
+        """요청에 맞는 기록된 응답 - (상태 코드, Content-Type, 본문)"""
+        self.requests.append((method, path))
+        responses = self.responses
+
+        if method == 'POST' and path == TOKEN_PATH:
+            return self._json(200, responses['token'])
+
+        if path.startswith(PRODUCT_MODELS_PATH):
+            if authorization != f"Bearer {responses['token']['access_token']}":
+                return self._json(401, {'code': 'GW.AUTHN', 'message': '인증 실패'})
+            if path == PRODUCT_MODELS_PATH:
+                name = query.get('name', [''])[0]
+                listing = responses['product_models'].get(name, {'contents': [], 'totalElements': 0, 'totalPages': 0})
+                return self._json(200, listing)
+            detail = responses['product_model_details'].get(path.rsplit('/', 1)[1])
+            if detail is None:
+                return self._json(404, {'code': 'NOT_FOUND', 'message': '카탈로그 없음'})
+            return self._json(200, detail)
+
+        if method == 'GET' and path == SEARCH_PATH:
+            search_query = query.get('query', [''])[0]
+            status = responses['search_statuses'].get(search_query)
+            if status is not None:
+                return status, 'text/plain; charset=utf-8', f"status {status}".encode('utf-8')
+            page = responses['search_pages'].get(search_query, 'search_empty.html')
+            return 200, 'text/html; charset=utf-8', (self.fixtures_dir / page).read_bytes()
+
+        return 404, 'text/plain; charset=utf-8', b'not found'
+
+    @staticmethod
+    def _json(status: int, data: Dict) -> Tuple[int, str, bytes]:
+        return status, 'application/json;charset=UTF-8', json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+if __name__ == "__main__":
+    server = PriceLookupStubServer(int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    print(f"가격 조회 스텁 서버: {server.url} (Ctrl+C로 종료)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,130 @@
+"""
+가격 조회 엔진 테스트 - 로컬 스텁 서버(price_lookup_stub) 사용
+
+커머스 API → 검색 페이지 HTTP 순서로 조회해 엔진별로 찾는 상품, 찾지 못하면 다음 엔진으로
+넘어가는지, 접속 제한(차단 페이지, 403·429 응답) 뒤 http 엔진을 건너뛰는지 확인한다.
+브라우저 엔진은 사용하지 않는다.
+"""
+import asyncio
+import sys
+
+from config import PRICE_LOOKUP_CONFIG
+from http_client import HttpClient
+from price_lookup import CommerceApiLookup, HttpScrapeLookup, PriceLookupCascade, bcrypt, is_found
+from price_lookup_stub import PriceLookupStubServer, SEARCH_PATH
+
+# (검색어, 찾을 엔진 - 'reuse'면 앞 결과 재사용, 못 찾으면 None, 최저가,
+#  링크 종류 - 'catalog' 가격비교 / 'search' 검색 페이지)
+TEST_CASES = [
+    ("하기스 네이처메이드 4단계", 'api', "39,900원", 'catalog'),   # API 카탈로그에 가격 있음
+    ("페리오 치약 100g", 'http', "2,480원", 'catalog'),           # API 카탈로그에 가격 없음 → 검색 페이지 (가격비교 묶음)
+    ("1+1 페리오 치약 100g 특가", 'reuse', "2,480원", 'catalog'),  # 정규화하면 같은 검색어 → 엔진 조회 없이 재사용
+    ("로지텍 MX Master 3S", 'http', "129,000원", 'search'),       # 단일 판매처 상품 → 검색 페이지 주소 유지
+    ("없는상품1234567890", None, None, None),                     # 어디에도 없음
+    ("삼다수 2L", None, None, None),                              # 검색 페이지 접속 제한
+    ("페리오 토탈7 치약 100g", None, None, None),                 # 접속 제한 뒤라 http 엔진 건너뜀
+]
+
+# 접속 제한으로 봐야 하는 검색 페이지 응답 (검색어, 설명)
+BLOCK_CASES = [
+    ("삼다수 2L", "접속 제한 페이지"),
+    ("제주 삼다수 2L 403", "상태 코드 403"),
+    ("제주 삼다수 2L 429", "상태 코드 429"),
+]
+
+
+async def test_price_lookup(server: PriceLookupStubServer) -> int:
+    """스텁 서버로 가격 조회 엔진 테스트 - 실패 건수 반환"""
+    http_client = HttpClient()
+    backends = []
+
+    if bcrypt is not None:
+        api_settings = dict(PRICE_LOOKUP_CONFIG['api'], base_url=server.url, client_id='stub-client',
+                            client_secret=bcrypt.gensalt(rounds=4).decode('utf-8'))
+        backends.append(CommerceApiLookup(http_client, api_settings))
+    else:
+        print("⚠️ bcrypt 미설치 - api 엔진 없이 테스트")
+
+    http_settings = dict(PRICE_LOOKUP_CONFIG['http'], search_url=f"{server.url}{SEARCH_PATH}?query={{query}}")
+    backends.append(HttpScrapeLookup(http_client, http_settings))
+    cascade = PriceLookupCascade(backends)
+    link_prefixes = {'catalog': PRICE_LOOKUP_CONFIG['catalog_url'].format(catalog_id=''),
+                     'search': f"{server.url}{SEARCH_PATH}"}
+
+    failures = 0
+    try:
+        for query, expected_backend, expected_price, expected_link in TEST_CASES:
+            if expected_backend == 'api' and bcrypt is None:
+                continue
+
+            hits_before = {name: stats['hits'] for name, stats in cascade.stats.items()}
+            reused_before = sum(cascade.reuse_stats.values())
+            result = await cascade.lookup(query)
+            found_by = next((name for name, stats in cascade.stats.items()
+                             if stats['hits'] > hits_before[name]), None)
+            if sum(cascade.reuse_stats.values()) > reused_before:
+                found_by = 'reuse'
+
+            ok = found_by == expected_backend and (not is_found(result) or (
+                result['price'] == expected_price and result['naver_link'].startswith(link_prefixes[expected_link])))
+            failures += not ok
+            print(f"{'✅' if ok else '❌'} {query}: {found_by or '못 찾음'} "
+                  f"(예상: {expected_backend or '못 찾음'}) - {result['product_name']}, {result['price']}, "
+                  f"{result['naver_link']}")
+
+        print("\n📊 엔진별 결과:")
+        for name, stats in cascade.stats.items():
+            print(f"  {name}: {stats['hits']}/{stats['attempts']}건 성공, 오류 {stats['errors']}건, "
+                  f"평균 {stats['seconds'] / max(stats['attempts'], 1) * 1000:.1f}ms")
+        print(f"  결과 재사용: {sum(cascade.reuse_stats.values())}건")
+        print(f"  스텁 요청: 토큰 {server.count('/external/v1/oauth2')}회, "
+              f"카탈로그 {server.count('/external/v1/product-models')}회, 검색 페이지 {server.count(SEARCH_PATH)}회")
+
+    finally:
+        await cascade.close()
+        http_client.close()
+
+    return failures
+
+
+async def test_blocks(server: PriceLookupStubServer) -> int:
+    """접속 제한 응답마다 새 http 엔진으로 차단 기록·일시 중지 확인 - 실패 건수 반환"""
+    http_client = HttpClient()
+    http_settings = dict(PRICE_LOOKUP_CONFIG['http'], search_url=f"{server.url}{SEARCH_PATH}?query={{query}}")
+
+    failures = 0
+    try:
+        for query, description in BLOCK_CASES:
+            backend = HttpScrapeLookup(http_client, http_settings)
+            blocked = await backend.lookup(query)
+            requests_before = server.count(SEARCH_PATH)
+            # 일시 중지 중에는 요청 없이 바로 None
+            skipped = await backend.lookup("페리오 치약 100g")
+
+            ok = (blocked is None and backend.block_count == 1 and skipped is None
+                  and server.count(SEARCH_PATH) == requests_before)
+            failures += not ok
+            print(f"{'✅' if ok else '❌'} {description}: 차단 {backend.block_count}회, "
+                  f"중지 중 요청 {server.count(SEARCH_PATH) - requests_before}회")
+    finally:
+        http_client.close()
+
+    return failures
+
+
+def main():
+    """메인 실행"""
+    print("🚀 가격 조회 엔진 테스트 시작")
+    print("=" * 60)
+
+    with PriceLookupStubServer() as server:
+        failures = asyncio.run(test_price_lookup(server))
+        print("\n🚫 접속 제한 처리:")
+        failures += asyncio.run(test_blocks(server))
+
+    print(f"\n{'✅ 테스트 완료' if not failures else f'❌ 실패 {failures}건'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+제목 가격 파서
+
+컴파일한 토큰 패턴 하나로 제목의 숫자 토큰(12,900원, 1.2만원, 3만5천원, 12,900~15,900원 등)을
+한 번에 찾고, 토큰마다 가격일 확신도를 매겨 가장 확실한 값을 고른다.
+parse_prices는 같은 패턴과 규칙을 pandas 열 전체에 벡터 연산으로 적용한다.
+"""
+import re
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+# 가격을 찾지 못했을 때 기존 데이터에 저장해 온 값
+PRICE_NOT_FOUND = 999999
+
+# 가격 토큰 (영숫자·소수점·쉼표 중간에서는 시작하지 않음)
+# 수량 단위가 붙은 토큰(4팩, 1.5kg, 2024년 등)은 unit으로 잡아 가격 후보에서 제외
+# 숫자로 시작해야 정규식 엔진이 숫자가 아닌 위치를 빠르게 건너뛰므로 앞 문자 검사는 첫 숫자 뒤에 둠
+_NUMBER = r'\d{1,3}(?:,\d{3})+(?!\d)|\d+(?:\.\d+)?'
+PRICE_PATTERN = rf'''
+    (?P<amount>\d(?<![A-Za-z0-9.,]\d)(?:\d{{0,2}}(?:,\d{{3}})+(?!\d)|\d*(?:\.\d+)?))
+    \s*(?P<man>만)?
+    (?:\s*(?P<cheon>\d)\s*천)?
+    (?:\s*[~∼-]\s*(?:{_NUMBER})\s*만?)?
+    \s*(?P<won>원)?
+    (?P<unit>\s*(?:[개팩매입롤병캔봉종년월일시분%]|박스|세트|인분|단계|인치
+                  |(?i:box|kg|gb|tb|ml|mm|cm|g|l|m|p)(?![A-Za-z])))?
+'''
+_PRICE_REGEX = re.compile(PRICE_PATTERN, re.VERBOSE)
+
+# 열 단위 처리용 - 제목 구분자(가격 토큰의 \s에 걸리지 않는 문자)와 가격 토큰 전체를 찾는 패턴
+# (그룹을 캡처하지 않아야 findall이 튜플 없이 토큰 문자열만 돌려줘 빠르다)
+_ROW_SEPARATOR = '\x00'
+_TOKEN_REGEX = re.compile(rf'{_ROW_SEPARATOR}|' + re.sub(r'\(\?P<\w+>', '(?:', PRICE_PATTERN), re.VERBOSE)
+
+# 확신도 (같으면 제목에서 뒤에 나온 값 우선 - 정가 → 할인가 순으로 적는 경우가 많음)
+CONFIDENCE_WON = 0.9       # 12,900원, 1.2만원
+CONFIDENCE_MAN = 0.8       # 1.2만
+CONFIDENCE_COMMA = 0.6     # 12,900
+CONFIDENCE_DIGITS = 0.4    # 12900 (4~7자리)
+CONFIDENCE_YEAR = 0.2      # 2024 (연도일 가능성)
+
+# 원 단위 없이 숫자만 있을 때 가격으로 보는 범위
+_BARE_MIN, _BARE_MAX = 1000, 9999999
+# 가격으로 인정하는 최소값
+_MIN_PRICE = 100
+
+
+class PriceResult(NamedTuple):
+    """가격 추출 결과 (찾지 못하면 value None, confidence 0)"""
+    value: Optional[int]
+    confidence: float
+
+
+def _score_token(amount: str, man: Optional[str], cheon: Optional[str],
+                 won: Optional[str], unit: Optional[str]) -> PriceResult:
+    """토큰 하나의 가격 값과 확신도 (가격이 아니면 확신도 0)"""
+    if unit:
+        return PriceResult(None, 0.0)
+
+    number = float(amount.replace(',', ''))
+    if man:
+        value = number * 10000 + (int(cheon) * 1000 if cheon else 0)
+        confidence = CONFIDENCE_WON if won else CONFIDENCE_MAN
+    elif '.' in amount:
+        # 만 단위 없는 소수는 가격이 아님 (용량 등)
+        return PriceResult(None, 0.0)
+    else:
+        value = number
+        if won:
+            confidence = CONFIDENCE_WON
+        elif ',' in amount:
+            confidence = CONFIDENCE_COMMA
+        elif _BARE_MIN <= value <= _BARE_MAX:
+            confidence = CONFIDENCE_YEAR if 1900 <= value <= 2099 else CONFIDENCE_DIGITS
+        else:
+            return PriceResult(None, 0.0)
+
+    if value < _MIN_PRICE:
+        return PriceResult(None, 0.0)
+    return PriceResult(int(round(value)), confidence)
+
+
+def _score_match(match: Optional[re.Match]) -> PriceResult:
+    """PRICE_PATTERN 일치 결과 하나의 가격 값과 확신도"""
+    if not match:
+        return PriceResult(None, 0.0)
+    return _score_token(*match.group('amount', 'man', 'cheon', 'won', 'unit'))
+
+
+def parse_price(title: str) -> PriceResult:
+    """제목에서 가장 확실한 가격 추출"""
+    best = PriceResult(None, 0.0)
+    if not title:
+        return best
+    for match in _PRICE_REGEX.finditer(title):
+        result = _score_match(match)
+        if result.confidence and result.confidence >= best.confidence:
+            best = result
+    return best
+
+
+def parse_prices(titles: pd.Series) -> pd.DataFrame:
+    """제목 열 전체의 가격 추출 (parse_price와 같은 규칙, 열 'price'는 Int64, 'confidence'는 float)"""
+    missing = titles.isna().to_numpy()
+    texts = ['' if is_missing else str(title).replace(_ROW_SEPARATOR, ' ')
+             for title, is_missing in zip(titles.tolist(), missing)]
+
+    result = pd.DataFrame({
+        'price': pd.array([pd.NA] * len(texts), dtype='Int64'),
+        'confidence': np.zeros(len(texts))
+    })
+
+    # 제목을 구분자로 이어 붙여 정규식을 한 번만 돌리고, 앞에 나온 구분자 수로 토큰의 행 번호를 구함
+    matches = _TOKEN_REGEX.findall(_ROW_SEPARATOR.join(texts))
+    # numpy는 문자열 끝의 NUL을 지우므로 구분자 비교는 파이썬 문자열로
+    is_token = np.fromiter((match != _ROW_SEPARATOR for match in matches), dtype=bool, count=len(matches))
+    tokens = np.array(matches, dtype=object)
+    row = np.cumsum(~is_token)[is_token]
+    tokens = tokens[is_token]
+
+    if len(tokens):
+        # 같은 토큰('20매', '9,900원' 등)이 많으므로 고유 토큰만 parse_price와 같은 함수로 채점
+        codes, uniques = pd.factorize(tokens)
+        scores = [_score_match(_PRICE_REGEX.match(token)) for token in uniques]
+        value = np.array([score.value or 0 for score in scores], dtype='int64')[codes]
+        confidence = np.array([score.confidence for score in scores], dtype=float)[codes]
+
+        # 행, 확신도, 등장 순서로 정렬해 행마다 마지막 토큰 = 확신도 최대, 같으면 뒤에 나온 토큰
+        found = confidence > 0
+        row, value, confidence = row[found], value[found], confidence[found]
+        order = np.lexsort((np.arange(len(row)), confidence, row))
+        row, value, confidence = row[order], value[order], confidence[order]
+        last = np.append(row[1:] != row[:-1], True) if len(row) else np.array([], dtype=bool)
+
+        result.loc[row[last], 'price'] = value[last]
+        result.loc[row[last], 'confidence'] = confidence[last]
+
+    result.index = titles.index
+    return result
@@ -0,0 +1,131 @@
+"""
+게시글 진행 기록 - JSONL 선기록 로그
+
+게시글마다 단계(목록 발견 → 쇼핑몰 링크 → 상품명 → 네이버쇼핑 → 저장)를 마칠 때마다
+한 줄씩 추가하고 디스크까지 내려 쓴다. 재시작하면 로그를 다시 읽어
+저장까지 끝나지 않은 게시글의 남은 단계만 이어서 처리한다.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import FILES
+
+# 단계 (진행 순서)
+STAGE_LISTED = 'listed'   # 게시판에서 발견
+STAGE_LINK = 'link'       # 쇼핑몰 링크 추출
+STAGE_TITLE = 'title'     # 쇼핑몰 상품명 추출
+STAGE_NAVER = 'naver'     # 네이버쇼핑 최저가 검색
+STAGE_SAVED = 'saved'     # 결과 파일 저장
+STAGES = (STAGE_LISTED, STAGE_LINK, STAGE_TITLE, STAGE_NAVER, STAGE_SAVED)
+
+
+class ProgressLog:
+    """게시글별 단계 완료 기록 (한 줄 = {'id', 'stages', 'article'?, 'row'?})"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path or FILES['progress_log'])
+        # 게시글 번호 → {'stages': [...], 'article': 게시판 정보, 'row': 결과 행}
+        self._entries: Dict[int, Dict] = {}
+        self._file = None
+
+    def load(self) -> None:
+        """로그 파일을 다시 읽어 게시글별 진행 상태 복원 (마지막 줄이 덜 써졌으면 무시)"""
+        self._entries = {}
+        if not self.path.exists():
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    self.logger.warning(f"진행 기록 {line_number}번째 줄 무시: {e}")
+
+        pending = len(self.pending())
+        if pending:
+            self.logger.info(f"진행 기록 복원: 미완료 게시글 {pending}개")
+
+    def _apply(self, record: Dict) -> None:
+        """기록 한 줄을 메모리 상태에 반영"""
+        entry = self._entries.setdefault(int(record['id']), {'stages': [], 'article': None, 'row': {}})
+        for stage in record['stages']:
+            if stage not in entry['stages']:
+                entry['stages'].append(stage)
+        if record.get('article'):
+            entry['article'] = record['article']
+        if record.get('row'):
+            entry['row'].update(record['row'])
+
+    def _write(self, records: List[Dict]) -> None:
+        """기록 추가 후 디스크까지 반영"""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record(self, article_id: int, stage: str, article: Optional[Dict] = None,
+               row: Optional[Dict] = None) -> None:
+        """게시글 단계 완료 기록 (article은 게시판 정보, row는 이 단계에서 채운 결과 컬럼)"""
+        record = {'id': int(article_id), 'stages': [stage]}
+        if article:
+            record['article'] = article
+        if row:
+            record['row'] = row
+        self._write([record])
+        self._apply(record)
+
+    def has_stage(self, article_id: int, stage: str) -> bool:
+        """게시글이 해당 단계를 마쳤는지 여부"""
+        entry = self._entries.get(int(article_id))
+        return bool(entry) and stage in entry['stages']
+
+    def known_ids(self) -> List[int]:
+        """로그에 있는 게시글 번호 (완료 포함)"""
+        return list(self._entries)
+
+    def pending(self) -> List[Dict]:
+        """저장까지 끝나지 않은 게시글 목록 (게시글 번호 오름차순, {'id', 'stages', 'article', 'row'})"""
+        return [
+            {'id': article_id, **entry}
+            for article_id, entry in sorted(self._entries.items())
+            if STAGE_SAVED not in entry['stages']
+        ]
+
+    def compact(self, saved_up_to: int) -> None:
+        """저장이 끝났고 검색 번호 이하인 게시글을 지워 로그를 다시 씀
+
+        검색 번호보다 큰 게시글은 완료됐더라도 남겨 두어 다음 게시판 조회에서 다시 처리하지 않게 한다.
+        """
+        self.close()
+        keep = {
+            article_id: entry for article_id, entry in self._entries.items()
+            if STAGE_SAVED not in entry['stages'] or article_id > saved_up_to
+        }
+        if len(keep) == len(self._entries):
+            return
+
+        temp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for article_id, entry in sorted(keep.items()):
+                record = {'id': article_id, 'stages': entry['stages'],
+                          'article': entry['article'], 'row': entry['row']}
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._entries = keep
+
+    def close(self) -> None:
+        """로그 파일 닫기"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
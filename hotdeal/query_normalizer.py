@@ -0,0 +1,179 @@
+"""
+네이버쇼핑 검색어 정규화와 유사 검색어 색인
+
+같은 딜이 여러 게시판에 올라오거나 대체 제목(보정 제품명)이 조금씩 달라,
+한 번의 실행 안에서도 거의 같은 상품을 여러 번 검색하게 된다.
+검색어에서 괄호·옵션·수량·가격·홍보 문구를 지운 뒤, 남은 토큰이 순서나 띄어쓰기만 다른
+검색어는 앞선 검색 결과(또는 진행 중인 검색)를 그대로 쓴다. 남은 말이 하나라도 더 있거나 다르면
+('팬티', 색상, 'S24+'처럼 붙은 + 등) 가격이 다른 상품일 수 있으므로 다시 검색한다.
+"""
+import asyncio
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from config import QUERY_NORMALIZER_CONFIG
+
+# 정규화 규칙 버전 (규칙이 바뀌면 올려서 결과 캐시의 예전 검색어 키를 버림)
+NORMALIZER_VERSION = 2
+
+# 괄호 안 내용 (쇼핑몰 이름, 옵션, 수량 안내 등)
+_BRACKETS = re.compile(r'\[[^\]]*\]|\([^)]*\)|\{[^}]*\}|【[^】]*】|<[^>]*>|「[^」]*」|『[^』]*』')
+
+# 가격 (12,900원, 1.2만원, 3만)
+_PRICE = re.compile(r'\d[\d,.]*\s*만\s*\d*\s*천?\s*원?|\d[\d,.]*\s*원')
+
+_UNITS = '|'.join(map(re.escape, QUERY_NORMALIZER_CONFIG['quantity_units']))
+
+# 묶음 표기 (x3, *2팩, 1+1 - 모델명 안의 x는 제외)
+_MULTIPLIER = re.compile(r'(?<![0-9a-z])[x×*]\s*\d+(?:\s*(?:' + _UNITS + r'))?(?![\d.가-힣a-z])|\d+\s*\+\s*\d+')
+
+# 수량 (3개, 2팩 등 - 단위는 QUERY_NORMALIZER_CONFIG['quantity_units'])
+_QUANTITY = re.compile(r'\d+\s*(?:' + _UNITS + r')(?![가-힣a-z])')
+
+# 한글·영문·숫자·소수점·+ 외 문자 (+는 S24+, FE+ 같은 모델 표기)
+_PUNCTUATION = re.compile(r'[^0-9a-z가-힣.+]+')
+
+_PROMO_WORDS = frozenset(word.lower() for word in QUERY_NORMALIZER_CONFIG['promo_words'])
+_OPTION_MARKERS = tuple(marker.lower() for marker in QUERY_NORMALIZER_CONFIG['option_markers'])
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (소문자, 괄호·가격·수량·홍보 문구·옵션 표기 제거, 중복 토큰 제거)"""
+    text = (query or '').lower()
+    text = _BRACKETS.sub(' ', text)
+    text = _PRICE.sub(' ', text)
+    text = _MULTIPLIER.sub(' ', text)
+    text = _QUANTITY.sub(' ', text)
+    text = _PUNCTUATION.sub(' ', text)
+
+    tokens = []
+    for token in text.split():
+        token = token.strip('.')
+        if not token.strip('+') or token in _PROMO_WORDS or token.startswith(_OPTION_MARKERS):
+            continue
+        if token not in tokens:
+            tokens.append(token)
+    return ' '.join(tokens)
+
+
+def query_tokens(normalized: str) -> FrozenSet[str]:
+    """정규화한 검색어의 토큰 집합"""
+    return frozenset(normalized.split())
+
+
+def similar_query_keys(normalized: str) -> Tuple[Tuple[str, ...], str]:
+    """같은 상품 검색어로 볼 키 - (정렬한 토큰, 띄어쓰기를 뺀 검색어)
+
+    토큰 순서만 다르거나('애플 에어팟' / '에어팟 애플') 띄어쓰기만 다른('네이처 메이드' / '네이처메이드')
+    검색어는 같은 키가 된다. 홍보 문구·수량이 아닌 말이 하나라도 더 있으면(팬티, 색상 등) 다른 상품이다.
+    """
+    return tuple(sorted(query_tokens(normalized))), normalized.replace(' ', '')
+
+
+class SimilarQueryIndex:
+    """최근 검색어 → 결과 색인 (정규화 결과가 같거나, 토큰 순서·띄어쓰기만 다르면 재사용)
+
+    값에는 완료된 결과 외에 진행 중인 검색의 Future를 넣어 같은 배치 안의 중복 검색도 합친다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries or QUERY_NORMALIZER_CONFIG['max_entries']
+        self.ttl = ttl or QUERY_NORMALIZER_CONFIG['ttl']
+        # 정규화 검색어 → (같은 상품 키, 값, 저장 시각), 오래된 것부터
+        self._entries: Dict[str, Tuple[Tuple, Any, float]] = {}
+        self._by_key: Dict[Any, str] = {}
+        self.stats = {'exact': 0, 'similar': 0, 'misses': 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(self, query: str) -> Optional[Tuple[Any, str]]:
+        """재사용할 값 찾기 - (값, 찾은 검색어) 또는 None"""
+        normalized = normalize_query(query)
+        if not normalized:
+            return None
+
+        now = time.time()
+        entry = self._entries.get(normalized)
+        if entry and now - entry[2] < self.ttl:
+            self.stats['exact'] += 1
+            return entry[1], normalized
+
+        for key in similar_query_keys(normalized):
+            candidate = self._by_key.get(key)
+            if candidate is None:
+                continue
+            _, value, created = self._entries[candidate]
+            if now - created < self.ttl:
+                self.stats['similar'] += 1
+                return value, candidate
+
+        self.stats['misses'] += 1
+        return None
+
+    def add(self, query: str, value: Any, created: Optional[float] = None) -> None:
+        """검색어와 값 저장 (같은 검색어는 덮어씀, 최대 개수를 넘으면 오래된 것부터 삭제)"""
+        normalized = normalize_query(query)
+        if not normalized:
+            return
+
+        self._remove(normalized)
+        keys = similar_query_keys(normalized)
+        self._entries[normalized] = (keys, value, created or time.time())
+        for key in keys:
+            self._by_key[key] = normalized
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    async def get_or_search(self, query: str, search: Callable[[str], Awaitable[Any]],
+                            keep: Callable[[Any], bool]) -> Tuple[Any, Optional[str], Optional[str]]:
+        """같거나 비슷한 검색어의 결과를 재사용하고(진행 중이면 끝나기를 기다림), 없으면 search(query) 실행
+
+        반환: (결과, 재사용 구분 - 'in_batch' 진행 중 검색 / 'previous' 이전 결과 / 직접 검색하면 None, 찾은 검색어)
+        keep(결과)가 거짓인 결과(검색 실패)는 다음 검색에서 재사용하지 않도록 색인에서 지운다.
+        """
+        match = self.find(query)
+        if match is not None:
+            value, matched = match
+            if not isinstance(value, asyncio.Future):
+                return value, 'previous', matched
+            value = await asyncio.shield(value)
+            if value is None:
+                # 먼저 검색하던 쪽이 중단됨 - 직접 검색
+                return await self.get_or_search(query, search, keep)
+            return value, 'in_batch', matched
+
+        # 진행 중인 검색으로 등록해 비슷한 검색어는 이 검색이 끝나기를 기다리게 함
+        future = asyncio.get_running_loop().create_future()
+        self.add(query, future)
+        result = None
+        try:
+            result = await search(query)
+            return result, None, None
+        finally:
+            if result is None or not keep(result):
+                self.discard(query)
+            else:
+                self.add(query, result)
+            future.set_result(result)
+
+    def discard(self, query: str) -> None:
+        """검색어 삭제 (실패한 검색 결과를 재사용하지 않도록)"""
+        self._remove(normalize_query(query))
+
+    def _remove(self, normalized: str) -> None:
+        """정규화한 검색어 항목과 토큰 색인 삭제"""
+        entry = self._entries.pop(normalized, None)
+        if entry is None:
+            return
+        for key in entry[0]:
+            if self._by_key.get(key) == normalized:
+                del self._by_key[key]
+
+    def seed(self, items: Iterable[Tuple[str, Any, float]]) -> None:
+        """(검색어, 값, 저장 시각) 목록으로 색인 채우기 (결과 캐시에서 불러올 때)"""
+        for query, value, created in items:
+            if normalize_query(query) not in self._entries:
+                self.add(query, value, created)
@@ -0,0 +1,81 @@
+"""
+검색어 정규화·유사 검색어 판정 테스트
+
+같은 상품으로 합쳐야 하는 검색어 쌍과 다른 상품이라 합치면 안 되는 쌍을 표로 두고
+normalize_query 결과와 SimilarQueryIndex 재사용 여부를 확인한다.
+"""
+import sys
+
+from query_normalizer import SimilarQueryIndex, normalize_query
+
+# (원래 검색어, 정규화 결과)
+NORMALIZE_CASES = [
+    ("[쿠팡] 하기스 네이처메이드 4단계 72매 x 3팩 (무료배송) 39,900원", "하기스 네이처메이드 4단계 72매"),
+    ("1+1 페리오 치약 100g 옵션선택 12,900원", "페리오 치약 100g"),
+    ("삼다수 2L*24병 9,900원/무배", "삼다수 2l"),
+    ("라데온 RX7800 XT", "라데온 rx7800 xt"),
+    ("갤럭시 S24+ 자급제 특가", "갤럭시 s24+ 자급제"),
+    ("갤럭시 탭 S9 FE+", "갤럭시 탭 s9 fe+"),
+]
+
+# (먼저 검색한 검색어, 다음 검색어) - 앞 결과를 재사용해야 하는 쌍
+MERGE_CASES = [
+    ("하기스 네이처메이드 4단계 72매 x3팩", "[쿠팡] 하기스 네이처메이드 4단계 72매 특가"),
+    ("페리오 치약 100g 2개", "1+1 페리오 치약 100g"),
+    ("애플 에어팟 프로 2세대 usb-c", "에어팟 프로 2세대 애플 usb-c 무료배송"),
+    ("하기스 네이처 메이드 4단계 72매", "하기스 네이처메이드 4단계 72매"),
+]
+
+# (먼저 검색한 검색어, 다음 검색어) - 다른 상품이라 재사용하면 안 되는 쌍
+NO_MERGE_CASES = [
+    ("갤럭시 S24 자급제", "갤럭시 S24+ 자급제"),
+    ("갤럭시 탭 S9 FE", "갤럭시 탭 S9 FE+"),
+    ("나이키 에어포스 1 07 블랙", "나이키 에어포스 1 07 화이트"),
+    ("MX Master 3S 페일그레이", "MX Master 3S 그라파이트"),
+    ("MX Master 3S", "MX Master 3S 그라파이트"),
+    ("하기스 네이처메이드 4단계 72매", "하기스 네이처메이드 5단계 72매"),
+    ("삼다수 2L", "삼다수 500ml"),
+    ("삼다수 2L", "제주 삼다수 2L"),
+    ("하기스 네이처메이드 4단계", "하기스 네이처메이드 4단계 72매"),
+    ("하기스 네이처메이드 4단계 72매", "하기스 네이처메이드 팬티 4단계 72매"),
+    ("애플 에어팟 프로 2세대", "애플 에어팟 프로 2세대 usb-c"),
+]
+
+
+def run_tests() -> int:
+    """표의 경우를 모두 확인하고 실패 건수 반환"""
+    failures = 0
+
+    print("🔤 정규화")
+    for query, expected in NORMALIZE_CASES:
+        normalized = normalize_query(query)
+        ok = normalized == expected
+        failures += not ok
+        print(f"  {'✅' if ok else '❌'} {query} → '{normalized}'" + ('' if ok else f" (예상: '{expected}')"))
+
+    for title, cases, should_merge in (("🔗 재사용해야 하는 쌍", MERGE_CASES, True),
+                                       ("🚫 재사용하면 안 되는 쌍", NO_MERGE_CASES, False)):
+        print(f"\n{title}")
+        for first, second in cases:
+            index = SimilarQueryIndex()
+            index.add(first, first)
+            match = index.find(second)
+            ok = (match is not None) == should_merge
+            failures += not ok
+            detail = f"'{match[1]}' 결과 재사용" if match else "재사용 안 함"
+            print(f"  {'✅' if ok else '❌'} '{first}' / '{second}': {detail}")
+
+    return failures
+
+
+def main():
+    """메인 실행"""
+    print("🚀 검색어 정규화 테스트 시작")
+    print("=" * 60)
+    failures = run_tests()
+    print(f"\n{'✅ 테스트 완료' if not failures else f'❌ 실패 {failures}건'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
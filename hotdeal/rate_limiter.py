@@ -0,0 +1,40 @@
+"""
+호스트별 요청 간격 제한
+
+같은 호스트로 가는 요청의 시작 시각을 최소 간격만큼 벌려 준다.
+여러 작업이 동시에 요청해도 순서대로 시작 시각을 예약하므로 잠금이 필요 없다.
+"""
+import asyncio
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config import PACING_CONFIG
+
+
+class HostRateLimiter:
+    """호스트별 요청 시작 최소 간격 (하위 도메인은 상위 도메인 설정을 따름)"""
+
+    def __init__(self, intervals: Optional[Dict[str, float]] = None):
+        self.intervals = intervals if intervals is not None else PACING_CONFIG['hosts']
+        self._next_start: Dict[str, float] = {}
+
+    def _get_interval(self, hostname: str) -> Tuple[str, float]:
+        """호스트에 적용할 (설정 키, 간격) 반환 (설정이 없으면 간격 0)"""
+        labels = hostname.split('.')
+        for i in range(len(labels) - 1):
+            key = '.'.join(labels[i:])
+            if key in self.intervals:
+                return key, self.intervals[key]
+        return hostname, 0
+
+    async def wait(self, url: str) -> None:
+        """해당 호스트의 다음 요청 차례까지 대기"""
+        key, interval = self._get_interval((urlsplit(url).hostname or '').lower())
+        if interval <= 0:
+            return
+
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start.get(key, now))
+        self._next_start[key] = start + interval
+        if start > now:
+            await asyncio.sleep(start - now)
@@ -0,0 +1,118 @@
+"""
+요청 차단기 - Playwright route 기반
+
+컨텍스트 전체에 라우트를 걸어 페이지별 차단 프로필에 따라 이미지/폰트/미디어,
+광고·분석 호스트 요청을 중단하고 페이지별 절감량을 집계한다. 절감량은 실제 응답 크기가 아니라
+리소스 종류별 추정치(BLOCKED_RESOURCE_SIZE_ESTIMATES)의 합이다.
+닫힌 페이지의 프로필과 집계는 close 이벤트에서 지운다.
+"""
+import logging
+from typing import Dict, Optional, Set, Union
+from urllib.parse import urlsplit
+from playwright.async_api import BrowserContext, Frame, Page, Route, Request
+
+from config import RESOURCE_BLOCK_PROFILES, TRACKER_HOSTS, BLOCKED_RESOURCE_SIZE_ESTIMATES
+
+_TRACKER_HOSTS = frozenset(TRACKER_HOSTS)
+
+
+def _new_stats() -> Dict[str, int]:
+    """집계 초기값"""
+    return {'blocked_requests': 0, 'allowed_requests': 0, 'estimated_saved_bytes': 0}
+
+
+def is_tracker_host(hostname: Optional[str]) -> bool:
+    """광고/분석 호스트 여부 (하위 도메인 포함)"""
+    if not hostname:
+        return False
+    labels = hostname.lower().split('.')
+    return any('.'.join(labels[i:]) in _TRACKER_HOSTS for i in range(len(labels) - 1))
+
+
+class ResourceBlocker:
+    """컨텍스트 단위 요청 차단기"""
+
+    def __init__(self, default_profile: str = 'default'):
+        self.logger = logging.getLogger(__name__)
+        self.default_profile = default_profile
+        self._page_profiles: Dict[Page, str] = {}
+        self._page_stats: Dict[Optional[Page], Dict[str, int]] = {}
+        self._watched: Set[Page] = set()  # close 이벤트를 등록한 페이지
+        self.totals = _new_stats()
+
+    async def install(self, context: BrowserContext) -> None:
+        """컨텍스트의 모든 요청에 차단 라우트 적용"""
+        await context.route('**/*', self._handle_route)
+
+    def use_profile(self, page: Page, profile: Optional[str]) -> None:
+        """페이지에 적용할 차단 프로필 지정 (없으면 기본 프로필)"""
+        self._watch(page)
+        self._page_profiles[page] = profile if profile in RESOURCE_BLOCK_PROFILES else self.default_profile
+
+    def _watch(self, page: Optional[Page]) -> None:
+        """페이지가 닫히면 프로필과 집계를 지우도록 close 이벤트 등록 (페이지당 한 번)"""
+        if page is None or page in self._watched:
+            return
+        self._watched.add(page)
+        page.once('close', self._forget)
+
+    def _forget(self, page: Page) -> None:
+        """닫힌 페이지의 프로필과 집계 삭제"""
+        self._watched.discard(page)
+        self._page_profiles.pop(page, None)
+        self._page_stats.pop(page, None)
+
+    def _should_block(self, request: Request, profile: Dict) -> bool:
+        """요청 차단 여부 판단 (문서 이동 요청은 항상 허용)"""
+        if request.is_navigation_request():
+            return False
+        if request.resource_type in profile['resource_types']:
+            return True
+        return profile['block_trackers'] and is_tracker_host(urlsplit(request.url).hostname)
+
+    async def _handle_route(self, route: Route, request: Request) -> None:
+        """요청별 차단/통과 처리"""
+        try:
+            page = request.frame.page
+        except Exception:
+            page = None  # 서비스워커 등 프레임이 없는 요청
+
+        profile = RESOURCE_BLOCK_PROFILES[self._page_profiles.get(page, self.default_profile)]
+        self._watch(page)
+        stats = self._page_stats.setdefault(page, _new_stats())
+
+        try:
+            if self._should_block(request, profile):
+                saved = BLOCKED_RESOURCE_SIZE_ESTIMATES.get(
+                    request.resource_type, BLOCKED_RESOURCE_SIZE_ESTIMATES['other'])
+                for counter in (stats, self.totals):
+                    counter['blocked_requests'] += 1
+                    counter['estimated_saved_bytes'] += saved
+                await route.abort()
+            else:
+                stats['allowed_requests'] += 1
+                self.totals['allowed_requests'] += 1
+                await route.continue_()
+        except Exception as e:
+            # 페이지가 이미 닫힌 경우 등
+            self.logger.debug(f"요청 라우팅 실패 ({request.url}): {e}")
+
+    def pop_stats(self, page: Union[Page, Frame]) -> Dict[str, int]:
+        """페이지 집계 반환 후 초기화 (페이지 재사용 시 로드 단위로 보고, 프레임이면 소속 페이지 기준)"""
+        if isinstance(page, Frame):
+            page = page.page
+        return self._page_stats.pop(page, _new_stats())
+
+    def log_page_stats(self, page: Union[Page, Frame], label: str) -> None:
+        """페이지 로드 단위 절감량 로그 (절감량은 리소스 종류별 추정치 합)"""
+        stats = self.pop_stats(page)
+        if stats['blocked_requests']:
+            self.logger.info(
+                f"리소스 차단 ({label}): {stats['blocked_requests']}건 차단, "
+                f"{stats['allowed_requests']}건 허용, 추정 절감 약 {stats['estimated_saved_bytes'] / 1024:.0f}KB")
+
+    def log_totals(self, label: str) -> None:
+        """누적 절감량 로그 (절감량은 리소스 종류별 추정치 합)"""
+        self.logger.info(
+            f"리소스 차단 누적 ({label}): {self.totals['blocked_requests']}건 차단, "
+            f"추정 절감 약 {self.totals['estimated_saved_bytes'] / 1024 / 1024:.1f}MB")
@@ -0,0 +1,166 @@
+"""
+결과 캐시 - SQLite 기반 계층별 TTL 캐시
+
+같은 상품이 날짜·게시판을 바꿔 다시 올라오는 경우가 많아,
+쇼핑몰 상품 키 → 상품명, 검색어 → 네이버쇼핑 결과, 단축 링크 → 최종 주소를 디스크에 보관하고
+브라우저를 열기 전에 먼저 찾아본다. 계층마다 유효 기간과 최대 항목 수를 따로 두고,
+최대 항목 수를 넘으면 가장 오래 쓰이지 않은 항목부터 지운다.
+"""
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import FILES, RESULT_CACHE_CONFIG
+from query_normalizer import NORMALIZER_VERSION, normalize_query
+
+# 캐시 계층
+LAYER_MALL_TITLE = 'mall_title'      # 쇼핑몰 상품 키(url_canonicalizer.product_key) → 상품명
+LAYER_NAVER_RESULT = 'naver_result'  # 정규화한 검색어 → 네이버쇼핑 결과
+LAYER_SHORT_LINK = 'short_link'      # 단축 링크 → 최종 쇼핑몰 주소
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    layer TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (layer, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (layer, accessed);
+"""
+
+
+def naver_query_key(query: str) -> Optional[str]:
+    """검색어 캐시 키 (query_normalizer.normalize_query로 정규화, 남는 말이 없으면 None)"""
+    return normalize_query(query) or None
+
+
+class ResultCache:
+    """계층별 TTL·최대 항목 수가 있는 SQLite 캐시 (적중/실패 횟수 집계)"""
+
+    def __init__(self, path: Optional[Path] = None, layers: Optional[Dict[str, Dict]] = None,
+                 enabled: Optional[bool] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path or FILES['result_cache'])
+        self.layers = layers or RESULT_CACHE_CONFIG['layers']
+        self.enabled = RESULT_CACHE_CONFIG['enabled'] if enabled is None else enabled
+        self.stats = {layer: {'hits': 0, 'misses': 0} for layer in self.layers}
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """처음 쓸 때 DB 연결 (실패하면 캐시 없이 진행)"""
+        if self._conn is None and self.enabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path)
+                self._conn.executescript(_SCHEMA)
+                self._drop_stale_query_keys()
+            except sqlite3.Error as e:
+                self.logger.warning(f"결과 캐시 사용 안 함 ({self.path}): {e}")
+                self.enabled = False
+                self._conn = None
+        return self._conn
+
+    def _drop_stale_query_keys(self) -> None:
+        """검색어 정규화 규칙이 바뀌었으면 예전 규칙으로 만든 네이버쇼핑 결과 삭제 (DB user_version으로 판별)"""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= NORMALIZER_VERSION:
+            return
+        removed = self._conn.execute("DELETE FROM entries WHERE layer = ?", (LAYER_NAVER_RESULT,)).rowcount
+        self._conn.execute(f"PRAGMA user_version = {NORMALIZER_VERSION}")
+        self._conn.commit()
+        if removed:
+            self.logger.info(f"검색어 정규화 규칙 변경 - 네이버쇼핑 결과 캐시 {removed}건 삭제")
+
+    def get(self, layer: str, key: Optional[str]) -> Optional[Any]:
+        """유효 기간 안의 값 조회 (없으면 None)"""
+        conn = self._connect()
+        if conn is None or key is None:
+            return None
+
+        now = time.time()
+        try:
+            found = conn.execute(
+                "SELECT value FROM entries WHERE layer = ? AND key = ? AND created > ?",
+                (layer, key, now - self.layers[layer]['ttl'])).fetchone()
+            if found is None:
+                self.stats[layer]['misses'] += 1
+                return None
+
+            conn.execute("UPDATE entries SET accessed = ? WHERE layer = ? AND key = ?", (now, layer, key))
+            conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"결과 캐시 조회 실패 ({layer}): {e}")
+            return None
+
+        self.stats[layer]['hits'] += 1
+        return json.loads(found[0])
+
+    def put(self, layer: str, key: Optional[str], value: Any) -> None:
+        """값 저장 후 최대 항목 수를 넘은 만큼 오래 쓰이지 않은 항목 삭제"""
+        conn = self._connect()
+        if conn is None or key is None:
+            return
+
+        now = time.time()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (layer, key, value, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (layer, key, json.dumps(value, ensure_ascii=False), now, now))
+            conn.execute(
+                "DELETE FROM entries WHERE layer = ? AND key IN ("
+                "SELECT key FROM entries WHERE layer = ? ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (layer, layer, self.layers[layer]['max_entries']))
+            conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"결과 캐시 저장 실패 ({layer}): {e}")
+
+    def items(self, layer: str, limit: int) -> List[Tuple[str, Any, float]]:
+        """유효 기간 안의 최근 사용 항목 limit개 - (키, 값, 저장 시각), 오래 쓰이지 않은 것부터"""
+        conn = self._connect()
+        if conn is None:
+            return []
+
+        try:
+            rows = conn.execute(
+                "SELECT key, value, created FROM entries WHERE layer = ? AND created > ? "
+                "ORDER BY accessed DESC LIMIT ?",
+                (layer, time.time() - self.layers[layer]['ttl'], limit)).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"결과 캐시 목록 조회 실패 ({layer}): {e}")
+            return []
+        return [(key, json.loads(value), created) for key, value, created in reversed(rows)]
+
+    def purge_expired(self) -> int:
+        """유효 기간이 지난 항목 삭제 - 삭제 수 반환"""
+        conn = self._connect()
+        if conn is None:
+            return 0
+
+        now = time.time()
+        removed = 0
+        try:
+            for layer, settings in self.layers.items():
+                removed += conn.execute("DELETE FROM entries WHERE layer = ? AND created <= ?",
+                                        (layer, now - settings['ttl'])).rowcount
+            conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"결과 캐시 정리 실패: {e}")
+        return removed
+
+    def summary(self) -> str:
+        """계층별 적중/조회 횟수 요약"""
+        return ', '.join(
+            f"{layer} {counts['hits']}/{counts['hits'] + counts['misses']}"
+            for layer, counts in self.stats.items()
+        )
+
+    def close(self) -> None:
+        """DB 연결 닫기"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -4,108 +4,311 @@
 import logging
 import time
 import asyncio
+import json
+import re
+from collections import Counter
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page
+import lxml.html
 
-from config import SHOPPING_MALL_SELECTORS, CRAWLING_CONFIG
-from utils import safe_sleep, retry_on_failure, validate_url, detect_shopping_mall
+from config import (
+    SHOPPING_MALL_SELECTORS, MALL_CONCURRENCY_CONFIG, PAGE_WAIT_CONFIG, MALL_FAST_PATH_CONFIG
+)
+from utils import safe_sleep, retry_on_failure, validate_url, detect_shopping_mall, run_async
+from browser_pool import BrowserPool
+from resource_blocker import ResourceBlocker
+from page_waits import wait_for_any_selector
+from http_client import HttpClient, decode_html
+from mall_registry import get_mall_setting, mall_display_name
+from page_pool import PagePool
+
+
+# 상품명 추출 실패 시 반환값 (대체 제목 사용 대상)
+FAILED_TITLE_MARKERS = ["설정된 사이트, 설정안된 태그", "모르는 사이트", "링크 접속불가", "브라우저 설정 실패"]
+
+# 셀렉터 목록을 페이지 안에서 한 번에 시도해 처음 찾은 {index, text} 반환 (XPath/CSS 모두 지원)
+_FIRST_MATCH_SCRIPT = """
+(selectors) => {
+    for (let i = 0; i < selectors.length; i++) {
+        const selector = selectors[i];
+        let element = null;
+        try {
+            if (selector.startsWith('/') || selector.startsWith('(')) {
+                element = document.evaluate(selector, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            } else {
+                element = document.querySelector(selector);
+            }
+        } catch (e) {
+            continue;
+        }
+        if (element) {
+            const text = (element.innerText || element.textContent || '').trim();
+            if (text) {
+                return {index: i, text: text};
+            }
+        }
+    }
+    return null;
+}
+"""
+
+_SITE_NAMES = frozenset(MALL_FAST_PATH_CONFIG['site_names'])
+_TITLE_SEPARATOR = re.compile(r'(\s+[-|:]\s+)')
+_SITE_PREFIX = re.compile(r'^\[([^\]]+)\]\s*')
+
+
+def _find_product_name(data) -> Optional[str]:
+    """JSON-LD 데이터에서 Product.name 탐색 (@graph, 리스트 포함)"""
+    if isinstance(data, list):
+        for item in data:
+            name = _find_product_name(item)
+            if name:
+                return name
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        types = types if isinstance(types, list) else [types]
+        if 'Product' in types and isinstance(data.get('name'), str):
+            return data['name']
+        if '@graph' in data:
+            return _find_product_name(data['@graph'])
+    return None
+
+
+def strip_site_name(title: str) -> str:
+    """제목 앞뒤에 붙은 쇼핑몰 이름 제거 ("상품명 - 11번가", "[G마켓] 상품명" 등)"""
+    title = ' '.join(title.split())
+    
+    prefix = _SITE_PREFIX.match(title)
+    if prefix and prefix.group(1).strip().lower() in _SITE_NAMES:
+        title = title[prefix.end():]
+    
+    parts = _TITLE_SEPARATOR.split(title)
+    while len(parts) > 1 and parts[-1].strip().lower() in _SITE_NAMES:
+        parts = parts[:-2]
+    while len(parts) > 1 and parts[0].strip().lower() in _SITE_NAMES:
+        parts = parts[2:]
+    return ''.join(parts).strip()
+
+
+def extract_title_from_html(content: bytes, encoding: Optional[str] = None) -> Optional[str]:
+    """서버 렌더링 HTML에서 상품명 추출 (JSON-LD Product.name → og:title → <title>)"""
+    try:
+        doc = lxml.html.fromstring(decode_html(content, encoding))
+    except Exception:
+        return None
+    
+    candidates = []
+    for script in doc.xpath('//script[@type="application/ld+json"]/text()'):
+        try:
+            candidates.append(_find_product_name(json.loads(script)))
+        except ValueError:
+            continue
+    candidates += doc.xpath('//meta[@property="og:title"]/@content')
+    candidates += doc.xpath('//title/text()')
+    
+    for candidate in candidates:
+        if not candidate:
+            continue
+        title = strip_site_name(candidate)
+        lowered = title.lower()
+        if not title or lowered in _SITE_NAMES:
+            continue
+        if any(lowered.startswith(marker) for marker in MALL_FAST_PATH_CONFIG['invalid_titles']):
+            return None  # 차단/오류 페이지
+        return title
+    return None
 
 
 class ShoppingMallCrawler:
     """쇼핑몰 크롤러 - Playwright 기반"""
     
-    def __init__(self, driver=None):
+    def __init__(self, driver=None, browser_pool: Optional[BrowserPool] = None,
+                 http_client: Optional[HttpClient] = None):
         # 기존 Selenium driver는 무시하고 Playwright 사용
         self.logger = logging.getLogger(__name__)
-        self.browser = None
+        # 공용 풀을 받지 못하면 자체 풀을 만들고 종료 시 함께 닫는다
+        self.browser_pool = browser_pool or BrowserPool()
+        self._owns_pool = browser_pool is None
         self.context = None
         self.page = None
-        self.playwright = None
+        self.resource_blocker = None
+        # 동시 처리용 페이지 풀과 쇼핑몰별 동시 접속 제한
+        self.max_pages = MALL_CONCURRENCY_CONFIG['max_pages']
+        self._page_pool: Optional[PagePool] = None
+        self._pool_lock: Optional[asyncio.Lock] = None
+        self._mall_limits: Dict[str, asyncio.Semaphore] = {}
+        # 브라우저 없이 HTTP로 상품명을 받는 우선 경로와 쇼핑몰별 성공 집계
+        self.http_client = http_client or HttpClient()
+        self._owns_http_client = http_client is None
+        self.fast_path_stats: Dict[str, Dict[str, int]] = {}
+        # 쇼핑몰별 적중 셀렉터 인덱스 집계 (None은 전부 실패)
+        self.selector_stats: Dict[str, Counter] = {}
     
-    async def setup_browser(self, headless=True):
-        """Playwright 브라우저 설정"""
+    async def setup_browser(self) -> bool:
+        """공용 풀에서 브라우저 컨텍스트 대여"""
         try:
-            self.playwright = await async_playwright().start()
-            
-            self.browser = await self.playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security'
-                ]
-            )
-            
-            self.context = await self.browser.new_context(
-                viewport={'width': 1366, 'height': 768},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            self.context = await self.browser_pool.new_context('default')
             
-            self.page = await self.context.new_page()
+            # 상품명만 읽으므로 쇼핑몰별 프로필에 따라 불필요한 리소스 차단
+            self.resource_blocker = ResourceBlocker()
+            await self.resource_blocker.install(self.context)
             
-            # webdriver 탐지 방지
-            await self.page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.page = await self.context.new_page()
             
             self.logger.info("쇼핑몰 크롤러 Playwright 브라우저 설정 완료")
             return True
             
         except Exception as e:
-            self.logger.error(f"쇼핑몰 크롤러 브라우저 설정 실패: {e}")
+            self.logger.error(f"쇼핑몰 크롤러 Playwright 브라우저 설정 실패: {e}")
             return False
     
     async def close_browser(self):
-        """브라우저 종료"""
+        """브라우저 컨텍스트 반납 (자체 풀인 경우 브라우저까지 종료)"""
         try:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self.resource_blocker:
+                self.resource_blocker.log_totals("쇼핑몰")
+                self.resource_blocker = None
+            self.log_fast_path_stats()
+            self.log_selector_stats()
+            if self._owns_http_client:
+                self.http_client.close()
+            await self.browser_pool.release_context(self.context)
+            self.context = None
+            self.page = None
+            self._page_pool = None
+            if self._owns_pool:
+                await self.browser_pool.close()
             self.logger.info("쇼핑몰 크롤러 브라우저 종료 완료")
         except Exception as e:
             self.logger.error(f"쇼핑몰 크롤러 브라우저 종료 실패: {e}")
     
-    async def extract_product_title_async(self, url: str) -> str:
-        """쇼핑몰에서 상품명 추출 - 비동기"""
+    async def _get_page_pool(self) -> PagePool:
+        """동시 처리용 페이지 풀 준비 (같은 컨텍스트에 최대 max_pages개)"""
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        
+        async with self._pool_lock:
+            if self._page_pool is None:
+                if not self.page and not await self.setup_browser():
+                    raise RuntimeError("브라우저 설정 실패")
+                self._page_pool = PagePool(self.context, self.max_pages)
+        
+        return self._page_pool
+    
+    def _get_mall_limit(self, url: str) -> asyncio.Semaphore:
+        """쇼핑몰별 동시 접속 제한 세마포어 반환"""
+        mall_type = (detect_shopping_mall(url) if validate_url(url) else None) or 'unknown'
+        
+        if mall_type not in self._mall_limits:
+            limit = get_mall_setting(mall_type, 'max_pages', MALL_CONCURRENCY_CONFIG['per_mall_default'])
+            self._mall_limits[mall_type] = asyncio.Semaphore(limit)
+        
+        return self._mall_limits[mall_type]
+    
+    def _use_fast_path(self, mall_type: Optional[str]) -> bool:
+        """HTTP 우선 추출 대상 쇼핑몰 여부"""
+        return (MALL_FAST_PATH_CONFIG['enabled'] and mall_type is not None
+                and not get_mall_setting(mall_type, 'js_only', False))
+    
+    async def extract_title_fast_async(self, url: str) -> Optional[str]:
+        """브라우저 없이 HTTP 응답 HTML에서 상품명 추출 (대상이 아니거나 실패시 None)"""
+        mall_type = detect_shopping_mall(url) if validate_url(url) else None
+        if not self._use_fast_path(mall_type):
+            return None
+        
+        stats = self.fast_path_stats.setdefault(mall_type, {'attempts': 0, 'hits': 0})
+        stats['attempts'] += 1
+        
+        try:
+            response = await self.http_client.fetch(url)
+            if response.status_code != 200:
+                self.logger.debug(f"HTTP 상품명 추출 실패 ({mall_type}): 상태 코드 {response.status_code}")
+                return None
+            title = extract_title_from_html(response.content, response.encoding)
+        except Exception as e:
+            self.logger.debug(f"HTTP 상품명 추출 실패 ({mall_type}): {e}")
+            return None
+        
+        if title:
+            stats['hits'] += 1
+            self.logger.info(f"상품명 추출 성공 (HTTP): {title}")
+        return title
+    
+    def log_fast_path_stats(self) -> None:
+        """쇼핑몰별 HTTP 우선 추출 성공률 로그"""
+        for mall_type, stats in sorted(self.fast_path_stats.items()):
+            self.logger.info(
+                f"HTTP 상품명 추출 ({mall_type}): {stats['hits']}/{stats['attempts']}건 성공")
+    
+    def log_selector_stats(self) -> None:
+        """쇼핑몰별 셀렉터 적중 현황 로그 (한 번도 적중하지 않은 셀렉터 표시)"""
+        for mall_type, counts in sorted(self.selector_stats.items()):
+            hits = ', '.join(f"#{index} {count}건" for index, count in sorted(
+                (index, count) for index, count in counts.items() if index is not None))
+            unused = [f"#{index}" for index in range(len(SHOPPING_MALL_SELECTORS.get(mall_type, [])))
+                      if index not in counts]
+            self.logger.info(
+                f"셀렉터 적중 ({mall_type}): {hits or '없음'}, 실패 {counts.get(None, 0)}건"
+                + (f", 미적중 셀렉터 {' '.join(unused)}" if unused else ""))
+    
+    async def _query_first_title(self, page: Page, mall_type: str) -> Optional[str]:
+        """셀렉터 목록을 한 번의 evaluate로 시도해 처음 찾은 상품명 반환, 적중 인덱스 기록"""
+        selectors = SHOPPING_MALL_SELECTORS.get(mall_type, [])
+        match = await page.evaluate(_FIRST_MATCH_SCRIPT, selectors) if selectors else None
+        
+        counts = self.selector_stats.setdefault(mall_type, Counter())
+        counts[match['index'] if match else None] += 1
+        
+        if not match:
+            return None
+        self.logger.debug(f"셀렉터 적중 ({mall_type}): #{match['index']} {selectors[match['index']]}")
+        return match['text']
+    
+    async def extract_product_title_async(self, url: str, page: Optional[Page] = None,
+                                          use_fast_path: bool = True) -> str:
+        """쇼핑몰에서 상품명 추출 - 비동기 (HTTP 우선, 실패시 브라우저 / page를 주지 않으면 기본 페이지 사용)"""
         if not validate_url(url):
             return "링크 접속불가"
         
+        if use_fast_path:
+            title = await self.extract_title_fast_async(url)
+            if title:
+                return title
+        
         try:
             self.logger.info(f"쇼핑몰 접속: {url}")
             
             # 브라우저가 설정되지 않은 경우 설정
-            if not self.page:
-                if not await self.setup_browser():
-                    return "브라우저 설정 실패"
-            
-            await self.page.goto(url, timeout=30000)
-            await asyncio.sleep(3)  # 페이지 로딩 대기
+            if page is None:
+                if not self.page:
+                    if not await self.setup_browser():
+                        return "브라우저 설정 실패"
+                page = self.page
             
-            # 쇼핑몰 종류 감지
+            # 쇼핑몰 종류 감지 (차단 프로필 선택에도 사용)
             mall_type = detect_shopping_mall(url)
-            if not mall_type:
-                return "모르는 사이트"
+            self.resource_blocker.use_profile(page, get_mall_setting(mall_type, 'block_profile', 'default'))
             
-            # 해당 쇼핑몰의 셀렉터들로 상품명 추출 시도
             selectors = SHOPPING_MALL_SELECTORS.get(mall_type, [])
             
-            for selector in selectors:
-                try:
-                    # XPath를 CSS 셀렉터로 변환하거나 직접 사용
-                    if selector.startswith('//') or selector.startswith('/'):
-                        # XPath인 경우
-                        element = await self.page.query_selector(f'xpath={selector}')
-                    else:
-                        # CSS 셀렉터인 경우
-                        element = await self.page.query_selector(selector)
-                    
-                    if element:
-                        title = await element.inner_text()
-                        if title and title.strip():
-                            self.logger.info(f"상품명 추출 성공: {title}")
-                            return title.strip()
-                except Exception as e:
-                    self.logger.debug(f"셀렉터 시도 실패 ({selector}): {e}")
-                    continue
+            try:
+                await page.goto(url, timeout=30000, wait_until='domcontentloaded')
+                # 상품명 요소 중 하나가 나타나면 바로 진행 (고정 대기 없음)
+                found = await wait_for_any_selector(page, selectors, PAGE_WAIT_CONFIG['mall_title']['timeout'])
+                if selectors and found is None:
+                    self.logger.debug(f"상품명 요소 대기 기한 초과 ({mall_type})")
+            finally:
+                self.resource_blocker.log_page_stats(page, mall_type or url)
+            
+            if not mall_type:
+                return "모르는 사이트"
+            
+            # 해당 쇼핑몰의 셀렉터들을 페이지 안에서 한 번에 시도
+            title = await self._query_first_title(page, mall_type)
+            if title:
+                self.logger.info(f"상품명 추출 성공: {title}")
+                return title
             
             # 모든 셀렉터 실패시
             return "설정된 사이트, 설정안된 태그"
@@ -114,9 +317,41 @@ class ShoppingMallCrawler:
             self.logger.error(f"상품명 추출 실패 ({url}): {e}")
             return "링크 접속불가"
     
+    async def extract_title_or_fallback_async(self, url: str, fallback_title: str,
+                                              page: Optional[Page] = None, use_fast_path: bool = True) -> str:
+        """쇼핑몰 상품명 추출, 실패시 대체 제목 반환 - 비동기"""
+        title = await self.extract_product_title_async(url, page, use_fast_path)
+        
+        if title in FAILED_TITLE_MARKERS:
+            title = fallback_title
+            self.logger.info(f"대체 제목 사용: {title}")
+        
+        return title
+    
+    async def extract_title_concurrent_async(self, url: str, fallback_title: str) -> str:
+        """페이지 풀에서 페이지를 빌려 상품명 추출 - 여러 건을 동시에 호출해도 안전
+
+        전체 동시 페이지 수는 풀 크기로, 쇼핑몰별 동시 페이지 수는
+        SHOPPING_MALLS의 max_pages 세마포어로 제한한다.
+        HTTP로 상품명을 얻으면 페이지 풀(브라우저)은 쓰지 않는다.
+        """
+        async with self._get_mall_limit(url):
+            title = await self.extract_title_fast_async(url)
+            if title:
+                return title
+            
+            try:
+                pool = await self._get_page_pool()
+            except Exception as e:
+                self.logger.error(f"페이지 풀 준비 실패: {e}")
+                return fallback_title
+            
+            async with pool.borrow() as page:
+                return await self.extract_title_or_fallback_async(url, fallback_title, page, use_fast_path=False)
+    
     def extract_product_title(self, url: str) -> str:
         """쇼핑몰에서 상품명 추출 - 동기 인터페이스"""
-        return asyncio.run(self._extract_product_title_with_browser(url))
+        return run_async(self._extract_product_title_with_browser(url))
     
     async def _extract_product_title_with_browser(self, url: str) -> str:
         """브라우저 설정과 함께 상품명 추출"""
@@ -132,7 +367,7 @@ class ShoppingMallCrawler:
     
     def extract_titles_from_urls(self, urls: List[str], fallback_titles: List[str]) -> List[str]:
         """URL 리스트에서 상품명들 추출 - 동기 인터페이스"""
-        return asyncio.run(self._extract_titles_from_urls_async(urls, fallback_titles))
+        return run_async(self._extract_titles_from_urls_async(urls, fallback_titles))
     
     async def _extract_titles_from_urls_async(self, urls: List[str], fallback_titles: List[str]) -> List[str]:
         """URL 리스트에서 상품명들 추출 - 비동기 구현"""
@@ -141,66 +376,29 @@ class ShoppingMallCrawler:
         if not urls:
             return []
         
-        extracted_titles = []
-        
         try:
-            # 브라우저 설정
-            if not await self.setup_browser():
-                return fallback_titles  # 브라우저 설정 실패시 대체 제목 사용
-            
-            for i, (url, fallback_title) in enumerate(zip(urls, fallback_titles)):
-                self.logger.info(f"진행률: {i+1}/{len(urls)}")
-                
-                title = await self.extract_product_title_async(url)
-                
-                # 실패한 경우 대체 제목 사용
-                if title in ["설정된 사이트, 설정안된 태그", "모르는 사이트", "링크 접속불가", "브라우저 설정 실패"]:
-                    title = fallback_title
-                    self.logger.info(f"대체 제목 사용: {title}")
-                
-                extracted_titles.append(title)
-                
-                # 요청 간 지연
-                if i < len(urls) - 1:
-                    await asyncio.sleep(CRAWLING_CONFIG.get('sleep_between_requests', 3))
+            # 입력 순서대로 결과 수집 (동시 처리 수는 페이지 풀 크기와 쇼핑몰별 제한이 결정)
+            extracted_titles = await asyncio.gather(*[
+                self.extract_title_concurrent_async(url, fallback_title)
+                for url, fallback_title in zip(urls, fallback_titles)
+            ])
         
         except Exception as e:
             self.logger.error(f"일괄 추출 실패: {e}")
             # 실패한 경우 대체 제목들 반환
-            extracted_titles.extend(fallback_titles[len(extracted_titles):])
+            extracted_titles = list(fallback_titles)
         
         finally:
             await self.close_browser()
         
         self.logger.info("쇼핑몰 상품명 추출 완료")
-        return extracted_titles
+        return list(extracted_titles)
     
     def get_mall_info(self, url: str) -> Dict[str, str]:
         """쇼핑몰 정보 반환"""
         mall_type = detect_shopping_mall(url)
         return {
             'mall_type': mall_type or 'unknown',
-            'mall_name': self._get_mall_display_name(mall_type),
+            'mall_name': mall_display_name(mall_type),
             'selectors_count': len(SHOPPING_MALL_SELECTORS.get(mall_type, []))
         }
-    
-    def _get_mall_display_name(self, mall_type: Optional[str]) -> str:
-        """쇼핑몰 표시명 반환"""
-        mall_names = {
-            'auction': '옥션',
-            'lotteon': '롯데온',
-            'wemakeprice': '위메프',
-            'gmarket': 'G마켓',
-            'gs': 'GS샵',
-            'tmon': '티몬',
-            '11st': '11번가',
-            'interpark': '인터파크',
-            'coupang': '쿠팡',
-            'naver': '네이버쇼핑',
-            'brand.naver': '네이버브랜드스토어',
-            'kakao': '카카오톡스토어',
-            'yes24': 'YES24',
-            'nsmall': 'NS홈쇼핑',
-            'ssg': 'SSG'
-        }
-        return mall_names.get(mall_type, '알 수 없음') 
\ No newline at end of file
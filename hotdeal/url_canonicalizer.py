@@ -0,0 +1,168 @@
+"""
+쇼핑몰 주소 정규화
+
+게시글 본문·작성자 댓글의 쇼핑몰 주소는 같은 상품이라도 제휴 단축 링크, 추적 파라미터,
+모바일 호스트 등으로 모양이 제각각이다. 호스트를 대표 호스트로 바꾸고 추적 파라미터를 지운
+정규 주소와, 쇼핑몰 종류 + 경로로 된 상품 키를 만든다. 광고 추적 파라미터(utm_* 등)는 모든 호스트에서,
+쇼핑몰 고유 추적 파라미터(쿠팡 q, rank 등)는 mall_registry로 판별한 해당 쇼핑몰 주소에서만 지운다. 단축 링크는 HEAD(안 되면 GET) 요청으로
+리다이렉트를 따라가 실제 상품 주소로 바꾸고, 결과는 결과 캐시의 short_link 계층에 보관한다.
+"""
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from config import URL_CANONICAL_CONFIG
+from http_client import HttpClient
+from mall_registry import detect_mall, resolve_host
+from result_cache import ResultCache, LAYER_SHORT_LINK
+
+_TRACKING_PARAMS = frozenset(name.lower() for name in URL_CANONICAL_CONFIG['tracking_params'])
+_TRACKING_PREFIXES = tuple(prefix.lower() for prefix in URL_CANONICAL_CONFIG['tracking_prefixes'])
+# 쇼핑몰 종류 → (파라미터 이름, 접두사) - 공통 추적 파라미터 포함
+_MALL_TRACKING = {
+    mall_type: (_TRACKING_PARAMS | {name.lower() for name in rules.get('params', [])},
+                _TRACKING_PREFIXES + tuple(prefix.lower() for prefix in rules.get('prefixes', [])))
+    for mall_type, rules in URL_CANONICAL_CONFIG['mall_tracking_params'].items()
+}
+_SHORT_LINK_HOSTS = frozenset(host.lower() for host in URL_CANONICAL_CONFIG['short_link_hosts'])
+_HOST_ALIASES = {host.lower(): alias for host, alias in URL_CANONICAL_CONFIG['host_aliases'].items()}
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _split(url: str):
+    """주소 분해 (스킴이 없는 www.…, 도메인/경로 형태는 https로 간주, 주소가 아니면 None)"""
+    url = (url or '').strip()
+    if not url or ' ' in url:
+        return None
+    try:
+        parts = urlsplit(url if '://' in url else f'https://{url}')
+        if parts.scheme.lower() not in _DEFAULT_PORTS or not parts.hostname or '.' not in parts.hostname:
+            return None
+        parts.port  # 잘못된 포트면 ValueError
+    except ValueError:
+        return None
+    return parts
+
+
+def _is_tracking_param(name: str, mall_type: Optional[str] = None) -> bool:
+    """추적 파라미터 여부 (쇼핑몰 종류를 알면 그 쇼핑몰 고유 파라미터도 포함)"""
+    params, prefixes = _MALL_TRACKING.get(mall_type, (_TRACKING_PARAMS, _TRACKING_PREFIXES))
+    name = name.lower()
+    return name in params or name.startswith(prefixes)
+
+
+def is_short_link(url: str) -> bool:
+    """리다이렉트를 따라가야 하는 단축 링크인지 여부 (하위 도메인 포함)"""
+    parts = _split(url)
+    if parts is None:
+        return False
+    labels = parts.hostname.lower().rstrip('.').split('.')
+    return any('.'.join(labels[i:]) in _SHORT_LINK_HOSTS for i in range(len(labels) - 1))
+
+
+def canonicalize_url(url: str) -> Optional[str]:
+    """정규 주소 (대표 호스트, 공통·쇼핑몰별 추적 파라미터와 조각 제거, 파라미터 정렬, 주소가 아니면 None)"""
+    parts = _split(url)
+    if parts is None:
+        return None
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname.lower().rstrip('.')
+    host = _HOST_ALIASES.get(host, host)
+    mall_type = resolve_host(host)
+    if parts.port and parts.port != _DEFAULT_PORTS[scheme]:
+        host = f'{host}:{parts.port}'
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    params = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                    if not _is_tracking_param(name, mall_type))
+    return urlunsplit((scheme, host, path, urlencode(params), ''))
+
+
+def product_key(url: str) -> Optional[str]:
+    """상품 키 ('쇼핑몰 종류:경로?파라미터', 모르는 쇼핑몰은 호스트 사용, 주소가 아니면 None)"""
+    canonical = canonicalize_url(url)
+    if canonical is None:
+        return None
+    parts = urlsplit(canonical)
+    key = f"{detect_mall(canonical) or parts.netloc}:{parts.path}"
+    return f"{key}?{parts.query}" if parts.query else key
+
+
+class UrlCanonicalizer:
+    """단축 링크를 풀어 정규 주소로 바꾸는 정규화기 (리다이렉트 결과 캐시)"""
+
+    def __init__(self, http_client: Optional[HttpClient] = None, cache: Optional[ResultCache] = None,
+                 timeout: Optional[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.http_client = http_client or HttpClient()
+        self.cache = cache
+        self.timeout = timeout or URL_CANONICAL_CONFIG['resolve_timeout']
+        # 이번 실행에서 푼 단축 링크 (같은 링크를 동시에 요청하면 한 번만 요청)
+        self._resolved: Dict[str, asyncio.Future] = {}
+        self.stats = {'resolved': 0, 'cached': 0, 'failed': 0}
+
+    async def canonicalize(self, url: str) -> str:
+        """단축 링크면 풀어서 정규 주소 반환 (주소가 아니면 그대로)"""
+        canonical = canonicalize_url(url)
+        if canonical is None:
+            return url
+        if not is_short_link(canonical):
+            return canonical
+
+        future = self._resolved.get(canonical)
+        if future is None:
+            future = asyncio.ensure_future(self._resolve_short_link(canonical))
+            self._resolved[canonical] = future
+        return await asyncio.shield(future)
+
+    async def _resolve_short_link(self, short_url: str) -> str:
+        """단축 링크의 최종 주소 (캐시 → HEAD → GET 순, 실패하면 단축 링크 그대로)"""
+        if self.cache is not None:
+            cached = self.cache.get(LAYER_SHORT_LINK, short_url)
+            if cached is not None:
+                self.stats['cached'] += 1
+                return cached
+
+        final_url = await self._follow_redirects(short_url)
+        canonical = canonicalize_url(final_url) if final_url else None
+        # 쇼핑몰을 알 수 없는 곳(로그인·안내 페이지 등)으로 가면 실패로 봄
+        if canonical is None or canonical == short_url or not detect_mall(canonical):
+            self.stats['failed'] += 1
+            self.logger.info(f"단축 링크 해석 실패: {short_url} → {final_url}")
+            return short_url
+
+        self.stats['resolved'] += 1
+        self.logger.debug(f"단축 링크 해석: {short_url} → {canonical}")
+        if self.cache is not None:
+            self.cache.put(LAYER_SHORT_LINK, short_url, canonical)
+        return canonical
+
+    async def _follow_redirects(self, url: str) -> Optional[str]:
+        """리다이렉트를 따라간 최종 주소 (HEAD를 거부하면 본문을 받지 않는 GET으로 재시도)"""
+        try:
+            response = await self.http_client.fetch_head(url, allow_redirects=True, timeout=self.timeout)
+            if response.ok and response.url != url:
+                return response.url
+        except requests.RequestException as e:
+            self.logger.debug(f"단축 링크 HEAD 실패 ({url}): {e}")
+
+        try:
+            response = await self.http_client.fetch(url, allow_redirects=True, timeout=self.timeout, stream=True)
+            response.close()
+            return response.url
+        except requests.RequestException as e:
+            self.logger.warning(f"단축 링크 요청 실패 ({url}): {e}")
+            return None
+
+    def log_stats(self) -> None:
+        """단축 링크 해석 통계 로그"""
+        if any(self.stats.values()):
+            self.logger.info(f"단축 링크: 해석 {self.stats['resolved']}건, 캐시 {self.stats['cached']}건, "
+                             f"실패 {self.stats['failed']}건")
@@ -0,0 +1,127 @@
+"""
+URL 추출기 - 선형 시간 스캐너
+
+댓글을 공백·한글·전각 문장부호로 나눈 조각마다 URL 시작(스킴, www, 도메인/경로)을 찾고
+끝의 문장부호와 짝이 맞지 않는 괄호를 잘라낸다. 중첩 반복이 있는 정규식을 쓰지 않으므로
+괄호와 한글이 많은 긴 댓글도 길이에 비례하는 시간 안에 끝난다.
+"""
+import re
+import string
+from typing import List, Optional
+
+# URL이 될 수 있는 조각 (공백, 꺾쇠, 따옴표, 한글, CJK·전각 문장부호에서 끊음)
+# 부정 문자 클래스 하나의 반복이라 되추적이 없다
+_RUN_PATTERN = re.compile(
+    r'[^\s<>"`'
+    r'\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3'  # 한글 자모, 호환 자모, 음절
+    r'\u2018-\u201f\u2026\u00b7'                # 둥근 따옴표, 말줄임표, 가운뎃점
+    r'\u3000-\u303f\uff00-\uffef]+'              # CJK 문장부호, 전각 문자
+)
+
+_SCHEMES = ('https://', 'http://')
+
+# 위치가 어긋나지 않도록 ASCII 대문자만 소문자로 바꿈
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# 호스트에 쓸 수 있는 문자
+_HOST_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-')
+
+# URL 끝에 붙었으면 문장부호로 보고 잘라낼 문자
+_TRAILING_PUNCTUATION = frozenset('.,;:!?\'*~^')
+
+_CLOSING_BRACKETS = {')': '(', ']': '[', '}': '{'}
+
+
+def _find_scheme(lowered: str) -> int:
+    """조각에서 http(s):// 시작 위치 (없으면 -1)"""
+    positions = [pos for pos in (lowered.find(scheme) for scheme in _SCHEMES) if pos >= 0]
+    return min(positions) if positions else -1
+
+
+def _find_www(lowered: str) -> int:
+    """조각에서 www., www2. 형태 시작 위치 (앞이 호스트 문자가 아닌 경우만, 없으면 -1)"""
+    pos = lowered.find('www')
+    while pos >= 0:
+        if pos == 0 or lowered[pos - 1] not in _HOST_CHARS:
+            end = pos + 3
+            while end < len(lowered) and end - pos < 6 and lowered[end].isdigit():
+                end += 1
+            if lowered.startswith('.', end) and end + 1 < len(lowered):
+                return pos
+        pos = lowered.find('www', pos + 3)
+    return -1
+
+
+def _find_bare_domain(run: str) -> int:
+    """'coupa.ng/abc'처럼 스킴 없이 도메인/경로로 시작하는 위치 (첫 '/' 앞 호스트만 확인, 없으면 -1)"""
+    slash = run.find('/')
+    if slash <= 0 or slash + 1 >= len(run):
+        return -1
+
+    start = slash
+    while start > 0 and run[start - 1] in _HOST_CHARS:
+        start -= 1
+
+    # 호스트는 영숫자로 시작하고 마지막 라벨(TLD)은 영문 2~4자
+    while start < slash and not run[start].isalnum():
+        start += 1
+    name, _, tld = run[start:slash].rpartition('.')
+    if not name or not (2 <= len(tld) <= 4) or not tld.isascii() or not tld.isalpha():
+        return -1
+    return start
+
+
+def _trim_end(url: str) -> str:
+    """끝의 문장부호와 짝이 맞지 않는 닫는 괄호 제거"""
+    counts = {}
+    end = len(url)
+    while end:
+        last = url[end - 1]
+        if last in _TRAILING_PUNCTUATION:
+            end -= 1
+            continue
+        opening = _CLOSING_BRACKETS.get(last)
+        if opening is None:
+            break
+        if last not in counts:
+            counts[last] = url.count(last, 0, end) - url.count(opening, 0, end)
+        if counts[last] <= 0:
+            break
+        # 닫는 괄호가 더 많으면 하나씩 잘라냄
+        counts[last] -= 1
+        end -= 1
+    return url[:end]
+
+
+def _scan_run(run: str) -> Optional[str]:
+    """조각 하나에서 URL 추출 (없으면 None)"""
+    lowered = run.translate(_ASCII_LOWER)
+    starts = [pos for pos in (_find_scheme(lowered), _find_www(lowered), _find_bare_domain(run)) if pos >= 0]
+    if not starts:
+        return None
+
+    start = min(starts)
+    url = _trim_end(run[start:])
+
+    # 스킴만 있고 호스트가 없는 경우 제외
+    for scheme in _SCHEMES:
+        if url.translate(_ASCII_LOWER).startswith(scheme):
+            rest = url[len(scheme):]
+            if not rest or not rest[0].isalnum():
+                return None
+    return url or None
+
+
+def find_urls(text: str) -> List[str]:
+    """텍스트에서 URL 목록 추출 (등장 순서, 중복 포함)"""
+    if not text:
+        return []
+    urls = []
+    for run in _RUN_PATTERN.findall(text):
+        # URL은 모두 '/'나 '.'을 포함하므로 나머지 조각은 바로 건너뜀
+        if '/' not in run and '.' not in run:
+            continue
+        url = _scan_run(run)
+        if url:
+            urls.append(url)
+    return urls
@@ -0,0 +1,121 @@
+"""
+URL 추출기 검증 및 벤치마크
+
+1. 카페 작성자 댓글에서 모은 문장으로 추출 결과 확인
+2. 괄호·한글이 반복되는 악성 입력 길이를 늘려 가며 이전 정규식과 처리 시간 비교
+
+    python url_scanner_benchmark.py
+"""
+import re
+import time
+from typing import Callable, List, Tuple
+
+from url_scanner import find_urls
+
+# 이전에 쓰던 REGEX_PATTERNS['url'] (비교용)
+LEGACY_URL_PATTERN = r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»""'']))"
+
+# (댓글, 기대 결과)
+CORPUS: List[Tuple[str, List[str]]] = [
+    ("구매링크 https://link.coupang.com/a/bXyZ12 입니다",
+     ["https://link.coupang.com/a/bXyZ12"]),
+    ("링크: https://smartstore.naver.com/mamibebe/products/7712345678입니다~",
+     ["https://smartstore.naver.com/mamibebe/products/7712345678"]),
+    ("쿠팡 coupa.ng/bXyZ12 여기서 구매하세요!!",
+     ["coupa.ng/bXyZ12"]),
+    ("네이버 naver.me/5AbCdEfG (앱에서 열어주세요)",
+     ["naver.me/5AbCdEfG"]),
+    ("(https://www.11st.co.kr/products/4123456789)",
+     ["https://www.11st.co.kr/products/4123456789"]),
+    ("11번가→https://www.11st.co.kr/products/4123456789, 지마켓→http://item.gmarket.co.kr/Item?goodscode=2512345678.",
+     ["https://www.11st.co.kr/products/4123456789", "http://item.gmarket.co.kr/Item?goodscode=2512345678"]),
+    ("「https://store.kakao.com/mamibebe/products/123」 톡딜입니다",
+     ["https://store.kakao.com/mamibebe/products/123"]),
+    ("www.lotteon.com/p/product/LO1234567890 에서도 팔아요",
+     ["www.lotteon.com/p/product/LO1234567890"]),
+    ("카드할인 적용가 12,900원 (무료배송) ㅎㅎ",
+     []),
+    ("3.5kg/1개 기준 가격입니다",
+     []),
+    ("https://ko.wikipedia.org/wiki/기저귀_(육아용품) 참고",
+     ["https://ko.wikipedia.org/wiki/"]),
+    ("https://en.wikipedia.org/wiki/Diaper_(disambiguation)) 참고",
+     ["https://en.wikipedia.org/wiki/Diaper_(disambiguation)"]),
+    ("HTTPS://SHOPPING.NAVER.COM/window-products/7712345678",
+     ["HTTPS://SHOPPING.NAVER.COM/window-products/7712345678"]),
+    ("<a href=\"https://item.gmarket.co.kr/Item?goodscode=2512345678\">지마켓</a>",
+     ["https://item.gmarket.co.kr/Item?goodscode=2512345678"]),
+    ("쿠팡링크…https://link.coupang.com/re/AFFSDP?lptag=AF1234&pageKey=5678&itemId=9012·로켓배송",
+     ["https://link.coupang.com/re/AFFSDP?lptag=AF1234&pageKey=5678&itemId=9012"]),
+    ("https:// 만 적고 끝난 댓글",
+     []),
+    ("품절되면 han.gl/AbCdE 로 재입고 알림 받으세요.",
+     ["han.gl/AbCdE"])
+]
+
+# 악성 입력 (반복 단위, 설명, 반복 뒤에 붙일 문자열)
+ADVERSARIAL: List[Tuple[str, str, str]] = [
+    ("(((가", "괄호+한글", ""),
+    ("((a", "닫히지 않은 괄호", ""),
+    ("a.b", "점으로 이어진 단어", ""),
+    ("(x)", "짝이 맞는 괄호", ""),
+    ("https://a.com/(", "URL 뒤 여는 괄호", ""),
+    ("-.", "도메인/경로 앞 점·하이픈", "a.com/x"),
+]
+
+# 이전 정규식 측정을 멈추는 기준 (초)
+LEGACY_LIMIT = 2.0
+
+
+def check_corpus(extract: Callable[[str], List[str]]) -> int:
+    """말뭉치 검증 (실패 건수 반환)"""
+    failures = 0
+    for text, expected in CORPUS:
+        result = extract(text)
+        if result != expected:
+            failures += 1
+            print(f"  ❌ {text}\n     기대: {expected}\n     결과: {result}")
+    return failures
+
+
+def measure(extract: Callable[[str], List[str]], text: str) -> float:
+    """한 번 추출하는 데 걸린 시간 (초)"""
+    start = time.perf_counter()
+    extract(text)
+    return time.perf_counter() - start
+
+
+def legacy_extract(text: str) -> List[str]:
+    """이전 방식 URL 추출"""
+    return [url[0] for url in re.findall(LEGACY_URL_PATTERN, text)]
+
+
+def main():
+    """메인 실행"""
+    print("🚀 URL 추출기 검증")
+    print("=" * 60)
+    failures = check_corpus(find_urls)
+    print(f"말뭉치 {len(CORPUS)}건 중 {len(CORPUS) - failures}건 통과")
+
+    print("\n⏱️  악성 입력 처리 시간 (반복 횟수별, 이전 정규식은 {:.0f}초를 넘을 것 같으면 생략)".format(LEGACY_LIMIT))
+    for unit, description, suffix in ADVERSARIAL:
+        print(f"\n  [{description}] '{unit}' 반복" + (f" + '{suffix}'" if suffix else ""))
+        previous = None  # 이전 정규식의 직전 (반복 횟수, 시간)
+        for repeat in (10, 100, 1000, 10000, 100000):
+            text = unit * repeat + suffix
+            scanner_time = measure(find_urls, text)
+            # 길이 제곱에 비례한다고 보고 기준을 넘을 것 같으면 측정하지 않음
+            projected = previous[1] * (repeat / previous[0]) ** 2 if previous else 0
+            if projected > LEGACY_LIMIT:
+                legacy = f"  (예상 {projected:.0f}초 이상, 생략)"
+            else:
+                legacy_time = measure(legacy_extract, text)
+                previous = (repeat, legacy_time)
+                legacy = f"{legacy_time * 1000:9.2f}ms"
+            print(f"    {repeat:>6}회  스캐너 {scanner_time * 1000:8.2f}ms  이전 정규식 {legacy}")
+
+    print("\n✅ 완료" if not failures else f"\n❌ 말뭉치 실패 {failures}건")
+
+
+if __name__ == "__main__":
+    main()
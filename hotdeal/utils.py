@@ -1,15 +1,20 @@
 """
 유틸리티 함수들
 """
+import asyncio
+import json
 import logging
-import re
+import os
 import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import pandas as pd
 
-from config import LOGGING_CONFIG, REGEX_PATTERNS
+from config import LOGGING_CONFIG
+from mall_registry import detect_mall
+from price_parser import PRICE_NOT_FOUND, parse_price
+from url_scanner import find_urls
 
 
 def setup_logging() -> logging.Logger:
@@ -26,32 +31,14 @@ def setup_logging() -> logging.Logger:
 
 
 def extract_price_from_title(title: str) -> int:
-    """제목에서 가격 추출"""
-    patterns = [
-        REGEX_PATTERNS['price_6'],
-        REGEX_PATTERNS['price_5'],
-        REGEX_PATTERNS['price_4'],
-        REGEX_PATTERNS['price_6_no_won'],
-        REGEX_PATTERNS['price_5_no_won'],
-        REGEX_PATTERNS['price_4_no_won']
-    ]
-    
-    for pattern in patterns:
-        match = re.match(pattern, title)
-        if match:
-            price_str = match.groups()[0].replace("원", "")
-            try:
-                return int(price_str)
-            except ValueError:
-                continue
-    
-    return 999999  # 가격을 찾을 수 없는 경우
+    """제목에서 가격 추출 (찾지 못하면 999999)"""
+    value = parse_price(title).value
+    return value if value is not None else PRICE_NOT_FOUND
 
 
 def extract_urls_from_text(text: str) -> List[str]:
     """텍스트에서 URL 추출"""
-    urls = re.findall(REGEX_PATTERNS['url'], text)
-    return [url[0] for url in urls] if urls else []
+    return find_urls(text)
 
 
 def clean_product_title(title: str) -> str:
@@ -81,6 +68,39 @@ def safe_sleep(seconds: float) -> None:
         raise
 
 
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro):
+    """프로세스 공용 이벤트 루프에서 코루틴 실행
+
+    asyncio.run과 달리 루프를 닫지 않으므로 공용 브라우저 풀처럼
+    루프에 묶인 자원을 여러 번의 동기 호출에 걸쳐 재사용할 수 있다.
+    이미 루프가 실행 중이면(Jupyter 등) nest_asyncio로 그 루프에서 실행하고,
+    nest_asyncio가 없으면 RuntimeError를 낸다.
+    """
+    global _event_loop
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is not None:
+        try:
+            import nest_asyncio
+        except ImportError:
+            coro.close()
+            raise RuntimeError("실행 중인 이벤트 루프 안에서 run_async 호출 - "
+                               "비동기 메서드를 await로 호출하거나 nest_asyncio를 설치하세요") from None
+        nest_asyncio.apply(running)
+        return running.run_until_complete(coro)
+
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop.run_until_complete(coro)
+
+
 def create_dataframe_row(timestamp: str, source: str, article_id: int, 
                         article_url: str, original_title: str, cleaned_title: str,
                         shop_url: str, price: int) -> Dict[str, Any]:
@@ -123,18 +143,54 @@ def load_search_info(file_path: Path) -> Optional[int]:
 
 
 def save_results(file_path: Path, df: pd.DataFrame) -> None:
-    """결과 저장"""
+    """결과 저장 (같은 게시글 id는 새 행으로 교체, 실패하면 로그 후 예외를 다시 발생)"""
     try:
         if file_path.exists():
             existing_df = pd.read_excel(file_path)
             combined_df = pd.concat([existing_df, df], ignore_index=True)
         else:
             combined_df = df
-        
+
+        if '게시글 id' in combined_df.columns:
+            # 재개한 게시글이 이전 실행에서 이미 저장된 경우
+            combined_df = combined_df.drop_duplicates(subset='게시글 id', keep='last')
+
         combined_df.to_excel(file_path, index=False)
         logging.info(f"결과 저장 완료: {len(df)}개 항목")
     except Exception as e:
         logging.error(f"결과 저장 실패: {e}")
+        raise
+
+
+def append_result_rows(file_path: Path, rows: List[Dict]) -> None:
+    """결과 행을 대기 파일(JSONL) 끝에 추가하고 디스크까지 내려 씀 (실패하면 예외 발생)"""
+    with open(file_path, 'a', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def export_pending_results(pending_path: Path, results_path: Path) -> int:
+    """대기 파일의 행을 결과 파일에 한 번에 저장하고 대기 파일 삭제 - 내보낸 행 수 반환
+
+    덜 써진 마지막 줄은 건너뛰고, 저장에 실패하면 대기 파일을 남긴 채 예외를 발생시킨다.
+    """
+    if not pending_path.exists():
+        return 0
+
+    rows = []
+    with open(pending_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue
+
+    if rows:
+        save_results(results_path, pd.DataFrame(rows))
+    pending_path.unlink()
+    return len(rows)
 
 
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
@@ -165,28 +221,5 @@ def validate_url(url: str) -> bool:
 
 
 def detect_shopping_mall(url: str) -> Optional[str]:
-    """URL에서 쇼핑몰 종류 감지"""
-    mall_patterns = {
-        'auction': 'auction',
-        'lotteon': 'lotteon',
-        'wemakeprice': 'wemakeprice',
-        'gmarket': 'gmarket',
-        'gs': 'gs',
-        'tmon': 'tmon',
-        '11st': '11st',
-        'interpark': 'interpark',
-        'coupang': 'coupang',
-        'naver': 'naver',
-        'brand.naver': 'brand.naver',
-        'kakao': 'kakao',
-        'yes24': 'yes24',
-        'nsmall': 'nsmall',
-        'ssg': 'ssg'
-    }
-    
-    url_lower = url.lower()
-    for pattern, mall_name in mall_patterns.items():
-        if pattern in url_lower:
-            return mall_name
-    
-    return None 
\ No newline at end of file
+    """URL에서 쇼핑몰 종류 감지 (호스트 접미사 기준, mall_registry 참고)"""
+    return detect_mall(url)